@@ -0,0 +1,39 @@
+"""
+侠界之旅 data/ 目录维护工具集
+
+所有修复脚本 (fixer) 与检查脚本 (checker) 都以 "pass" 的形式注册到同一个引擎中：
+每个 JSON 文件只解析一次，依次执行所有适用的 pass，最多写回一次。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.run                 # 执行默认的 pass (stable_ids 等需按名称指定)
+    python -m xjzl_tools.run ae_keys         # 只执行指定的 pass
+    python -m xjzl_tools.run stable_ids      # 为数据写入稳定 ID (不在默认集合中)
+    python -m xjzl_tools.run --list          # 列出所有 pass
+    python -m xjzl_tools.run -j 4            # 使用 4 个进程并行处理
+    python -m xjzl_tools.run --no-cache      # 忽略 data/.xjzl_cache 中的清单，全部重新处理
+
+其他工具 (同样在 data/ 目录下以 python -m xjzl_tools.<模块> 运行)：
+    packs       离线构建合集包数据到 build/packs/ (替代游戏内逐条转换)
+    golden      对比 JS seeder 与 packs.py 的输出是否一致 (需要 Node.js)
+    packdiff    生成两个版本之间的最小变更集 build/changeset.json (游戏内 seed.changeset() 导入)
+    scriptindex 嵌入脚本的 SQLite 全文索引 (data/.xjzl_cache/scripts.sqlite)，支持增量更新与搜索
+    lint        列出嵌入脚本的检查规则 (规则本身由 run 中的 "lint" pass 执行)
+    hotpath     passive / calc 热路径脚本的静态开销排行
+    searchindex 为江湖万卷阁生成预构建搜索索引 build/search-index.json (汉字 n-gram、拼音、筛选字段)
+    assets      把 assets/icons 转为多尺寸 WebP (内容 hash 命名 + 清单)，可改写 data/ 中的 img 引用
+    refcheck    引用完整性检查：img 路径、脚本中的 effects.getName 特效名、门派 key (SECT_MAP)
+    changekeys  按数据模型字段 trie 校验 AE changes / masteryChanges 的 key，并给出最接近的有效路径
+    movetable   把武学招式展平为可 mmap 的 NumPy 列式表 build/movetable/，并做分组统计
+    costcheck   按长度分组的向量化消耗数列校验 (长度 / 方向 / 等差 / 离群)，可修复长度
+    watch       常驻监视 data/ (inotify)，保存后只重新检查被修改的文件，毫秒级输出结果
+    serialize   规范 JSON 格式检查 / 改写 (所有工具的写回都经过它：字节相同不写、原子替换)，--minify 输出压缩副本
+    bench       基准测试：以 1x / 10x / 100x 合成数据分阶段 (parse / traverse / regex / pass / serialize) 计时与测内存
+    scriptcheck 用 V8 (Node) 离线检查嵌入脚本能否编译为函数体，输出按内容 hash 去重的脚本包 build/scripts/bundle.json
+    neigongtable 内功阶段属性矩阵的向量化校验 (缺失 / 单调 / 总和 / 系数)
+    artledger   技艺书章节消耗 / 奖励的前缀和账本 build/artbooks/ledger.json，并校验章节描述中的修为与等级数值
+    textscan    描述文本的共享多关键词扫描 (动作 / 修为 / 伤害类型 / 持续时间)，各检查登记关键词，每段文本只扫描一次
+    claimcheck  招式 / 特效描述中的数值与结构化字段的一致性 (升级伤害、消耗差值、属性系数、伤害类型、特效加值)
+    release     生成游戏内读取的 build/ 产物 (合集包、搜索索引、变更集) 并打包安装包 build/xjzl-system.zip
+
+以上检查脚本与 run 均支持 --since <git ref>：只处理相对该版本有变化的文件及其依赖 (见 since.py)
+"""
@@ -0,0 +1,156 @@
+"""
+技艺书章节的消耗 / 奖励账本
+
+为 data/artbooks/ 中的每本书预先计算章节消耗与奖励的前缀和 (与 art-book.mjs 的 system.ledger 相同)：
+    cost[i]     读完第 i 章 (含) 累计需要的修为，每章为 floor(cost * xpCostRatio)
+    level[i]    累计的技艺等级奖励 (reward.level)
+    check[i]    累计的检定加值 (reward.check)
+任意进度下已读完的章节数与奖励都可以由前缀和二分查找得到，全书总消耗即 cost 的最后一项。
+输出为压缩 JSON build/artbooks/ledger.json：{"books": {书名: {"art": 技艺, "cost": [...], "level": [...], "check": [...]}}}
+
+同时校验章节描述中写明的数值与数据是否一致：
+    cost    "通读上篇：消耗500修为" 中的修为与 cost 不同
+    level   "你的[表演]等级+1" (书本对应的技艺) 的合计与 reward.level 不同
+            (只检查写明了 [技艺]等级+N 的章节，条件加成、自选技艺等写法需人工判断)
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.artledger                  # 校验并写出账本 (有问题时退出码为 1)
+    python -m xjzl_tools.artledger --check          # 只校验，不写账本
+    python -m xjzl_tools.artledger --since origin/main
+"""
+import argparse
+import math
+import os
+import re
+import sys
+import time
+
+from . import corpus, engine, packs, serialize, since
+from .jsliteral import read_literal
+
+LEDGER_PATH = os.path.join(engine.ROOT_DIR, "build", "artbooks", "ledger.json")
+LEDGER_VERSION = 1
+
+# "通读全文：消耗1000修为"、"通读下篇：3000修为"、"通读每卷：消耗500修为（共5卷）"
+# 冒号之后紧跟的修为才是章节消耗，"获得N修为"、"增长N修为进度" 等效果文本不会匹配
+COST_RE = re.compile(r"[:：]\s*(?:消耗)?\s*(\d+)\s*点?修为")
+
+
+def art_labels():
+    """{技艺 key: 中文名}，按 XJZL.arts 与语言文件本地化"""
+    arts = read_literal(packs.CONFIG_PATH, "XJZL.arts")
+    lang = engine.read_json(packs.LANG_PATH)
+    return {key: packs.localize(lang, label) for key, label in arts.items()}
+
+
+def level_pattern(label):
+    return re.compile(r"\[" + re.escape(label) + r"\]\s*等级\s*[+＋]\s*(\d+)")
+
+
+def _int(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else 0
+
+
+def chapter_cost(chapter):
+    """与 art-book.mjs 一致：floor((cost || 0) * (xpCostRatio ?? 1))"""
+    ratio = chapter.get("xpCostRatio")
+    return math.floor(_int(chapter.get("cost")) * (1 if ratio is None else _int(ratio)))
+
+
+def book_ledger(book):
+    system = book.get("system") or {}
+    ledger = {"art": system.get("artType"), "cost": [], "level": [], "check": []}
+    total_cost = total_level = total_check = 0
+    for chapter in system.get("chapters") or []:
+        reward = chapter.get("reward") or {}
+        total_cost += chapter_cost(chapter)
+        total_level += _int(reward.get("level"))
+        total_check += _int(reward.get("check"))
+        ledger["cost"].append(total_cost)
+        ledger["level"].append(total_level)
+        ledger["check"].append(total_check)
+    return ledger
+
+
+def check_book(book, labels):
+    """返回 [(种类, 章节名, 原因)]"""
+    system = book.get("system") or {}
+    label = labels.get(system.get("artType"))
+    levels = level_pattern(label) if label else None
+    problems = []
+    for chapter in system.get("chapters") or []:
+        text = corpus.plain_text(chapter.get("description"))
+        stated = [int(v) for v in COST_RE.findall(text)]
+        cost = chapter.get("cost")
+        if stated and stated != [cost]:
+            problems.append(("cost", chapter.get("name"),
+                             f"描述中写 {'、'.join(map(str, stated))} 修为，cost 为 {cost}"))
+        if levels is not None:
+            stated = [int(v) for v in levels.findall(text)]
+            level = _int((chapter.get("reward") or {}).get("level"))
+            if stated and sum(stated) != level:
+                problems.append(("level", chapter.get("name"),
+                                 f"描述中 [{label}]等级+{sum(stated)}，reward.level 为 {level}"))
+    return problems
+
+
+def build(files=None, data_dir=engine.DATA_DIR):
+    """返回 (账本 {书名: ledger}, 问题列表)"""
+    labels = art_labels()
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    books = {}
+    findings = []
+    for rel_path in engine.iter_data_files(data_dir) if files is None else files:
+        if engine.category_of(rel_path) != "artbooks":
+            continue
+        try:
+            data = snapshot.data(rel_path) if snapshot is not None else corpus.read(rel_path, data_dir)
+        except (ValueError, OSError) as e:
+            findings.append({"kind": "error", "file": rel_path, "item": None, "chapter": None, "reason": str(e)})
+            continue
+        if not isinstance(data, list):
+            continue
+        for book in data:
+            if not isinstance(book, dict):
+                continue
+            books[book.get("name")] = book_ledger(book)
+            for kind, chapter, reason in check_book(book, labels):
+                findings.append({"kind": kind, "file": rel_path, "item": book.get("name"),
+                                 "chapter": chapter, "reason": reason})
+    return books, findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预计算技艺书章节消耗与奖励的前缀和，并校验描述中的数值")
+    parser.add_argument("--check", action="store_true", help="只校验，不写账本")
+    parser.add_argument("--out", default=LEDGER_PATH, help=f"账本输出路径，默认 {LEDGER_PATH}")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    changes = since.resolve_since(args.since)
+    start = time.perf_counter()
+    books, findings = build(changes.data_files() if changes else None)
+    elapsed = time.perf_counter() - start
+
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item", "chapter") if issue.get(k))
+        print(f"[{issue['kind']}] {location} | {issue['reason']}")
+    chapters = sum(len(ledger["cost"]) for ledger in books.values())
+    print(f"\n📚 {len(books)} 本技艺书，{chapters} 个章节 (用时 {elapsed * 1000:.0f} ms)，发现 {len(findings)} 个问题")
+
+    # 账本只取决于章节的数值字段，描述不一致不影响账本本身；有文件无法读取时账本不完整，不写出
+    unreadable = sum(1 for issue in findings if issue["kind"] == "error")
+    if unreadable and not args.check:
+        print("⚠️  有文件无法读取，账本不完整，不写出")
+    elif not args.check and changes is None:
+        ledger = {"version": LEDGER_VERSION, "books": dict(sorted(books.items()))}
+        written = serialize.write_json(args.out, ledger, minify=True)
+        print(f"💾 账本 {'已写入' if written else '未变化'}: {args.out}")
+    if findings:
+        print("❌ 有文件无法读取" if len(findings) == unreadable else "❌ 章节描述与数据不一致")
+        sys.exit(1)
+    print("✅ 章节描述与数据一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+图标资源管线
+
+把 assets/icons 下的 PNG / JPG 转为 WebP，并生成两种尺寸：
+    sheet   物品表单与聊天卡片使用 (最长边 256)
+    thumb   合集包浏览器的缩略图 (最长边 64)
+输出文件以源图内容 hash 命名 (assets/optimized/<尺寸>/<hash>.webp)，内容相同的图标只生成一份；
+assets/optimized/manifest.json 记录每个源文件的 hash 与各尺寸的输出，源图未变化时不会重新编码。
+
+--rewrite 会把 data/ 中的 img 引用替换为优化后的文件 (默认使用 sheet 尺寸)。
+改写后的数据引用 assets/optimized/ 中的文件，因此 assets/optimized/ (含清单) 需要与改写后的 data/ 一起提交；
+清单同时也是增量编码的缓存，提交后其他人运行时不会重新编码未变化的图标。
+需要 Pillow (pip install pillow)。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.assets                    # 生成 / 更新 WebP 与清单，输出节省的字节数
+    python -m xjzl_tools.assets --rewrite          # 同时改写 data/ 中的 img 引用
+    python -m xjzl_tools.assets --rewrite --dry-run
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+
+from . import corpus, engine, serialize
+
+SYSTEM_PREFIX = "systems/xjzl-system/"
+SOURCE_DIR = os.path.join(engine.ROOT_DIR, "assets", "icons")
+OUTPUT_DIR = os.path.join(engine.ROOT_DIR, "assets", "optimized")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+
+MANIFEST_VERSION = 1
+
+# 尺寸名称: 最长边像素 (不放大原图)
+VARIANTS = {"sheet": 256, "thumb": 64}
+WEBP_QUALITY = 85
+
+SOURCE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def _settings():
+    return {"variants": VARIANTS, "quality": WEBP_QUALITY}
+
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = None
+    if not manifest or manifest.get("version") != MANIFEST_VERSION or manifest.get("settings") != _settings():
+        # 尺寸或质量设置变化后，所有输出都需要重新生成
+        manifest = {"version": MANIFEST_VERSION, "settings": _settings(), "sources": {}, "images": {}}
+    return manifest
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    serialize.write_json(path, manifest, sort_keys=True)
+
+
+def iter_sources(source_dir=SOURCE_DIR):
+    """按固定顺序列出源图 (相对系统根目录的路径，统一使用 /)"""
+    found = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs.sort()
+        for file in files:
+            if file.lower().endswith(SOURCE_EXTENSIONS):
+                found.append(os.path.relpath(os.path.join(root, file), engine.ROOT_DIR).replace(os.sep, "/"))
+    return sorted(found)
+
+
+def encode_variants(raw, digest):
+    """把一张源图编码为各尺寸的 WebP，返回 {尺寸: 输出信息}"""
+    from PIL import Image
+
+    outputs = {}
+    with Image.open(io.BytesIO(raw)) as image:
+        image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        for variant, max_side in VARIANTS.items():
+            resized = image.copy()
+            resized.thumbnail((max_side, max_side), Image.LANCZOS)
+            rel_path = f"assets/optimized/{variant}/{digest[:16]}.webp"
+            out_path = os.path.join(engine.ROOT_DIR, rel_path)
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            resized.save(out_path, "WEBP", quality=WEBP_QUALITY, method=6)
+            outputs[variant] = {"path": rel_path, "bytes": os.path.getsize(out_path), "size": list(resized.size)}
+    return outputs
+
+
+def build(manifest, source_dir=SOURCE_DIR):
+    """
+    为所有源图生成 WebP；hash 未变且输出文件仍存在的源图直接跳过
+    返回本次重新编码的图片数
+    """
+    sources = {}
+    encoded = 0
+    for rel_path in iter_sources(source_dir):
+        with open(os.path.join(engine.ROOT_DIR, rel_path), 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        sources[rel_path] = {"hash": digest, "bytes": len(raw)}
+
+        image = manifest["images"].get(digest)
+        if image and all(os.path.exists(os.path.join(engine.ROOT_DIR, v["path"])) for v in image.values()):
+            continue
+        try:
+            manifest["images"][digest] = encode_variants(raw, digest)
+            encoded += 1
+        except OSError as e:
+            print(f"❌ 无法转换 {rel_path}: {e}")
+            del sources[rel_path]
+
+    # 清理不再被任何源图使用的输出
+    used = {s["hash"] for s in sources.values()}
+    for digest in list(manifest["images"]):
+        if digest not in used:
+            for output in manifest["images"].pop(digest).values():
+                try:
+                    os.remove(os.path.join(engine.ROOT_DIR, output["path"]))
+                except OSError:
+                    pass
+    manifest["sources"] = sources
+    return encoded
+
+
+def report_savings(manifest):
+    """按尺寸统计输出相对源图节省的字节数 (同一内容只计一次)"""
+    originals = {}
+    for source in manifest["sources"].values():
+        originals[source["hash"]] = source["bytes"]
+    total = sum(originals.values())
+    print(f"🖼️  源图 {len(manifest['sources'])} 个 (内容不同 {len(originals)} 个)，共 {total / 1024:.1f} KB")
+    for variant in VARIANTS:
+        size = sum(manifest["images"][h][variant]["bytes"] for h in originals)
+        saved = total - size
+        ratio = saved / total * 100 if total else 0
+        print(f"    {variant:<6} {size / 1024:>8.1f} KB  节省 {saved / 1024:.1f} KB ({ratio:.1f}%)")
+
+
+def optimized_path(img, manifest, variant):
+    """img 引用 -> 优化后的引用；不在清单中的引用返回 None"""
+    if not isinstance(img, str) or not img.startswith(SYSTEM_PREFIX):
+        return None
+    source = manifest["sources"].get(img[len(SYSTEM_PREFIX):])
+    if source is None:
+        return None
+    return SYSTEM_PREFIX + manifest["images"][source["hash"]][variant]["path"]
+
+
+def _rewrite_refs(node, manifest, variant, counter):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "img":
+                new = optimized_path(value, manifest, variant)
+                if new:
+                    node[key] = new
+                    counter["refs"] += 1
+                    counter["sources"].add(value[len(SYSTEM_PREFIX):])
+            else:
+                _rewrite_refs(value, manifest, variant, counter)
+    elif isinstance(node, list):
+        for value in node:
+            _rewrite_refs(value, manifest, variant, counter)
+
+
+def rewrite_data(manifest, variant="sheet", dry_run=False, data_dir=engine.DATA_DIR):
+    """
+    把 data/ 中指向源图的 img 改为优化后的文件
+    返回 (修改的文件数, 引用数, 节省的字节)；节省的字节按被引用的源图计算，每个源图只计一次
+    """
+    files = refs = 0
+    sources = set()
+    for rel_path in engine.iter_data_files(data_dir):
+        data = corpus.read(rel_path, data_dir)
+        counter = {"refs": 0, "sources": set()}
+        _rewrite_refs(data, manifest, variant, counter)
+        if not counter["refs"]:
+            continue
+        files += 1
+        refs += counter["refs"]
+        sources |= counter["sources"]
+        print(f"🔧 {rel_path}: {counter['refs']} 处 img")
+        if not dry_run:
+            engine.write_json(os.path.join(data_dir, rel_path), data)
+    saved = 0
+    for rel_path in sources:
+        source = manifest["sources"][rel_path]
+        saved += source["bytes"] - manifest["images"][source["hash"]][variant]["bytes"]
+    return files, refs, saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="把图标转为多尺寸 WebP，并可改写 data/ 中的 img 引用")
+    parser.add_argument("--rewrite", action="store_true", help="改写 data/ 中的 img 引用")
+    parser.add_argument("--variant", choices=sorted(VARIANTS), default="sheet", help="改写时使用的尺寸，默认 sheet")
+    parser.add_argument("--dry-run", action="store_true", help="只报告要改写的引用，不写回文件")
+    args = parser.parse_args()
+
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        parser.exit(1, "❌ 需要 Pillow: pip install pillow\n")
+
+    manifest = load_manifest()
+    encoded = build(manifest)
+    save_manifest(manifest)
+    print(f"✅ 重新编码 {encoded} 张图片，清单: {MANIFEST_PATH}")
+    report_savings(manifest)
+
+    if args.rewrite:
+        files, refs, saved = rewrite_data(manifest, args.variant, args.dry_run)
+        action = "将改写" if args.dry_run else "已改写"
+        print(f"💾 {action} {files} 个文件中的 {refs} 处 img，"
+              f"涉及的源图共节省 {saved / 1024 / 1024:.1f} MB")
+        if not args.dry_run and files:
+            print("⚠️  改写后的 data/ 引用 assets/optimized/，请将其与 data/ 一起提交")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""
+数据工具的基准测试
+
+以当前 data/ 为模板生成 1x / 10x / 100x 规模的合成数据：第 k 份副本中每个文件的
+name / label / description / script 等文本都追加副本标记 (不含数字，不影响修为、动作等文本检查)，
+物品、招式、特效的结构与真实数据完全相同，且各副本的文本互不相同，避免纯文本等缓存命中。
+
+副本逐个文件在内存中生成并处理 (100x 约 1 GB JSON，不写入磁盘，也不会同时驻留内存)，分阶段计时：
+    parse       json.loads
+    traverse    遍历全部节点 (与 scripts / refcheck 等工具的遍历相当)
+    regex       描述文本的扫描：去 HTML 标签、动作关键词 (action_cost)、修为数值 (progression)，经 textscan 共享一次扫描
+    passes      每个已注册的 pass 单独计时 (与引擎相同的顺序，fix 类的修改只在内存中)
+    serialize   serialize.encode 规范格式序列化
+每个规模结束后记录进程峰值内存 (ru_maxrss)；--memory 时改用 tracemalloc 记录各阶段的 Python 堆峰值
+(开启后计时会明显变慢，结果中会注明)。
+
+结果保存为 JSON (默认 build/bench/<提交>.json)，--compare 与之前的结果对比，变慢超过阈值时退出码为 1。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.bench                          # 1x 10x 100x
+    python -m xjzl_tools.bench --scales 1 10
+    python -m xjzl_tools.bench --compare ../build/bench/abc1234.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from . import corpus, engine, gitutil, serialize, textscan
+from .passes.action_cost import find_action_in_description
+from .passes.progression import find_cultivation_nums
+
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_OUT_DIR = os.path.join(engine.ROOT_DIR, "build", "bench")
+PHASES = ("parse", "traverse", "regex", "passes", "serialize")
+
+# 追加副本标记的文本字段
+VARIED_KEYS = ("name", "label", "description", "script")
+
+# --compare 时，耗时超过旧结果的这个倍数 (且差值超过 MIN_REGRESSION_SECONDS) 视为变慢
+REGRESSION_RATIO = 1.2
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def variant_tag(k):
+    """第 k 份副本的标记：a, b, ..., z, ba, bb ... (只用字母，不会被当作数值)"""
+    letters = ""
+    while True:
+        k, r = divmod(k, 26)
+        letters = chr(ord("a") + r) + letters
+        if not k:
+            return letters
+
+
+def make_variant(node, tag):
+    """复制数据并给文本字段追加标记 (script 追加注释，保持脚本可解析)"""
+    if isinstance(node, dict):
+        out = {}
+        for key, value in node.items():
+            if key in VARIED_KEYS and isinstance(value, str) and value:
+                out[key] = value + (f"\n// {tag}" if key == "script" else f"·{tag}")
+            else:
+                out[key] = make_variant(value, tag)
+        return out
+    if isinstance(node, list):
+        return [make_variant(value, tag) for value in node]
+    return node
+
+
+def load_templates(data_dir=engine.DATA_DIR):
+    """[(相对路径, 原始字节, 解码后的数据)]"""
+    templates = []
+    for rel_path in engine.iter_data_files(data_dir):
+        with open(os.path.join(data_dir, rel_path), 'rb') as f:
+            raw = f.read()
+        templates.append((rel_path, raw, json.loads(raw.decode("utf-8"))))
+    return templates
+
+
+def synthetic_corpus(templates, scale):
+    """逐个生成 scale 倍规模的文件 (相对路径, 字节)；第 0 份为原始文件"""
+    for k in range(scale):
+        tag = variant_tag(k)
+        for rel_path, raw, data in templates:
+            if k == 0:
+                yield rel_path, raw
+            else:
+                yield rel_path, serialize.encode(make_variant(data, tag))
+
+
+def traverse(node):
+    """遍历全部节点，返回节点数"""
+    count = 0
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        count += 1
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+    return count
+
+
+def scan_texts(data):
+    """描述文本扫描，返回扫描的文本数"""
+    scanned = 0
+    for item in data if isinstance(data, list) else [data]:
+        system = item.get("system") if isinstance(item, dict) else None
+        if not isinstance(system, dict):
+            continue
+        corpus.plain_text(system.get("description"))
+        system_reqs = system.get("requirements") or ""
+        scanned += 1
+        for move in system.get("moves") or []:
+            if not isinstance(move, dict):
+                continue
+            description = move.get("description", "")
+            find_action_in_description(description)
+            for text in (description, move.get("requirements", ""), system_reqs):
+                find_cultivation_nums(text)
+            scanned += 3
+    return scanned
+
+
+class PhaseTimer:
+    """累计各阶段耗时；trace 时同时记录各阶段的 tracemalloc 峰值"""
+
+    def __init__(self, trace=False):
+        self.trace = trace
+        self.seconds = {}
+        self.peak = {}
+
+    def run(self, name, func, *args):
+        if self.trace:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        value = func(*args)
+        self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - start
+        if self.trace:
+            peak = tracemalloc.get_traced_memory()[1] - base
+            self.peak[name] = max(self.peak.get(name, 0), peak)
+        return value
+
+
+def run_passes(data, passes, rel_path, timer):
+    category = engine.category_of(rel_path)
+    for p in passes:
+        if p.applies_to(category):
+            timer.run(f"pass:{p.name}", p.func, data, engine.PassReport(p.name, rel_path))
+
+
+def bench_scale(templates, scale, passes, trace=False):
+    timer = PhaseTimer(trace)
+    totals = {"files": 0, "bytes": 0, "nodes": 0, "texts": 0}
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        for rel_path, raw in synthetic_corpus(templates, scale):
+            totals["files"] += 1
+            totals["bytes"] += len(raw)
+            data = timer.run("parse", json.loads, raw)
+            totals["nodes"] += timer.run("traverse", traverse, data)
+            totals["texts"] += timer.run("regex", scan_texts, data)
+            run_passes(data, passes, rel_path, timer)
+            timer.run("serialize", serialize.encode, data)
+            # 各副本文本不同，纯文本与扫描结果的缓存只会增长；单次运行的工具处理每个文件时缓存同样从空开始
+            corpus._PLAIN_TEXT.clear()
+            textscan.clear_cache()
+    finally:
+        if trace:
+            tracemalloc.stop()
+
+    pass_seconds = {name[len("pass:"):]: s for name, s in timer.seconds.items() if name.startswith("pass:")}
+    phases = {name: timer.seconds.get(name, 0.0) for name in PHASES if name != "passes"}
+    phases["passes"] = sum(pass_seconds.values())
+    result = dict(totals, scale=scale,
+                  wall_seconds=time.perf_counter() - started,
+                  phases={name: round(phases[name], 4) for name in PHASES},
+                  passes={name: round(s, 4) for name, s in pass_seconds.items()})
+    if trace:
+        peaks = {name: timer.peak.get(name, 0) for name in PHASES if name != "passes"}
+        peaks["passes"] = max((v for k, v in timer.peak.items() if k.startswith("pass:")), default=0)
+        result["traced_peak_kb"] = {name: peaks[name] // 1024 for name in PHASES}
+    if resource is not None:
+        # Linux 上 ru_maxrss 以 KB 为单位，macOS 上为字节
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result["peak_rss_kb"] = rss // 1024 if sys.platform == "darwin" else rss
+    return result
+
+
+def environment():
+    try:
+        commit = gitutil.git("rev-parse", "--short", "HEAD").strip()
+        dirty = bool(gitutil.git("status", "--porcelain", "--untracked-files=no").strip())
+    except (gitutil.GitError, OSError):
+        commit, dirty = None, None
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def rows_of(result):
+    """{(规模, 名称): 秒数}，名称为阶段或 pass:<名称>"""
+    rows = {}
+    for entry in result["scales"]:
+        for name, seconds in entry["phases"].items():
+            rows[(entry["scale"], name)] = seconds
+        for name, seconds in entry["passes"].items():
+            rows[(entry["scale"], f"pass:{name}")] = seconds
+    return rows
+
+
+def compare(old, new):
+    """返回变慢的条目 [(规模, 名称, 旧秒数, 新秒数)]"""
+    old_rows = rows_of(old)
+    slower = []
+    for key, seconds in sorted(rows_of(new).items()):
+        before = old_rows.get(key)
+        if before is None:
+            continue
+        if seconds > before * REGRESSION_RATIO and seconds - before > MIN_REGRESSION_SECONDS:
+            slower.append((key[0], key[1], before, seconds))
+    return slower
+
+
+def print_result(entry):
+    mb = entry["bytes"] / 1024 / 1024
+    memory = f"，峰值内存 {entry['peak_rss_kb'] // 1024} MB" if "peak_rss_kb" in entry else ""
+    print(f"\n📏 {entry['scale']}x：{entry['files']} 个文件，{mb:.1f} MB，{entry['nodes']} 个节点，"
+          f"用时 {entry['wall_seconds']:.2f}s{memory}")
+    for name in PHASES:
+        traced = f"  (堆峰值 {entry['traced_peak_kb'][name]} KB)" if "traced_peak_kb" in entry else ""
+        print(f"    {name:<12} {entry['phases'][name]:>9.3f}s{traced}")
+    for name, seconds in sorted(entry["passes"].items(), key=lambda kv: -kv[1]):
+        print(f"      {name:<16} {seconds:>9.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="以合成的放大数据测量各工具阶段与 pass 的耗时和内存")
+    parser.add_argument("--scales", nargs="+", type=int, default=list(DEFAULT_SCALES), metavar="N",
+                        help=f"数据规模倍数，默认 {' '.join(map(str, DEFAULT_SCALES))}")
+    parser.add_argument("--passes", nargs="+", metavar="PASS", help="只测量指定的 pass，默认与 run 相同")
+    parser.add_argument("--memory", action="store_true", help="用 tracemalloc 记录各阶段的堆峰值 (计时会变慢)")
+    parser.add_argument("--out", help=f"结果 JSON 路径，默认 {DEFAULT_OUT_DIR}/<提交>.json")
+    parser.add_argument("--compare", metavar="JSON", help="与之前的结果对比，变慢时退出码为 1")
+    args = parser.parse_args()
+
+    if any(scale < 1 for scale in args.scales):
+        parser.error("--scales 必须是正整数")
+    try:
+        passes = engine.select_passes(args.passes)
+    except KeyError as e:
+        parser.exit(1, f"❌ {e}\n")
+
+    templates = load_templates()
+    result = {"environment": environment(), "traced": args.memory, "scales": []}
+    print(f"⏱️  模板: {len(templates)} 个文件，pass: {', '.join(p.name for p in passes)}")
+    for scale in sorted(set(args.scales)):
+        entry = bench_scale(templates, scale, passes, trace=args.memory)
+        result["scales"].append(entry)
+        print_result(entry)
+
+    out = args.out or os.path.join(DEFAULT_OUT_DIR, f"{result['environment']['commit'] or 'worktree'}.json")
+    serialize.write_json(out, result)
+    print(f"\n💾 结果已写入: {out}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            old = json.load(f)
+        if old.get("traced") != args.memory:
+            print("⚠️  两次结果的 --memory 设置不同，计时不可直接比较")
+        slower = compare(old, result)
+        for scale, name, before, after in slower:
+            print(f"🐢 {scale}x {name}: {before:.3f}s -> {after:.3f}s (+{(after / before - 1) * 100:.0f}%)")
+        if slower:
+            sys.exit(1)
+        print(f"✅ 与 {args.compare} 相比没有明显变慢")
+
+
+if __name__ == "__main__":
+    main()
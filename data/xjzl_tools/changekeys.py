@@ -0,0 +1,286 @@
+"""
+Active Effect change key 校验
+
+由 schema_harness.mjs 在 Node 中加载真实的角色数据模型 (character.mjs / creature.mjs)，
+导出 defineSchema() 与 prepareBaseData() 之后 system 下的全部叶子字段，以及 config.mjs 中
+flags.xjzl-system 的已知 flag (statusFlags / checkFlags)，建立字段路径 trie。
+结果按源码 hash 缓存在 data/.xjzl_cache/actor-schema.json，源码不变时不再启动 Node。
+
+校验 data/ 中所有 changes[].key (完整路径，如 system.combat.speed) 与
+内功 masteryChanges[].key (相对 system 的路径，如 stats.liliang.mod)，
+无效的 key 给出最接近的有效路径。任一角色类型 (character / npc / creature) 上存在即视为有效。
+
+需要本地安装 Node.js (>= 18)。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.changekeys
+    python -m xjzl_tools.changekeys --rebuild      # 忽略缓存重新导出字段
+"""
+import argparse
+import difflib
+import json
+import os
+import subprocess
+import sys
+import time
+
+from . import corpus, engine, manifest, serialize, since
+
+HARNESS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema_harness.mjs")
+CACHE_PATH = os.path.join(manifest.CACHE_DIR, "actor-schema.json")
+
+# 决定导出结果的源码，任一变化都会使缓存失效
+SOURCES = (
+    HARNESS,
+    os.path.join(engine.ROOT_DIR, "module", "config.mjs"),
+    os.path.join(engine.ROOT_DIR, "module", "data", "actor", "character.mjs"),
+    os.path.join(engine.ROOT_DIR, "module", "data", "actor", "creature.mjs"),
+)
+
+SYSTEM_ROOT = "system."
+FLAG_ROOT = "flags.xjzl-system."
+
+# 不属于本系统数据模型、无法校验的根路径 (其他模块的 flags 等)
+UNCHECKED_PREFIXES = ("flags.", "macro.", "token.", "actor.")
+
+# trie 中叶子节点的标记键 (字段路径的各段都是合法标识符，不会与之冲突)
+LEAF = "#"
+
+
+def sources_hash():
+    digest = []
+    for path in SOURCES:
+        with open(path, 'rb') as f:
+            digest.append(engine.hash_bytes(f.read()))
+    return engine.hash_bytes("".join(digest).encode("utf-8"))
+
+
+def export_schema():
+    proc = subprocess.run(["node", HARNESS], capture_output=True, text=True, encoding="utf-8")
+    if proc.returncode != 0:
+        raise RuntimeError(f"schema_harness.mjs 执行失败:\n{proc.stderr}")
+    return json.loads(proc.stdout)
+
+
+def load_schema(rebuild=False, path=CACHE_PATH):
+    """读取缓存的字段导出结果，源码变化或 rebuild 时重新运行 harness"""
+    digest = sources_hash()
+    if not rebuild:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("hash") == digest:
+                return cached["schema"]
+        except (OSError, ValueError):
+            pass
+
+    schema = export_schema()
+    serialize.write_json(path, {"hash": digest, "schema": schema}, minify=True)
+    return schema
+
+
+class PathTrie:
+    """按 . 分段的字段路径 trie，节点为 {段: 子节点}，叶子节点含 LEAF: 值类型"""
+
+    def __init__(self, paths=()):
+        self.root = {}
+        self.paths = []
+        for path, kind in paths:
+            self.add(path, kind)
+
+    def add(self, path, kind):
+        node = self.root
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+        node[LEAF] = kind
+        self.paths.append(path)
+
+    def lookup(self, path):
+        """
+        返回 (状态, 信息)：
+            ("ok", 值类型)
+            ("branch", None)     路径指向对象而不是字段
+            ("missing", 已匹配的段数)
+        """
+        node = self.root
+        parts = path.split(".")
+        for i, part in enumerate(parts):
+            child = node.get(part) if part != LEAF else None
+            if child is None:
+                return "missing", i
+            node = child
+        if LEAF in node:
+            return "ok", node[LEAF]
+        return "branch", None
+
+    def suggest(self, path):
+        """
+        给出最接近的有效路径：沿 trie 逐段匹配，不存在的段在同层的兄弟中找最相近的；
+        逐段匹配失败时退回到在全部路径中查找
+        """
+        node = self.root
+        resolved = []
+        for part in path.split("."):
+            if part in node and part != LEAF:
+                name = part
+            else:
+                siblings = [k for k in node if k != LEAF]
+                close = difflib.get_close_matches(part, siblings, n=1, cutoff=0.5)
+                if not close:
+                    break
+                name = close[0]
+            resolved.append(name)
+            node = node[name]
+        else:
+            while LEAF not in node and len(node) == 1:
+                name = next(iter(node))
+                resolved.append(name)
+                node = node[name]
+            if LEAF in node:
+                return ".".join(resolved)
+
+        close = difflib.get_close_matches(path, self.paths, n=1, cutoff=0.6)
+        return close[0] if close else None
+
+
+class ChangeKeyIndex:
+    """system 字段 trie + xjzl-system flag 集合，同一 key 的校验结果会被缓存"""
+
+    def __init__(self, schema):
+        merged = {}
+        for paths in schema["actors"].values():
+            merged.update(paths)
+        self.system = PathTrie(sorted(merged.items()))
+        self.flags = set(schema["flags"])
+        self._memo = {}
+
+    @property
+    def checked(self):
+        """已校验的不同 key 数"""
+        return len(self._memo)
+
+    def check_system_path(self, path, prefix=""):
+        """校验相对 system 的路径，返回问题描述，有效时返回 None；prefix 加在建议的路径前"""
+        status, info = self.system.lookup(path)
+        if status == "ok":
+            return None
+        suggestion = self.system.suggest(path)
+        hint = f"，是否应为 {prefix}{suggestion}?" if suggestion else ""
+        if status == "branch":
+            return f"指向的是对象而不是字段{hint}"
+        return f"字段不存在 ({'.'.join(path.split('.')[:info + 1])}){hint}"
+
+    def check_change(self, key):
+        """校验 Active Effect changes[].key (完整路径)"""
+        memo_key = ("changes", key)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = self._check_change(key)
+        return self._memo[memo_key]
+
+    def _check_change(self, key):
+        if key.startswith(SYSTEM_ROOT):
+            return self.check_system_path(key[len(SYSTEM_ROOT):], SYSTEM_ROOT)
+        if key.startswith(FLAG_ROOT):
+            flag = key[len(FLAG_ROOT):]
+            if flag in self.flags:
+                return None
+            close = difflib.get_close_matches(flag, self.flags, n=1, cutoff=0.6)
+            return "config.mjs 中没有这个 flag" + (f"，是否应为 {FLAG_ROOT}{close[0]}?" if close else "")
+        if key.startswith(UNCHECKED_PREFIXES):
+            return None
+        if self.check_system_path(key) is None:
+            return f"缺少 system. 前缀 ({SYSTEM_ROOT}{key})"
+        return "不是 system. 或 flags. 下的路径"
+
+    def check_mastery(self, key):
+        """
+        校验内功 masteryChanges[].key：character.mjs 用 setProperty(system, key) 累加，
+        key 相对 system (带 system. 前缀时会被去掉)，flags 等路径写入 system 下不会生效
+        """
+        memo_key = ("masteryChanges", key)
+        if memo_key not in self._memo:
+            if key.startswith(UNCHECKED_PREFIXES):
+                self._memo[memo_key] = "masteryChanges 只能修改 system 下的字段"
+            else:
+                path = key[len(SYSTEM_ROOT):] if key.startswith(SYSTEM_ROOT) else key
+                self._memo[memo_key] = self.check_system_path(path)
+        return self._memo[memo_key]
+
+
+def _walk(node, path, index, report):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            sub = f"{path}.{key}"
+            if key in ("changes", "masteryChanges") and isinstance(value, list):
+                check = index.check_change if key == "changes" else index.check_mastery
+                for i, change in enumerate(value):
+                    if not isinstance(change, dict) or not isinstance(change.get("key"), str):
+                        continue
+                    problem = check(change["key"])
+                    if problem:
+                        report(path=f"{sub}[{i}]", key=change["key"], reason=f"{change['key']}: {problem}")
+            else:
+                _walk(value, sub, index, report)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            _walk(value, f"{path}[{i}]", index, report)
+
+
+def validate(index, files=None, data_dir=engine.DATA_DIR):
+    """校验 data/ 下的文件 (files 为 None 时全部)，返回 (问题列表, 校验的 key 数)"""
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    findings = []
+    for rel_path in engine.iter_data_files(data_dir) if files is None else files:
+        try:
+            if snapshot is not None:
+                data = snapshot.data(rel_path)
+            else:
+                data = engine.read_json(os.path.join(data_dir, rel_path))
+        except (ValueError, OSError) as e:
+            findings.append({"file": rel_path, "item": None, "reason": str(e)})
+            continue
+        items = data if isinstance(data, list) else [data]
+        for i, item in enumerate(items):
+            name = item.get("name") if isinstance(item, dict) else None
+
+            def report(**fields):
+                findings.append(dict(fields, file=rel_path, item=name))
+
+            _walk(item, f"[{i}]", index, report)
+    return findings, index.checked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="校验 Active Effect changes / masteryChanges 的 key 是否为有效的字段路径")
+    parser.add_argument("--rebuild", action="store_true", help="忽略缓存，重新从数据模型导出字段")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+    changes = since.resolve_since(args.since)
+
+    try:
+        schema = load_schema(args.rebuild)
+    except (OSError, RuntimeError) as e:
+        parser.exit(1, f"❌ 无法导出数据模型字段 (需要 Node.js): {e}\n")
+
+    index = ChangeKeyIndex(schema)
+    start = time.perf_counter()
+    findings, distinct = validate(index, changes.data_files() if changes else None)
+    elapsed = time.perf_counter() - start
+
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item") if issue.get(k))
+        print(f"{location} | {issue['reason']}")
+    print(f"\n🔑 字段 {len(index.system.paths)} 个，flag {len(index.flags)} 个；"
+          f"校验不同的 key {distinct} 个，用时 {elapsed:.2f}s")
+    unreadable = sum(1 for issue in findings if "key" not in issue)
+    if unreadable:
+        print(f"❌ {unreadable} 个文件无法读取")
+    if len(findings) > unreadable:
+        print(f"⚠️  发现 {len(findings) - unreadable} 个无效 key")
+    elif not findings:
+        print("✅ 所有 key 均有效")
+    sys.exit(1 if findings else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+描述文本中的数值与结构化字段的一致性检查
+
+对全部数据做一次遍历：招式描述经 textscan 的共享扫描 (每段文本只扫描一次) 找到下列关键词的位置，
+只在这些位置前后读取数值，再与招式 / 特效的结构化字段对照：
+    growth      升级段落中的 "招式伤害+10"、"伤害提高 5 点"          <-> calculation.growth
+    cost        升级段落中的 "内力消耗+1"、"怒气消耗-1"               <-> costs.mp / costs.rage 相邻两重的差值
+    scaling     第一处 "造成 0.3 力量点伤害"                           <-> calculation.scalings 中的 (属性, 系数)
+    damage      紧跟在上面的伤害类型 "……力量点外功伤害"               <-> damageType
+    effect      特效描述中的 "+N / -N / N"                             <-> 特效 changes 中的加值 (mode 2)
+                (描述中有 "伤害增加"、"回合初流失气血" 这类不带数值的说法时，没有写明的加值不作对照)
+只检查写在句首 (逗号、句号等之后) 的说法，"阴损伤害+3"、"出现相同时招式伤害+10" 这类带限定的说法不作对照。
+耗时与数据量成线性关系 (每段文本一次扫描，每个关键词位置常数次读取)。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.claimcheck
+    python -m xjzl_tools.claimcheck --only growth cost
+    python -m xjzl_tools.claimcheck --since origin/main
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+from . import corpus, engine, since, textscan
+
+KINDS = ("growth", "cost", "scaling", "damage", "effect")
+
+UPGRADE_MARKS = ("升级：", "升级:")
+GROWTH_ANCHORS = ("招式伤害", "伤害")
+COST_ANCHORS = {"内力消耗": "mp", "怒气消耗": "rage"}
+
+# 句首：关键词前是这些字符 (或段落开头) 时才视为独立的说法
+CLAUSE_BREAKS = set("，。；、：:,;·（()） \n\t")
+
+SIGNED_RE = re.compile(r"\s*([+＋\-－])\s*(\d+(?:\.\d+)?)")
+RAISE_RE = re.compile(r"\s*(?:提升|提高|增加)\s*(\d+(?:\.\d+)?)\s*点")
+RATIO_BEFORE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*$")
+# 特效描述中的数值，带符号时区分正负
+EFFECT_NUMBER_RE = re.compile(r"([+＋\-－])?\s*(\d+(?:\.\d+)?)")
+# 不带数值的增减说法 ("长棍武器伤害增加"、"回合初流失气血内力")
+UNSTATED_RE = re.compile(r"(?:增加|提高|提升|降低|减少|流失)(?!\s*[+＋\-－]?\s*\d)")
+MINUS = "-－"
+
+# 特效 change 的 ADD 模式 (CONST.ACTIVE_EFFECT_MODES.ADD)
+ADD_MODE = 2
+# "不消耗内力" 等用极大值表示的特效
+SENTINEL_VALUE = 999
+# 暴击阈值为 20 - …… + crit_*，-20 即 "必定暴击"
+CRIT_PREFIX = "system.combat.crit_"
+CRIT_SENTINEL = 20
+
+
+def _stat_keywords():
+    return [f"{label}点" for label in textscan.config_labels("XJZL.attributes").values()]
+
+
+textscan.register_keywords("upgrade", UPGRADE_MARKS)
+textscan.register_keywords("growth", GROWTH_ANCHORS)
+textscan.register_keywords("cost", tuple(COST_ANCHORS))
+textscan.register_keywords("stat", _stat_keywords)
+
+
+class Labels:
+    """config.mjs 与语言文件中的中文名 -> key"""
+
+    def __init__(self):
+        self.stats = {f"{label}点": key for key, label in textscan.config_labels("XJZL.attributes").items()}
+        self.damage_types = {label: key for key, label in textscan.config_labels("XJZL.damageTypes").items()}
+
+
+def _number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _fmt(value):
+    return f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def _starts_clause(text, pos, section_start):
+    return pos <= section_start or text[pos - 1] in CLAUSE_BREAKS
+
+
+def move_claims(description, labels):
+    """
+    提取招式描述中的数值说法：
+    {"growth": 数值, "mp": 数值, "rage": 数值, "scaling": (属性, 系数, 原文), "damage": (伤害类型, 中文名)}
+    每种只取第一处
+    """
+    hits = textscan.scan(description)
+    if not hits:
+        return {}
+    text = corpus.plain_text(description)
+    upgrade = next((hit.end for hit in hits if hit.group == "upgrade"), None)
+    claims = {}
+    stat_end = None
+    for hit in hits:
+        in_upgrade = upgrade is not None and hit.start >= upgrade
+        if hit.group == "growth" and in_upgrade and "growth" not in claims:
+            if not _starts_clause(text, hit.start, upgrade):
+                continue
+            m = SIGNED_RE.match(text, hit.end)
+            if m and m.group(1) not in MINUS:
+                claims["growth"] = float(m.group(2))
+            else:
+                m = RAISE_RE.match(text, hit.end)
+                if m:
+                    claims["growth"] = float(m.group(1))
+        elif hit.group == "cost" and in_upgrade:
+            resource = COST_ANCHORS[hit.keyword]
+            if resource in claims or not _starts_clause(text, hit.start, upgrade):
+                continue
+            m = SIGNED_RE.match(text, hit.end)
+            if m:
+                claims[resource] = float(m.group(2)) * (-1 if m.group(1) in MINUS else 1)
+        elif hit.group == "stat" and not in_upgrade and "scaling" not in claims:
+            m = RATIO_BEFORE_RE.search(text, max(0, hit.start - 16), hit.start)
+            if m:
+                claims["scaling"] = (labels.stats[hit.keyword], float(m.group(1)),
+                                     f"{m.group(1)} {hit.keyword}")
+                stat_end = hit.end
+        elif hit.group == "damage" and stat_end is not None and "damage" not in claims:
+            if not text[stat_end:hit.start].strip():
+                claims["damage"] = (labels.damage_types[hit.keyword], hit.keyword)
+            stat_end = None
+    return claims
+
+
+def check_move(move, labels, kinds, report):
+    claims = move_claims(move.get("description"), labels)
+    if not claims:
+        return
+    calculation = move.get("calculation") if isinstance(move.get("calculation"), dict) else None
+    costs = move.get("costs") if isinstance(move.get("costs"), dict) else {}
+
+    if "growth" in kinds and "growth" in claims and calculation is not None:
+        growth = _number(calculation.get("growth"))
+        if growth is not None and growth != claims["growth"]:
+            report("growth", f"描述写 招式伤害+{_fmt(claims['growth'])}，calculation.growth 为 {_fmt(growth)}")
+
+    if "cost" in kinds:
+        for anchor, resource in COST_ANCHORS.items():
+            series = costs.get(resource)
+            if resource not in claims or not isinstance(series, list) or len(series) < 2:
+                continue
+            values = [_number(v) for v in series]
+            if None in values:
+                continue
+            steps = {b - a for a, b in zip(values, values[1:])}
+            if steps != {claims[resource]}:
+                report("cost", f"描述写 {anchor}{claims[resource]:+g}，costs.{resource} 为 {series}")
+
+    if "scaling" in kinds and "scaling" in claims and calculation is not None \
+            and isinstance(calculation.get("scalings"), list):
+        prop, ratio, quoted = claims["scaling"]
+        scalings = [(s.get("prop"), _number(s.get("ratio"))) for s in calculation["scalings"] if isinstance(s, dict)]
+        if (prop, ratio) not in scalings:
+            have = "、".join(f"{p} {_fmt(r)}" for p, r in scalings) or "空"
+            report("scaling", f"描述写 {quoted}，calculation.scalings 为 {have}")
+
+    if "damage" in kinds and "damage" in claims and move.get("damageType"):
+        damage_type, label = claims["damage"]
+        if move["damageType"] != damage_type:
+            report("damage", f"描述写 {label}，damageType 为 {move['damageType']}")
+
+
+def check_effect(effect, report):
+    """
+    特效 changes 中的每个加值都应在描述中写明
+    消耗类的减免与暴击阈值 ("暴击骰+2" 即 crit_* 为 -2，"对方暴击骰-1" 即自身 +1) 按绝对值比较
+    """
+    description = corpus.plain_text(effect.get("description"))
+    changes = effect.get("changes")
+    if not description or not isinstance(changes, list):
+        return
+    signed, unsigned = set(), set()
+    for sign, digits in EFFECT_NUMBER_RE.findall(description):
+        value = float(digits)
+        if sign:
+            signed.add(-value if sign in MINUS else value)
+        else:
+            unsigned.add(value)
+    if not signed and not unsigned:
+        return
+    unstated = UNSTATED_RE.search(description) is not None
+
+    for change in changes:
+        if not isinstance(change, dict) or change.get("mode", ADD_MODE) != ADD_MODE:
+            continue
+        key = str(change.get("key") or "")
+        value = _number(change.get("value"))
+        # 0 (占位)、优势 / 劣势等级 (xxxLevel) 与 "不消耗" 的极大值不是描述中的数字
+        if not value or key.endswith("Level") or abs(value) >= SENTINEL_VALUE:
+            continue
+        if key.startswith(CRIT_PREFIX) and abs(value) >= CRIT_SENTINEL:
+            continue
+        if ".costs." in key or key.startswith(CRIT_PREFIX):
+            stated = abs(value) in {abs(v) for v in signed} | unsigned
+        else:
+            stated = value in signed or abs(value) in unsigned
+        if not stated and not unstated:
+            report("effect", f"{key} = {change.get('value')} 未在描述 \"{description[:40]}\" 中写明")
+
+
+def _effects_of(item):
+    """物品、system 与各招式上的特效，返回 [(所在招式名或 None, 特效)]"""
+    system = item.get("system") if isinstance(item.get("system"), dict) else {}
+    found = []
+    holders = [(None, item), (None, system)]
+    holders += [(move.get("name"), move) for move in system.get("moves") or [] if isinstance(move, dict)]
+    for move, holder in holders:
+        effects = holder.get("effects")
+        if isinstance(effects, list):
+            found.extend((move, effect) for effect in effects)
+    return [(move, effect) for move, effect in found if isinstance(effect, dict)]
+
+
+def check(kinds=KINDS, files=None, data_dir=engine.DATA_DIR):
+    """返回问题列表 (字典，字段同引擎的检查结果) 与检查的招式 / 特效数量"""
+    labels = Labels()
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    findings = []
+    counts = {"moves": 0, "effects": 0}
+    move_kinds = set(kinds) - {"effect"}
+
+    for rel_path in engine.iter_data_files(data_dir) if files is None else files:
+        try:
+            if snapshot is not None:
+                data = snapshot.data(rel_path)
+            else:
+                data = engine.read_json(os.path.join(data_dir, rel_path))
+        except (ValueError, OSError) as e:
+            findings.append({"kind": "error", "file": rel_path, "reason": str(e)})
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if not isinstance(item, dict):
+                continue
+            system = item.get("system") if isinstance(item.get("system"), dict) else {}
+
+            def report_to(move=None, effect=None):
+                def report(kind, reason):
+                    findings.append({"kind": kind, "file": rel_path, "item": item.get("name"),
+                                     "move": move, "effect": effect, "reason": reason})
+                return report
+
+            if move_kinds:
+                for move in system.get("moves") or []:
+                    if isinstance(move, dict):
+                        counts["moves"] += 1
+                        check_move(move, labels, move_kinds, report_to(move=move.get("name")))
+            if "effect" in kinds:
+                for move, effect in _effects_of(item):
+                    counts["effects"] += 1
+                    check_effect(effect, report_to(move=move, effect=effect.get("name")))
+    return findings, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="检查招式 / 特效描述中的数值与结构化字段是否一致")
+    parser.add_argument("--only", nargs="+", choices=KINDS, metavar="KIND",
+                        help=f"只执行指定的检查 ({', '.join(KINDS)})，默认全部")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    changes = since.resolve_since(args.since)
+    start = time.perf_counter()
+    findings, counts = check(args.only or KINDS, changes.data_files() if changes else None)
+    elapsed = time.perf_counter() - start
+
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item", "move", "effect") if issue.get(k))
+        print(f"[{issue['kind']}] {location} | {issue['reason']}")
+    summary = f"{counts['moves']} 个招式、{counts['effects']} 个特效 ({elapsed:.2f}s)"
+    if findings:
+        print(f"\n⚠️  {summary}，发现 {len(findings)} 处描述与数据不一致")
+    else:
+        print(f"✅ {summary}，描述与数据一致")
+    sys.exit(1 if findings else 0)
+
+
+if __name__ == "__main__":
+    main()
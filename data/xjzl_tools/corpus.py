@@ -0,0 +1,197 @@
+"""
+共享的已解析数据快照
+
+把 data/ 下每个 JSON 文件解码后的结果 (pickle 二进制) 与派生数据 (去掉 HTML 的描述文本)
+保存在 data/.xjzl_cache/corpus.pickle 中，以文件 mtime / 大小 / 内容 hash 作为失效依据。
+各工具通过 Corpus 读取数据：未变化的文件直接从快照反序列化，只有变化的文件才重新解码 JSON。
+
+    from xjzl_tools import corpus
+    data = corpus.read("wuxue/gaibang.json")     # 每次返回新的对象，可以放心修改
+    text = corpus.plain_text(move["description"])
+
+data() / read() 返回的对象与快照互不影响；修改后写回文件时 mtime 变化，下次加载自动重新解码。
+"""
+import os
+import re
+import json
+import pickle
+
+from . import engine, manifest
+
+SNAPSHOT_PATH = os.path.join(manifest.CACHE_DIR, "corpus.pickle")
+
+# 快照格式版本，结构或派生数据的算法变化时递增，旧快照整体作废
+SNAPSHOT_VERSION = 1
+
+# 与原 progression.strip_html 相同的简单去标签规则
+TAG_RE = re.compile('<.*?>')
+
+# 需要预先计算纯文本的字段
+TEXT_FIELDS = ("description",)
+
+# html -> 纯文本，由快照中各文件的派生数据填充
+_PLAIN_TEXT = {}
+
+
+def strip_tags(text):
+    return TAG_RE.sub('', text)
+
+
+def plain_text(text):
+    """去掉 HTML 标签后的文本 (带缓存)，None 等非字符串值按 str() 处理"""
+    if not text:
+        return ""
+    text = str(text)
+    plain = _PLAIN_TEXT.get(text)
+    if plain is None:
+        plain = _PLAIN_TEXT[text] = strip_tags(text)
+    return plain
+
+
+def _collect_texts(node, out):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in TEXT_FIELDS and isinstance(value, str) and value:
+                out[value] = strip_tags(value)
+            else:
+                _collect_texts(value, out)
+    elif isinstance(node, list):
+        for value in node:
+            _collect_texts(value, out)
+    return out
+
+
+class Corpus:
+    """
+    data/ 的解析快照
+    entries: {rel_path: {"mtime_ns", "size", "hash", "blob" (pickle 后的数据), "texts", "error"}}
+    """
+
+    def __init__(self, data_dir=engine.DATA_DIR, path=SNAPSHOT_PATH):
+        self.data_dir = data_dir
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, data_dir=engine.DATA_DIR, path=SNAPSHOT_PATH, refresh=True):
+        """读取快照并 (默认) 立即按当前文件刷新，有变化时写回快照"""
+        corpus = cls(data_dir, path)
+        try:
+            with open(path, 'rb') as f:
+                content = pickle.load(f)
+            if content.get("version") == SNAPSHOT_VERSION and content.get("data_dir") == data_dir:
+                corpus.entries = content["entries"]
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            pass
+        for entry in corpus.entries.values():
+            _PLAIN_TEXT.update(entry["texts"])
+        if refresh:
+            corpus.refresh()
+            corpus.save()
+        return corpus
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"version": SNAPSHOT_VERSION, "data_dir": self.data_dir, "entries": self.entries},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def _refresh_file(self, rel_path):
+        """按需重新解码单个文件，返回是否重新解码"""
+        file_path = os.path.join(self.data_dir, rel_path)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            if self.entries.pop(rel_path, None) is not None:
+                self.dirty = True
+            return False
+
+        entry = self.entries.get(rel_path)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return False
+
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+        except OSError:
+            # stat 之后文件被删除或改名 (编辑器保存时先改名再写入)，按已删除处理，下次事件再读
+            if self.entries.pop(rel_path, None) is not None:
+                self.dirty = True
+            return False
+        digest = engine.hash_bytes(raw)
+        self.dirty = True
+        if entry and entry["hash"] == digest:
+            entry["mtime_ns"], entry["size"] = st.st_mtime_ns, st.st_size
+            return False
+
+        entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest,
+                 "blob": None, "texts": {}, "error": None}
+        try:
+            data = json.loads(raw.decode('utf-8'))
+            entry["blob"] = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            entry["texts"] = _collect_texts(data, {})
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            entry["error"] = f"无法读取或解析 JSON: {e}"
+        self.entries[rel_path] = entry
+        return True
+
+    def refresh(self, files=None):
+        """
+        检查文件变化并重新解码变化的文件，返回重新解码的文件列表
+        files 为 None 时检查 data/ 下全部文件，并移除已删除文件的记录
+        """
+        if files is None:
+            files = engine.iter_data_files(self.data_dir)
+            for rel_path in set(self.entries) - set(files):
+                del self.entries[rel_path]
+                self.dirty = True
+        decoded = [rel_path for rel_path in files if self._refresh_file(rel_path)]
+        for rel_path in decoded:
+            _PLAIN_TEXT.update(self.entries[rel_path]["texts"])
+        return decoded
+
+    def __contains__(self, rel_path):
+        return rel_path in self.entries
+
+    def files(self):
+        return sorted(self.entries)
+
+    def hash(self, rel_path):
+        return self.entries[rel_path]["hash"]
+
+    def data(self, rel_path):
+        """返回文件解码后的数据 (新对象)；文件无法解析时抛出 ValueError"""
+        entry = self.entries[rel_path]
+        if entry["error"]:
+            raise ValueError(entry["error"])
+        return pickle.loads(entry["blob"])
+
+
+_shared = None
+
+
+def shared():
+    """当前进程共享的 Corpus (首次调用时加载并刷新快照)"""
+    global _shared
+    if _shared is None:
+        _shared = Corpus.load()
+    return _shared
+
+
+def read(rel_path, data_dir=engine.DATA_DIR):
+    """
+    读取 data/ 下的数据文件：默认目录走共享快照，其他目录 (如 packdiff 导出的旧版本) 直接解析
+    """
+    if data_dir == engine.DATA_DIR:
+        snapshot = shared()
+        # 只检查这一个文件，进程运行期间被修改过的文件也能读到最新内容
+        snapshot.refresh([rel_path])
+        if rel_path in snapshot:
+            return snapshot.data(rel_path)
+    return engine.read_json(os.path.join(data_dir, rel_path))
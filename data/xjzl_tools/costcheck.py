@@ -0,0 +1,303 @@
+"""
+招式消耗数列的批量校验与修复
+
+把所有武学招式的 costs.mp / rage / hp 按数列长度分组装入 NumPy 矩阵，对每组做一次向量化检查：
+    length      数列长度与品阶不符 (天级 4 重，其他 3 重；空数组表示无此消耗)
+    direction   与该资源的整体趋势相反 (内力通常逐重递增，怒气逐重递减，方向由全部数据的步长之和决定)
+    step        相邻两重的差值不恒定 (不是等差数列)
+    outlier     平均消耗明显偏离同门派、同品阶、同资源的其他招式 (中位数 / MAD)
+长度不符且至少有两重的数列可以修复：过长截断，过短按最后两重的差值等差补全 (与 cost_length pass 一致)。
+--since 时趋势与离群统计仍基于全部招式，只报告 (并修复) 有变化的文件。
+
+需要 numpy。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.costcheck                     # 只报告
+    python -m xjzl_tools.costcheck --fix               # 写回长度修复
+    python -m xjzl_tools.costcheck --only length step
+"""
+import argparse
+import os
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import corpus, engine, since
+from .passes.cost_length import resolve_move_tier, target_cost_length
+
+RESOURCES = ("mp", "rage", "hp")
+CHECKS = ("length", "direction", "step", "outlier")
+
+# 离群判定在 log2(1 + 平均消耗) 上进行 (消耗多为 4 / 8 / 16 这样的倍数档位)：
+# |x - 中位数| > OUTLIER_K * max(1.4826 * MAD, OUTLIER_MIN_SCALE)，且同组至少 OUTLIER_MIN_GROUP 个招式
+OUTLIER_K = 3.5
+OUTLIER_MIN_SCALE = 0.5
+OUTLIER_MIN_GROUP = 5
+
+
+class CostSeries:
+    """
+    全部消耗数列的列式表示
+    每条数列一行：rows 中保存定位信息，tier / sect / resource 为编码数组，
+    by_length[L] = (行号数组, 形状 (n, L) 的 float64 矩阵)
+    errors 为无法读取的文件 [(相对路径, 原因)]
+    """
+
+    def __init__(self, rows, tiers, sects, resources, series, errors=()):
+        self.rows = rows
+        self.errors = list(errors)
+        self.tiers = np.array(tiers, dtype=np.int64)
+        self.sect_names = sorted(set(sects))
+        lookup = {name: code for code, name in enumerate(self.sect_names)}
+        self.sects = np.array([lookup[s] for s in sects], dtype=np.int64)
+        self.resources = np.array([RESOURCES.index(r) for r in resources], dtype=np.int64)
+        self.lengths = np.array([len(s) for s in series], dtype=np.int64)
+        self.by_length = {}
+        for length in np.unique(self.lengths).tolist():
+            index = np.flatnonzero(self.lengths == length)
+            matrix = np.array([series[i] for i in index], dtype=np.float64).reshape(len(index), length)
+            self.by_length[length] = (index, matrix)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def values(self, i):
+        length = int(self.lengths[i])
+        index, matrix = self.by_length[length]
+        return _plain(matrix[np.searchsorted(index, i)].tolist())
+
+
+def _plain(values):
+    """float 列表中的整数值还原为 int，便于输出与写回"""
+    return [int(v) if float(v).is_integer() else v for v in values]
+
+
+def collect(data_dir=engine.DATA_DIR):
+    """从共享快照收集全部武学招式的消耗数列"""
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    rows, tiers, sects, resources, series, errors = [], [], [], [], [], []
+    for rel_path in engine.iter_data_files(data_dir):
+        if engine.category_of(rel_path) != "wuxue":
+            continue
+        try:
+            if snapshot is not None:
+                data = snapshot.data(rel_path)
+            else:
+                data = engine.read_json(os.path.join(data_dir, rel_path))
+        except (ValueError, OSError) as e:
+            errors.append((rel_path, str(e)))
+            continue
+        if not isinstance(data, list):
+            continue
+        for item_index, item in enumerate(data):
+            system = item.get("system") if isinstance(item, dict) else None
+            if not isinstance(system, dict):
+                continue
+            moves = system.get("moves")
+            if not isinstance(moves, list):
+                continue
+            for move_index, move in enumerate(moves):
+                costs = move.get("costs") if isinstance(move, dict) else None
+                if not isinstance(costs, dict):
+                    continue
+                try:
+                    tier = resolve_move_tier(move, system.get("tier", 1))
+                except (TypeError, ValueError):
+                    continue
+                for resource in RESOURCES:
+                    values = costs.get(resource)
+                    if not isinstance(values, list) or not all(
+                            isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+                        continue
+                    rows.append((rel_path, item_index, move_index, item.get("name"), move.get("name"), resource))
+                    tiers.append(tier)
+                    sects.append(system.get("sect") or "")
+                    resources.append(resource)
+                    series.append(values)
+    return CostSeries(rows, tiers, sects, resources, series, errors)
+
+
+def expected_directions(table):
+    """每种资源的整体趋势：全部数列步长之和的符号 (1 递增，-1 递减，0 无明显趋势)"""
+    totals = np.zeros(len(RESOURCES))
+    for length, (index, matrix) in table.by_length.items():
+        if length >= 2:
+            np.add.at(totals, table.resources[index], np.diff(matrix, axis=1).sum(axis=1))
+    return np.sign(totals).astype(np.int64)
+
+
+def check_length(table):
+    """返回 (问题行号, 修复后的数列 {行号: 列表})"""
+    targets = np.where(table.tiers == 3, target_cost_length(3), target_cost_length(1))
+    # 全为 0 的数列与没有消耗等价，长度不影响结果
+    nonzero = np.zeros(len(table), dtype=bool)
+    for length, (index, matrix) in table.by_length.items():
+        nonzero[index] = np.any(matrix != 0, axis=1)
+    bad = np.flatnonzero(nonzero & (table.lengths != targets))
+    repairs = {}
+    for length, (index, matrix) in table.by_length.items():
+        if length < 2:
+            continue
+        # 全为 0 的数列不报告，也不修复 (目标长度取其自身长度)
+        group_targets = np.where(nonzero[index], targets[index], length)
+        for target in np.unique(group_targets[group_targets != length]).tolist():
+            selected = group_targets == target
+            rows, values = index[selected], matrix[selected]
+            if target < length:
+                fixed = values[:, :target]
+            else:
+                step = values[:, -1] - values[:, -2]
+                extra = values[:, -1:] + step[:, None] * np.arange(1, target - length + 1)
+                fixed = np.concatenate([values, extra], axis=1)
+            for row, series in zip(rows.tolist(), fixed.tolist()):
+                repairs[row] = _plain(series)
+    return bad, repairs
+
+
+def check_direction(table, directions):
+    bad = []
+    for length, (index, matrix) in table.by_length.items():
+        if length < 2:
+            continue
+        steps = np.diff(matrix, axis=1)
+        expected = directions[table.resources[index]][:, None]
+        against = np.any(steps * expected < 0, axis=1)
+        mixed = (expected[:, 0] == 0) & np.any(steps > 0, axis=1) & np.any(steps < 0, axis=1)
+        bad.append(index[against | mixed])
+    return np.concatenate(bad) if bad else np.array([], dtype=np.int64)
+
+
+def check_step(table):
+    bad = []
+    for length, (index, matrix) in table.by_length.items():
+        if length < 3:
+            continue
+        steps = np.diff(matrix, axis=1)
+        bad.append(index[np.any(steps != steps[:, :1], axis=1)])
+    return np.concatenate(bad) if bad else np.array([], dtype=np.int64)
+
+
+def check_outlier(table):
+    """返回 (问题行号, 每行平均消耗, 每行所在组的中位数)"""
+    means = np.full(len(table), np.nan)
+    for length, (index, matrix) in table.by_length.items():
+        if length:
+            means[index] = matrix.mean(axis=1)
+
+    # 只与同样有此项消耗的招式比较 (大多数招式不消耗气血 / 怒气)
+    valid = np.flatnonzero(~np.isnan(means) & (means > 0))
+    scores = np.log2(1 + means[valid])
+    keys = np.stack([table.resources[valid], table.sects[valid], table.tiers[valid]], axis=1)
+    groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    # 按 (组, 值) 排序后，每组的中位数与 MAD 都可以由组的起止位置直接取得
+    order = np.lexsort((scores, inverse))
+    sorted_groups = inverse[order]
+    sorted_values = scores[order]
+    starts = np.searchsorted(sorted_groups, np.arange(len(groups)))
+    counts = np.bincount(inverse, minlength=len(groups))
+
+    def group_median(values_sorted):
+        lo = starts + (counts - 1) // 2
+        hi = starts + counts // 2
+        return (values_sorted[lo] + values_sorted[hi]) / 2
+
+    medians = group_median(sorted_values)
+    deviations = np.abs(sorted_values - medians[sorted_groups])
+    dev_order = np.lexsort((deviations, sorted_groups))
+    mads = group_median(deviations[dev_order])
+
+    scale = np.maximum(1.4826 * mads, OUTLIER_MIN_SCALE)[inverse]
+    row_medians = np.full(len(table), np.nan)
+    row_medians[valid] = np.exp2(medians[inverse]) - 1
+    outlier = (counts[inverse] >= OUTLIER_MIN_GROUP) & (np.abs(scores - medians[inverse]) > OUTLIER_K * scale)
+    return valid[outlier], means, row_medians
+
+
+def validate(table, checks=CHECKS):
+    """返回 (问题列表, 修复 {行号: 新数列})"""
+    findings = [{"kind": "error", "file": rel_path, "item": None, "move": None, "reason": reason}
+                for rel_path, reason in table.errors]
+    repairs = {}
+
+    def report(kind, rows, reason):
+        for row in np.unique(rows).tolist():
+            rel_path, _, _, item, move, resource = table.rows[row]
+            findings.append({"kind": kind, "file": rel_path, "item": item, "move": move,
+                             "reason": f"{resource} {table.values(row)}: {reason(row)}"})
+
+    if "length" in checks:
+        bad, repairs = check_length(table)
+        report("length", bad, lambda row: f"品阶 {table.tiers[row]} 应为 "
+                                           f"{target_cost_length(int(table.tiers[row]))} 重" +
+                                           (f"，可修复为 {repairs[row]}" if row in repairs else ""))
+    if "direction" in checks:
+        directions = expected_directions(table)
+        labels = {1: "递增", -1: "递减", 0: "单调"}
+        report("direction", check_direction(table, directions),
+               lambda row: f"{RESOURCES[table.resources[row]]} 消耗通常逐重{labels[int(directions[table.resources[row]])]}")
+    if "step" in checks:
+        report("step", check_step(table), lambda row: "相邻两重的差值不恒定")
+    if "outlier" in checks:
+        bad, means, medians = check_outlier(table)
+        report("outlier", bad, lambda row: f"平均消耗 {means[row]:g} 远离同门派同品阶的中位数 {medians[row]:g}")
+    return findings, repairs
+
+
+def apply_repairs(table, repairs, data_dir=engine.DATA_DIR):
+    """把修复写回数据文件，返回修改的文件列表"""
+    by_file = {}
+    for row, series in repairs.items():
+        rel_path, item_index, move_index, _, _, resource = table.rows[row]
+        original = table.values(row)
+        by_file.setdefault(rel_path, []).append((item_index, move_index, resource, original, series))
+
+    for rel_path, edits in sorted(by_file.items()):
+        data = corpus.read(rel_path, data_dir)
+        for item_index, move_index, resource, original, series in edits:
+            costs = data[item_index]["system"]["moves"][move_index]["costs"]
+            if costs.get(resource) == original:
+                costs[resource] = series
+        engine.write_json(os.path.join(data_dir, rel_path), data)
+    return sorted(by_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="批量校验 (并修复) 招式消耗数列")
+    parser.add_argument("--only", nargs="+", choices=CHECKS, metavar="CHECK",
+                        help=f"只执行指定的检查 ({', '.join(CHECKS)})，默认全部")
+    parser.add_argument("--fix", action="store_true", help="写回长度修复")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    if np is None:
+        parser.exit(1, "❌ 需要 numpy: pip install numpy\n")
+
+    changes = since.resolve_since(args.since)
+    start = time.perf_counter()
+    table = collect()
+    loaded = time.perf_counter()
+    findings, repairs = validate(table, args.only or CHECKS)
+    checked = time.perf_counter()
+    if changes is not None:
+        selected = set(changes.data_files())
+        findings = [issue for issue in findings if issue["file"] in selected]
+        repairs = {row: series for row, series in repairs.items() if table.rows[row][0] in selected}
+
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item", "move") if issue.get(k))
+        print(f"[{issue['kind']}] {location} | {issue['reason']}")
+    print(f"\n📊 {len(table)} 条消耗数列 (读取 {(loaded - start) * 1000:.0f} ms，"
+          f"校验 {(checked - loaded) * 1000:.1f} ms)，发现 {len(findings)} 个问题，可修复 {len(repairs)} 条")
+
+    if args.fix and repairs:
+        for rel_path in apply_repairs(table, repairs):
+            print(f"💾 [保存] 已更新文件: {rel_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+
+from . import serialize
+
+# data/ 目录 (本包位于 data/xjzl_tools/)
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 系统根目录 (system.json 所在目录)
+ROOT_DIR = os.path.dirname(DATA_DIR)
+
+# 适用于所有分类的 pass
+ALL = "*"
+
+# 根目录下的 JSON 文件都归入 origins 合集包 (背景与性格)
+ROOT_CATEGORY = "origins"
+
+# 已注册的 pass，按注册顺序执行
+PASSES = {}
+
+
+class Pass:
+    """
+    一个注册到引擎中的处理步骤
+    kind: "fix" 会修改数据，"check" 只报告问题
+    categories: 适用的数据分类 (data/ 下的子目录名)，ALL 表示全部
+    default: 未指定 pass 时是否执行；为 False 的 pass 只在按名称指定时执行
+    """
+
+    def __init__(self, name, func, kind, categories, description, default=True):
+        self.name = name
+        self.func = func
+        self.kind = kind
+        self.categories = categories
+        self.description = description
+        self.default = default
+
+    def applies_to(self, category):
+        return self.categories == ALL or category in self.categories
+
+
+class PassReport:
+    """
+    单个 pass 在单个文件上的执行结果
+    changes: 修改记录 (字符串)
+    findings: 检查发现的问题 (字典)
+    """
+
+    def __init__(self, name, rel_path):
+        self.name = name
+        self.rel_path = rel_path
+        self.changes = []
+        self.findings = []
+
+    @property
+    def file_name(self):
+        return os.path.basename(self.rel_path)
+
+    @property
+    def modified(self):
+        return bool(self.changes)
+
+    def change(self, message):
+        self.changes.append(message)
+
+    def finding(self, **fields):
+        self.findings.append(fields)
+
+
+class FileResult:
+    """单个文件经过所有 pass 之后的结果"""
+
+    def __init__(self, rel_path):
+        self.rel_path = rel_path
+        self.reports = []
+        self.written = False
+        self.error = None
+        # 读取时文件内容的 sha1，供清单 (manifest) 记录
+        self.hash = None
+        # 结果是否来自清单缓存 (文件未变化，直接回放)
+        self.cached = False
+
+    @property
+    def modified(self):
+        return any(r.modified for r in self.reports)
+
+
+def register_pass(name, kind="fix", categories=ALL, description="", default=True):
+    """
+    装饰器：注册一个 pass
+    被装饰的函数签名为 func(data, report)，data 是解析后的整个 JSON 文档
+    default=False 的 pass 不在默认集合中，只在按名称指定时执行
+    """
+    if categories != ALL:
+        categories = tuple(categories)
+
+    def decorator(func):
+        if name in PASSES:
+            raise ValueError(f"重复注册的 pass: {name}")
+        PASSES[name] = Pass(name, func, kind, categories, description or (func.__doc__ or "").strip(), default)
+        return func
+
+    return decorator
+
+
+def load_passes():
+    """导入所有内置 pass 模块，触发注册"""
+    from . import passes  # noqa: F401
+    return PASSES
+
+
+def select_passes(names=None, include_optional=False):
+    """
+    按名称选择 pass，未指定时返回默认集合 (include_optional 为 True 时返回全部)，保持注册顺序
+    """
+    load_passes()
+    if not names:
+        return [p for p in PASSES.values() if p.default or include_optional]
+    unknown = [n for n in names if n not in PASSES]
+    if unknown:
+        raise KeyError(f"未知的 pass: {', '.join(unknown)}")
+    return [p for p in PASSES.values() if p.name in names]
+
+
+def category_of(rel_path):
+    """根据相对 data/ 的路径判断数据分类"""
+    parts = rel_path.replace("\\", "/").split("/")
+    if len(parts) == 1:
+        return ROOT_CATEGORY
+    return parts[0]
+
+
+def iter_data_files(data_dir=DATA_DIR):
+    """
+    按固定顺序列出 data/ 下所有 JSON 数据文件 (相对路径，统一使用 /)
+    以 . 或 _ 开头的目录 (缓存、构建产物) 会被跳过
+    """
+    found = []
+    for root, dirs, files in os.walk(data_dir):
+        dirs[:] = [d for d in dirs if not d.startswith((".", "_")) and d != "xjzl_tools"]
+        for file in files:
+            if file.endswith(".json") and not file.startswith("."):
+                rel = os.path.relpath(os.path.join(root, file), data_dir)
+                found.append(rel.replace(os.sep, "/"))
+    return sorted(found)
+
+
+def hash_bytes(raw):
+    return hashlib.sha1(raw).hexdigest()
+
+
+def read_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path, data):
+    """
+    按规范格式原子写回 (见 serialize.py)
+    返回: 是否实际写入 (序列化结果与磁盘上的字节相同时不写)
+    """
+    return serialize.write_json(path, data)
+
+
+def process_file(rel_path, passes, dry_run=False, data_dir=DATA_DIR, corpus=None):
+    """
+    处理单个文件：解析一次，依次执行所有适用的 pass，有修改时写回一次
+    corpus: 可选的 Corpus 快照，提供时直接从快照取得解码后的数据
+    """
+    result = FileResult(rel_path)
+    category = category_of(rel_path)
+    applicable = [p for p in passes if p.applies_to(category)]
+    if not applicable:
+        return result
+
+    file_path = os.path.join(data_dir, rel_path)
+    if corpus is not None and rel_path in corpus:
+        result.hash = corpus.hash(rel_path)
+        try:
+            data = corpus.data(rel_path)
+        except ValueError as e:
+            result.error = str(e)
+            return result
+    else:
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            result.hash = hash_bytes(raw)
+            data = json.loads(raw.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            result.error = f"无法读取或解析 JSON: {e}"
+            return result
+
+    for p in applicable:
+        report = PassReport(p.name, rel_path)
+        try:
+            p.func(data, report)
+        except Exception as e:
+            result.error = f"pass [{p.name}] 执行出错: {e}"
+            return result
+        result.reports.append(report)
+
+    if result.modified and not dry_run:
+        try:
+            result.written = write_json(file_path, data)
+        except OSError as e:
+            result.error = f"保存文件失败: {e}"
+
+    return result
+
+
+def _process_file_worker(args):
+    """进程池中的入口：子进程按名称重新选择 pass (函数对象不跨进程传递)"""
+    rel_path, pass_names, dry_run, data_dir = args
+    return process_file(rel_path, select_passes(pass_names), dry_run, data_dir)
+
+
+def run(files=None, pass_names=None, dry_run=False, data_dir=DATA_DIR, jobs=1, manifest=None, corpus=None):
+    """
+    对给定文件 (默认 data/ 下全部) 执行选中的 pass
+    jobs > 1 时使用进程池并行处理，每个文件仍只由一个进程读写
+    manifest: 可选的 Manifest，未变化的文件直接回放上次的结果，不再解析
+    corpus: 可选的 Corpus 快照 (仅串行模式使用)，需要处理的文件从快照取数据，不再解码 JSON
+    返回: 按文件路径排序的 FileResult 列表 (与并行与否无关，保证输出顺序稳定)
+    """
+    passes = select_passes(pass_names)
+    if files is None:
+        files = iter_data_files(data_dir)
+    files = sorted(files)
+
+    results = []
+    pending = []
+    for rel in files:
+        cached = manifest.replay(rel, passes) if manifest is not None else None
+        if cached is not None:
+            results.append(cached)
+        else:
+            pending.append(rel)
+
+    if jobs <= 1 or len(pending) <= 1:
+        results.extend(process_file(rel, passes, dry_run, data_dir, corpus) for rel in pending)
+    else:
+        # 大文件优先提交，避免 tushou.json 之类的文件最后才开始处理拖慢整体
+        def file_size(rel):
+            try:
+                return os.path.getsize(os.path.join(data_dir, rel))
+            except OSError:
+                return 0
+
+        ordered = sorted(pending, key=file_size, reverse=True)
+        names = [p.name for p in passes]
+        tasks = [(rel, names, dry_run, data_dir) for rel in ordered]
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results.extend(executor.map(_process_file_worker, tasks))
+
+    if manifest is not None:
+        for result in results:
+            if not result.cached:
+                manifest.record(result, passes)
+
+    return sorted(results, key=lambda r: r.rel_path)
@@ -0,0 +1,57 @@
+"""
+本地 git 辅助函数 (只调用 git 命令行，不依赖第三方库)
+"""
+import io
+import os
+import subprocess
+import tarfile
+
+from . import engine
+
+
+class GitError(RuntimeError):
+    pass
+
+
+def git(*args, cwd=engine.ROOT_DIR, binary=False):
+    proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True)
+    if proc.returncode != 0:
+        raise GitError(f"git {' '.join(args)} 失败: {proc.stderr.decode('utf-8', 'replace').strip()}")
+    return proc.stdout if binary else proc.stdout.decode("utf-8")
+
+
+def resolve(ref):
+    """将分支、标签或提交解析为完整的提交 hash"""
+    return git("rev-parse", "--verify", f"{ref}^{{commit}}").strip()
+
+
+def export_tree(ref, rel_path, dest):
+    """
+    将某个版本中的目录 (相对仓库根目录) 导出到 dest 下，保持相对路径
+    返回导出后该目录的绝对路径
+    解压过滤器 (filter="data") 需要 Python 3.8.17 / 3.9.17 / 3.10.12 / 3.11.4 及以上；
+    更早的版本没有 tarfile.data_filter，退回普通解压 (归档来自本仓库的 git archive，内容可信)
+    """
+    archive = git("archive", "--format=tar", ref, "--", rel_path, binary=True)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        if hasattr(tarfile, "data_filter"):
+            tar.extractall(dest, filter="data")
+        else:
+            tar.extractall(dest)
+    return os.path.join(dest, rel_path)
+
+
+def changed_paths(ref):
+    """
+    工作区 (含暂存区与未跟踪文件) 相对 ref 有变化的文件
+    返回 {相对仓库根目录的路径: 状态}，状态为 git 的 A / M / D / T 等 (不做改名检测，改名记为 D + A)
+    """
+    changes = {}
+    fields = git("diff", "--name-status", "--no-renames", "-z", resolve(ref), "--").split("\0")
+    for status, path in zip(fields[0::2], fields[1::2]):
+        if path:
+            changes[path] = status[:1]
+    for path in git("ls-files", "--others", "--exclude-standard", "-z").split("\0"):
+        if path:
+            changes[path] = "A"
+    return changes
@@ -0,0 +1,103 @@
+"""
+合集包构建的黄金对比：分别运行 JS 版 seeder (经 seed_harness.mjs) 与 Python 版 packs.py，
+逐字段比较文件夹与文档数据，证明两者的转换结果一致。
+
+需要本地安装 Node.js (>= 18)。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.golden              # 对比全部合集包
+    python -m xjzl_tools.golden wuxue        # 只对比指定合集包
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from . import packs, since
+
+HARNESS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed_harness.mjs")
+
+# 与 seed_harness.mjs 中 foundry.utils.randomID 桩的返回值一致
+RANDOM_ID = "__RANDOM_ID__"
+
+# 每个合集包最多输出的差异条数
+MAX_DIFFS = 20
+
+
+def run_js_seeders(names):
+    proc = subprocess.run(["node", HARNESS, *names], capture_output=True, text=True, encoding="utf-8")
+    if proc.returncode != 0:
+        raise RuntimeError(f"seed_harness.mjs 执行失败:\n{proc.stderr}")
+    return json.loads(proc.stdout)
+
+
+def diff(expected, actual, path="", out=None):
+    """递归比较两个 JSON 结构，返回差异描述列表"""
+    out = [] if out is None else out
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        for key in list(expected) + [k for k in actual if k not in expected]:
+            sub = f"{path}.{key}" if path else key
+            if key not in actual:
+                out.append(f"{sub}: Python 缺少该字段 (JS: {expected[key]!r:.80})")
+            elif key not in expected:
+                out.append(f"{sub}: Python 多出该字段 ({actual[key]!r:.80})")
+            else:
+                diff(expected[key], actual[key], sub, out)
+    elif isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            out.append(f"{path}: 长度不同 (JS {len(expected)} / Python {len(actual)})")
+        for i, (e, a) in enumerate(zip(expected, actual)):
+            diff(e, a, f"{path}[{i}]", out)
+    elif expected != actual or isinstance(expected, bool) != isinstance(actual, bool):
+        out.append(f"{path}: JS {expected!r:.80} / Python {actual!r:.80}")
+    return out
+
+
+def compare(names=None):
+    """返回 {合集包: 差异列表}"""
+    names = names or packs.system_pack_names()
+    js_output = run_js_seeders(names)
+    py_output = {name: json.loads(json.dumps(pack.to_json(), ensure_ascii=False))
+                 for name, pack in packs.build_packs(names, id_factory=lambda: RANDOM_ID).items()}
+
+    results = {}
+    for name in names:
+        expected = js_output[name]
+        actual = py_output[name]
+        problems = [f"JS 报错: {msg}" for msg in expected["errors"]]
+        diff(expected["folders"], actual["folders"], "folders", problems)
+        diff(expected["documents"], actual["documents"], "documents", problems)
+        results[name] = problems
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="对比 JS seeder 与 Python 构建结果")
+    parser.add_argument("packs", nargs="*", help="要对比的合集包名称，默认全部")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    names = args.packs or packs.system_pack_names()
+    changes = since.resolve_since(args.since)
+    if changes is not None:
+        names = [n for n in names if n in changes.touched_categories()]
+        if not names:
+            print("✅ 没有受影响的合集包，无需对比")
+            return
+
+    failed = False
+    for name, problems in compare(names).items():
+        if not problems:
+            print(f"✅ {name}: 与 JS 输出完全一致")
+            continue
+        failed = True
+        print(f"❌ {name}: 发现 {len(problems)} 处差异")
+        for line in problems[:MAX_DIFFS]:
+            print(f"    {line}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
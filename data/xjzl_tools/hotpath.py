@@ -0,0 +1,314 @@
+"""
+热路径脚本开销分析
+
+passive 脚本在每次 prepareDerivedData 时运行，calc 脚本在每次伤害计算时运行，
+都走 XJZLActor._runScriptsSync，慢一点就会拖累所有客户端的帧时间。
+这里对这两类脚本做静态分析：基于 jstokens 切分，统计高开销写法 (循环中的 await、
+遍历 game.actors / canvas.tokens、重复的 effects.getName、toObject() 深拷贝、通知、写数据库等)，
+按循环嵌套放大后估算每次运行的相对开销，并按物品或脚本排序输出。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.hotpath                       # 按物品汇总，开销从高到低
+    python -m xjzl_tools.hotpath --by script --top 30  # 按单段脚本排序，只看前 30
+    python -m xjzl_tools.hotpath --trigger passive     # 只看 passive
+    python -m xjzl_tools.hotpath --format csv --out hotpath.csv
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import Counter, namedtuple
+
+from . import corpus, engine, scripts, since
+from .jstokens import JSTokenizeError, line_of, tokenize
+
+DEFAULT_TRIGGERS = ("passive", "calc")
+
+# 每次运行的相对频率：passive 每次数据准备都运行，calc 只在伤害计算时运行
+TRIGGER_WEIGHT = {"passive": 1.0, "calc": 0.5, "check": 0.5}
+
+# 每段脚本的固定开销：只剩构造沙盒参数与一次调用
+# (编译结果由 module/utils/script-cache.mjs 按脚本内容缓存，同一段脚本只编译一次)
+BASE_COST = 0.2
+
+# 循环体内的开销按此倍数放大 (假设每层循环约 10 次迭代)
+LOOP_FACTOR = 10
+
+# 模式名称: (单次开销, 说明)
+PATTERNS = {
+    "await": (50, "同步时机中使用 await (passive / calc 不能等待，且会在循环中串行阻塞)"),
+    "world_scan": (40, "遍历 game.actors / game.items / canvas.tokens 等全局集合"),
+    "db_write": (100, "数据准备期间写数据库 (update / setFlag / createEmbeddedDocuments / ChatMessage.create)"),
+    "notification": (30, "数据准备期间弹出通知 (每次 prepare 都会触发)"),
+    "uuid_lookup": (20, "fromUuid / fromUuidSync 查找文档"),
+    "deep_copy": (15, "toObject() / deepClone / JSON 深拷贝"),
+    "effect_lookup": (5, "effects.getName / effects.find 线性查找"),
+    "effect_lookup_repeat": (10, "重复查找同一个特效 (应缓存到变量)"),
+}
+
+GLOBAL_COLLECTIONS = {
+    "game": {"actors", "items", "scenes", "users", "messages", "journal"},
+    "canvas": {"tokens"}
+}
+ITERATION_METHODS = {"forEach", "map", "filter", "find", "findIndex", "some", "every", "reduce", "flatMap"}
+LOOKUP_METHODS = {"getName", "find", "filter", "some"}
+WRITE_METHODS = {"update", "setFlag", "unsetFlag", "createEmbeddedDocuments", "updateEmbeddedDocuments",
+                 "deleteEmbeddedDocuments", "toggleStatusEffect"}
+
+Hit = namedtuple("Hit", ["pattern", "line", "depth", "cost", "detail"])
+
+
+def _bracket_pairs(tokens):
+    """返回 {开括号下标: 闭括号下标}"""
+    pairs = {}
+    stack = []
+    for i, tok in enumerate(tokens):
+        if tok.kind != "punct":
+            continue
+        if tok.value in "([{":
+            stack.append(i)
+        elif tok.value in ")]}" and stack:
+            pairs[stack.pop()] = i
+    return pairs
+
+
+def _loop_depths(tokens, pairs):
+    """计算每个记号所在的循环嵌套层数 (for / while / do 循环体与数组迭代回调)"""
+    ranges = []
+    n = len(tokens)
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident":
+            continue
+        nxt = i + 1
+        if tok.value in ("for", "while") and nxt < n and tokens[nxt].value == "(" and nxt in pairs:
+            body = pairs[nxt] + 1
+            if body < n and tokens[body].value == "{" and body in pairs:
+                ranges.append((body, pairs[body]))
+            else:
+                end = body
+                while end < n and tokens[end].value != ";":
+                    end += 1
+                ranges.append((body, end))
+        elif tok.value == "do" and nxt < n and tokens[nxt].value == "{" and nxt in pairs:
+            ranges.append((nxt, pairs[nxt]))
+        elif (tok.value in ITERATION_METHODS and i > 0 and tokens[i - 1].value in (".", "?.")
+              and nxt < n and tokens[nxt].value == "(" and nxt in pairs):
+            ranges.append((nxt, pairs[nxt]))
+
+    delta = [0] * (n + 1)
+    for start, end in ranges:
+        delta[start] += 1
+        delta[min(end, n - 1) + 1] -= 1
+    depths = []
+    depth = 0
+    for i in range(n):
+        depth += delta[i]
+        depths.append(depth)
+    return depths
+
+
+def _value(tokens, i):
+    return tokens[i].value if 0 <= i < len(tokens) else None
+
+
+def analyze_script(content):
+    """
+    分析单段脚本，返回 (开销, [Hit])
+    无法切分的脚本返回 (None, [])
+    """
+    try:
+        tokens = tokenize(content)
+    except JSTokenizeError:
+        return None, []
+    pairs = _bracket_pairs(tokens)
+    depths = _loop_depths(tokens, pairs)
+    hits = []
+    lookups = Counter()
+
+    def hit(pattern, i, detail=""):
+        depth = depths[i]
+        cost = PATTERNS[pattern][0] * LOOP_FACTOR ** depth
+        hits.append(Hit(pattern, line_of(content, tokens[i].start), depth, cost, detail))
+
+    for i, tok in enumerate(tokens):
+        if tok.kind != "ident":
+            continue
+        value = tok.value
+        prev = _value(tokens, i - 1)
+        is_property = prev in (".", "?.")
+
+        if value == "await" and not is_property:
+            hit("await", i)
+        elif value in GLOBAL_COLLECTIONS and not is_property and _value(tokens, i + 1) in (".", "?."):
+            member = _value(tokens, i + 2)
+            # game.actors.get(id) 是 O(1) 查找，不算遍历
+            if member in GLOBAL_COLLECTIONS[value] and _value(tokens, i + 4) != "get":
+                hit("world_scan", i, f"{value}.{member}")
+        elif value in LOOKUP_METHODS and is_property and _value(tokens, i - 2) == "effects":
+            # 只有 getName("名称") 能判断是否在重复查找同一个特效
+            key = None
+            if value == "getName" and _value(tokens, i + 1) == "(" and i + 2 < len(tokens) and tokens[i + 2].kind == "string":
+                key = tokens[i + 2].value
+                lookups[key] += 1
+            if key is not None and lookups[key] > 1:
+                hit("effect_lookup_repeat", i, f"getName({key})")
+            else:
+                hit("effect_lookup", i, f"effects.{value}")
+        elif value == "toObject" and is_property:
+            hit("deep_copy", i, "toObject()")
+        elif value in ("deepClone", "duplicate") and _value(tokens, i + 1) == "(":
+            hit("deep_copy", i, value)
+        elif value == "JSON" and _value(tokens, i + 2) == "parse" and _value(tokens, i + 4) == "JSON":
+            hit("deep_copy", i, "JSON.parse(JSON.stringify())")
+        elif value == "notifications" and is_property and _value(tokens, i - 2) == "ui":
+            hit("notification", i, f"ui.notifications.{_value(tokens, i + 2)}")
+        elif value in WRITE_METHODS and is_property and _value(tokens, i + 1) == "(":
+            hit("db_write", i, value)
+        elif value == "ChatMessage" and _value(tokens, i + 2) == "create":
+            hit("db_write", i, "ChatMessage.create")
+        elif value in ("fromUuid", "fromUuidSync") and not is_property:
+            hit("uuid_lookup", i, value)
+
+    return BASE_COST + sum(h.cost for h in hits), hits
+
+
+def summarize_hits(hits):
+    counts = Counter(h.pattern for h in hits)
+    return ", ".join(f"{name}×{count}" for name, count in counts.most_common())
+
+
+def collect(triggers=DEFAULT_TRIGGERS, files=None, data_dir=engine.DATA_DIR):
+    """
+    分析所有指定时机的脚本
+    返回 (每段脚本一行的记录列表, 无法读取的文件 [(相对路径, 原因)])
+    """
+    rows = []
+    unreadable = []
+    rel_paths = files or engine.iter_data_files(data_dir)
+    for rel_path in rel_paths:
+        try:
+            data = corpus.read(rel_path, data_dir)
+        except (ValueError, OSError) as e:
+            unreadable.append((rel_path, str(e)))
+            continue
+        for ref in scripts.iter_scripts(data):
+            if ref.trigger not in triggers:
+                continue
+            cost, hits = analyze_script(ref.content)
+            if cost is None:
+                rows.append({"file": rel_path, "item": ref.item, "move": ref.move, "effect": ref.effect,
+                             "trigger": ref.trigger, "label": ref.label, "cost": 0, "weighted": 0,
+                             "patterns": "无法解析", "hits": []})
+                continue
+            weight = TRIGGER_WEIGHT.get(ref.trigger, 1.0)
+            rows.append({
+                "file": rel_path, "item": ref.item, "move": ref.move, "effect": ref.effect,
+                "trigger": ref.trigger, "label": ref.label,
+                "cost": round(cost, 2), "weighted": round(cost * weight, 2),
+                "patterns": summarize_hits(hits),
+                "hits": [h._asdict() for h in hits]
+            })
+    return rows, unreadable
+
+
+def group_by_item(rows):
+    """按物品汇总：一个物品的所有热路径脚本开销相加"""
+    items = {}
+    for row in rows:
+        key = (row["file"], row["item"])
+        entry = items.setdefault(key, {
+            "file": row["file"], "item": row["item"], "scripts": 0,
+            "cost": 0, "weighted": 0, "counts": Counter(), "triggers": set()
+        })
+        entry["scripts"] += 1
+        entry["cost"] += row["cost"]
+        entry["weighted"] += row["weighted"]
+        entry["triggers"].add(row["trigger"])
+        entry["counts"].update(h["pattern"] for h in row["hits"])
+    result = []
+    for entry in items.values():
+        entry["patterns"] = ", ".join(f"{k}×{v}" for k, v in entry.pop("counts").most_common())
+        entry["triggers"] = "/".join(sorted(entry["triggers"]))
+        # BASE_COST 不是整数，累加后去掉浮点误差
+        entry["cost"] = round(entry["cost"], 2)
+        entry["weighted"] = round(entry["weighted"], 2)
+        result.append(entry)
+    return result
+
+
+SORT_KEYS = {
+    "weighted": lambda r: (-r["weighted"], r["file"], r["item"] or ""),
+    "cost": lambda r: (-r["cost"], r["file"], r["item"] or ""),
+    "file": lambda r: (r["file"], r["item"] or ""),
+    "item": lambda r: (r["item"] or "", r["file"]),
+}
+
+
+def print_table(rows, by, out=sys.stdout):
+    print(f"{'排名':<5}{'加权':>8}{'开销':>8}  {'时机':<14}位置 | 命中模式", file=out)
+    print("-" * 100, file=out)
+    for rank, row in enumerate(rows, 1):
+        if by == "item":
+            where = f"{row['file']} | {row['item']} ({row['scripts']} 段)"
+        else:
+            where = " | ".join(str(x) for x in (row["file"], row["item"], row["move"], row["effect"]) if x)
+        print(f"{rank:<5}{row['weighted']:>8g}{row['cost']:>8g}  {row['trigger' if by == 'script' else 'triggers']:<14}"
+              f"{where} | {row['patterns'] or '-'}", file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="passive / calc 热路径脚本静态开销分析")
+    parser.add_argument("--trigger", nargs="+", default=list(DEFAULT_TRIGGERS), help="要分析的时机，默认 passive calc")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--files", nargs="+", metavar="PATH", help="只分析指定文件 (相对 data/ 的路径)")
+    since.add_since_argument(scope)
+    parser.add_argument("--by", choices=["item", "script"], default="item", help="按物品汇总或按单段脚本列出")
+    parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="weighted", help="排序方式，默认按加权开销")
+    parser.add_argument("--top", type=int, help="只输出前 N 条")
+    parser.add_argument("--min-cost", type=float, default=BASE_COST + 1,
+                        help=f"只输出开销不低于此值的条目 (默认 {BASE_COST + 1:g}，即至少命中一个模式)")
+    parser.add_argument("--format", choices=["table", "csv", "json"], default="table", help="输出格式")
+    parser.add_argument("--out", help="输出到文件 (默认标准输出)")
+    args = parser.parse_args()
+
+    changes = since.resolve_since(args.since, quiet=args.format != "table" and not args.out)
+    rows, unreadable = collect(tuple(args.trigger), changes.data_files() if changes else args.files)
+    total_scripts = len(rows)
+    total_cost = round(sum(r["weighted"] for r in rows), 2)
+    unparsed = [r for r in rows if r["patterns"] == "无法解析"]
+    if args.by == "item":
+        rows = group_by_item(rows)
+    rows = [r for r in rows if r["cost"] >= args.min_cost]
+    rows.sort(key=SORT_KEYS[args.sort])
+    if args.top:
+        rows = rows[:args.top]
+
+    out = open(args.out, 'w', encoding='utf-8', newline='') if args.out else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(rows, out, ensure_ascii=False, indent=2)
+        elif args.format == "csv":
+            fields = [k for k in rows[0] if k != "hits"] if rows else []
+            writer = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            print_table(rows, args.by, out)
+    finally:
+        if args.out:
+            out.close()
+
+    if args.format == "table" or args.out:
+        print(f"\n📊 共分析 {total_scripts} 段 {'/'.join(args.trigger)} 脚本，总加权开销 {total_cost:g}，"
+              f"列出 {len(rows)} 条 (模式说明见 xjzl_tools/hotpath.py 中的 PATTERNS)")
+    # 写到标准错误，不混入标准输出上的 json / csv
+    for row in unparsed:
+        print(f"❌ 无法解析: {row['file']} | {row['item']} | {row['trigger']} | {row['label']}", file=sys.stderr)
+    for rel_path, reason in unreadable:
+        print(f"❌ 无法读取: {rel_path} | {reason}", file=sys.stderr)
+    if unreadable:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
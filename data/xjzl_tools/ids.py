@@ -0,0 +1,39 @@
+"""
+文档 ID 工具
+
+Foundry 的文档 ID 为 16 位字母数字 (foundry.utils.randomID)。
+这里提供由路径与名称推导的稳定 ID，同一条数据每次生成的 ID 都相同，
+重新导入合集包时可以按 ID 对比，只更新真正发生变化的文档。
+"""
+import re
+import hashlib
+import secrets
+import string
+
+ID_CHARS = string.ascii_letters + string.digits
+ID_LENGTH = 16
+
+ID_RE = re.compile(r"^[A-Za-z0-9]{16}$")
+
+
+def random_id():
+    """与 foundry.utils.randomID() 相同的字符集与长度"""
+    return "".join(secrets.choice(ID_CHARS) for _ in range(ID_LENGTH))
+
+
+def is_valid_id(value):
+    return isinstance(value, str) and bool(ID_RE.match(value))
+
+
+def stable_id(*parts):
+    """
+    由若干组成部分推导 16 位稳定 ID
+    各部分以 \\x1f 分隔后取 sha256，再按 62 进制编码
+    """
+    digest = hashlib.sha256("\x1f".join(str(p) for p in parts).encode("utf-8")).digest()
+    number = int.from_bytes(digest, "big")
+    chars = []
+    for _ in range(ID_LENGTH):
+        number, rem = divmod(number, len(ID_CHARS))
+        chars.append(ID_CHARS[rem])
+    return "".join(chars)
@@ -0,0 +1,199 @@
+"""
+从 .mjs 源码中读取 JS 对象/数组字面量 (如 seed-wuxue.mjs 的 SECT_MAP)
+
+只支持数据字面量：字符串、数字、true/false/null/undefined、对象、数组，
+以及注释和末尾逗号。这样 Python 工具可以直接以 JS 源码为准，不必手动同步配置。
+"""
+import re
+
+# 字面量中出现的标点
+PUNCTUATION = set("{}[],:")
+
+
+class JSLiteralError(ValueError):
+    pass
+
+
+def _skip_space_and_comments(text, i):
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch.isspace():
+            i += 1
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end + 1
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            if end == -1:
+                raise JSLiteralError("未闭合的块注释")
+            i = end + 2
+        else:
+            break
+    return i
+
+
+def _read_string(text, i):
+    """读取单引号或双引号字符串，返回 (值, 结束位置)"""
+    quote = text[i]
+    i += 1
+    out = []
+    escapes = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+    while i < len(text):
+        ch = text[i]
+        if ch == "\\":
+            nxt = text[i + 1]
+            if nxt == "u":
+                out.append(chr(int(text[i + 2:i + 6], 16)))
+                i += 6
+                continue
+            out.append(escapes.get(nxt, nxt))
+            i += 2
+            continue
+        if ch == quote:
+            return "".join(out), i + 1
+        out.append(ch)
+        i += 1
+    raise JSLiteralError("未闭合的字符串")
+
+
+NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+IDENT_RE = re.compile(r"[A-Za-z_$][\w$]*")
+
+
+def tokenize(text):
+    """把字面量源码切分为 (类型, 值) 记号"""
+    tokens = []
+    i = _skip_space_and_comments(text, 0)
+    while i < len(text):
+        ch = text[i]
+        if ch in PUNCTUATION:
+            tokens.append(("punct", ch))
+            i += 1
+        elif ch in "'\"":
+            value, i = _read_string(text, i)
+            tokens.append(("string", value))
+        elif NUMBER_RE.match(text, i):
+            m = NUMBER_RE.match(text, i)
+            raw = m.group(0)
+            tokens.append(("number", float(raw) if any(c in raw for c in ".eE") else int(raw)))
+            i = m.end()
+        elif IDENT_RE.match(text, i):
+            m = IDENT_RE.match(text, i)
+            tokens.append(("ident", m.group(0)))
+            i = m.end()
+        else:
+            raise JSLiteralError(f"无法识别的字符 {ch!r} (位置 {i})")
+        i = _skip_space_and_comments(text, i)
+    return tokens
+
+
+KEYWORDS = {"true": True, "false": False, "null": None, "undefined": None}
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        tok = self.peek()
+        if tok[0] is None or (kind and tok[0] != kind) or (value and tok[1] != value):
+            raise JSLiteralError(f"期望 {value or kind}，实际为 {tok[1]!r}")
+        self.pos += 1
+        return tok
+
+    def value(self):
+        kind, val = self.peek()
+        if kind == "punct" and val == "{":
+            return self.obj()
+        if kind == "punct" and val == "[":
+            return self.arr()
+        if kind in ("string", "number"):
+            self.pos += 1
+            return val
+        if kind == "ident" and val in KEYWORDS:
+            self.pos += 1
+            return KEYWORDS[val]
+        raise JSLiteralError(f"不支持的值: {val!r}")
+
+    def obj(self):
+        self.take("punct", "{")
+        result = {}
+        while self.peek() != ("punct", "}"):
+            kind, key = self.take()
+            if kind not in ("string", "number", "ident"):
+                raise JSLiteralError(f"非法的对象键: {key!r}")
+            self.take("punct", ":")
+            result[str(key)] = self.value()
+            if self.peek() == ("punct", ","):
+                self.pos += 1
+            else:
+                break
+        self.take("punct", "}")
+        return result
+
+    def arr(self):
+        self.take("punct", "[")
+        result = []
+        while self.peek() != ("punct", "]"):
+            result.append(self.value())
+            if self.peek() == ("punct", ","):
+                self.pos += 1
+            else:
+                break
+        self.take("punct", "]")
+        return result
+
+
+def parse_literal(text):
+    """解析一段 JS 数据字面量"""
+    parser = _Parser(tokenize(text))
+    result = parser.value()
+    if parser.pos != len(parser.tokens):
+        raise JSLiteralError("字面量之后存在多余内容")
+    return result
+
+
+def _balanced_end(source, start):
+    """从 start 处的 { 或 [ 开始，找到与之匹配的闭合括号之后的位置 (跳过字符串与注释)"""
+    depth = 0
+    i = start
+    while i < len(source):
+        i = _skip_space_and_comments(source, i)
+        ch = source[i]
+        if ch in "'\"`":
+            if ch == "`":
+                i = source.index("`", i + 1) + 1
+            else:
+                _, i = _read_string(source, i)
+            continue
+        if ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise JSLiteralError("括号不匹配")
+
+
+def extract_literal(source, name):
+    """
+    在 JS 源码中找到 `const NAME = {...}` 或 `NAME = [...]` 形式的赋值并解析其值
+    name 可以带点号，例如 "XJZL.arts"
+    """
+    pattern = re.compile(r"(?:\b(?:const|let|var)\s+)?(?<![\w.$])" + re.escape(name) + r"\s*=\s*(?=[\[{])")
+    m = pattern.search(source)
+    if not m:
+        raise KeyError(f"未在源码中找到字面量: {name}")
+    end = _balanced_end(source, m.end())
+    return parse_literal(source[m.end():end])
+
+
+def read_literal(path, name):
+    with open(path, 'r', encoding='utf-8') as f:
+        return extract_literal(f.read(), name)
@@ -0,0 +1,175 @@
+"""
+嵌入脚本使用的轻量 JS 词法分析器
+
+只做切分，不做语法分析：输出标识符、数字、字符串、模板字符串片段、正则字面量与标点，
+跳过空白和注释。模板字符串中 ${...} 内的代码会继续切分成普通记号，
+这样规则既能匹配代码，又不会误改字符串和注释里的文字。
+"""
+import re
+from collections import namedtuple
+
+Token = namedtuple("Token", ["kind", "value", "start", "end"])
+
+
+class JSTokenizeError(ValueError):
+    """脚本无法切分 (未闭合的字符串、注释、模板或括号不匹配)"""
+
+    def __init__(self, message, pos):
+        super().__init__(message)
+        self.pos = pos
+
+
+IDENT_RE = re.compile(r"[A-Za-z_$À-￿][\w$À-￿]*")
+NUMBER_RE = re.compile(r"0[xX][\da-fA-F_]+n?|0[bB][01_]+n?|0[oO][0-7_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?")
+REGEX_BODY_RE = re.compile(r"/(?:[^/\\\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[a-z]*")
+
+# 按长度从长到短排列，保证最长匹配
+PUNCTUATORS = sorted([
+    ">>>=", "...", "===", "!==", "**=", "<<=", ">>=", ">>>", "&&=", "||=", "??=",
+    "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--", "+=", "-=", "*=", "/=",
+    "%=", "&=", "|=", "^=", "**", "<<", ">>",
+    "{", "}", "(", ")", "[", "]", ";", ",", "<", ">", "+", "-", "*", "/", "%", "&", "|", "^",
+    "!", "~", "?", ":", "=", ".", "@", "#"
+], key=len, reverse=True)
+PUNCT_RE = re.compile("|".join(map(re.escape, PUNCTUATORS)))
+
+WHITESPACE = " \t\r\n\u00a0\ufeff"
+SPACE_RE = re.compile(f"[{WHITESPACE}]+")
+
+# 这些记号之后的 / 是正则字面量而不是除号
+REGEX_PREFIX_KEYWORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw",
+    "case", "do", "else", "yield", "await"
+}
+CLOSING = {")", "]", "}"}
+BRACKETS = {"(": ")", "[": "]", "{": "}"}
+
+
+def _regex_allowed(prev):
+    if prev is None:
+        return True
+    if prev.kind == "punct":
+        return prev.value not in CLOSING and prev.value not in ("++", "--")
+    if prev.kind == "ident":
+        return prev.value in REGEX_PREFIX_KEYWORDS
+    return False
+
+
+def _skip_string(src, i):
+    quote = src[i]
+    i += 1
+    n = len(src)
+    while i < n:
+        ch = src[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == quote:
+            return i + 1
+        if ch == "\n":
+            break
+        i += 1
+    raise JSTokenizeError("未闭合的字符串", i)
+
+
+def _scan_template(src, i):
+    """从模板字符串内部的 i 开始扫描，返回 (片段结束位置, 是否遇到 ${)"""
+    n = len(src)
+    while i < n:
+        ch = src[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "`":
+            return i + 1, False
+        if ch == "$" and src.startswith("${", i):
+            return i + 2, True
+        i += 1
+    raise JSTokenizeError("未闭合的模板字符串", i)
+
+
+def tokenize(src):
+    """
+    把脚本切分为记号列表 (不含空白与注释)
+    模板字符串的静态部分为 "template" 记号 (包含 ` 与 ${ / } 边界)
+    """
+    tokens = []
+    append = tokens.append
+    # 每个元素为进入 ${ 时的括号栈深度，用于判断 } 是否回到模板
+    template_stack = []
+    brackets = []
+    i = 0
+    n = len(src)
+    prev = None
+
+    while i < n:
+        ch = src[i]
+        if ch in WHITESPACE:
+            i = SPACE_RE.match(src, i).end()
+            continue
+        if ch == "/" and i + 1 < n and src[i + 1] in "/*":
+            if src[i + 1] == "/":
+                end = src.find("\n", i)
+                i = n if end == -1 else end + 1
+            else:
+                end = src.find("*/", i + 2)
+                if end == -1:
+                    raise JSTokenizeError("未闭合的块注释", i)
+                i = end + 2
+            continue
+
+        start = i
+        if ch in "'\"":
+            i = _skip_string(src, i)
+            tok = Token("string", src[start:i], start, i)
+        elif ch == "`" or (ch == "}" and template_stack and template_stack[-1] == len(brackets)):
+            if ch == "}":
+                template_stack.pop()
+            i, opened = _scan_template(src, i + 1)
+            if opened:
+                template_stack.append(len(brackets))
+            tok = Token("template", src[start:i], start, i)
+        elif ch.isdigit() or (ch == "." and i + 1 < n and src[i + 1].isdigit()):
+            m = NUMBER_RE.match(src, i)
+            i = m.end()
+            tok = Token("number", m.group(0), start, i)
+        elif ch == "/" and _regex_allowed(prev):
+            m = REGEX_BODY_RE.match(src, i)
+            if not m:
+                raise JSTokenizeError("无法识别的正则字面量", i)
+            i = m.end()
+            tok = Token("regex", m.group(0), start, i)
+        else:
+            m = IDENT_RE.match(src, i)
+            if m:
+                i = m.end()
+                tok = Token("ident", m.group(0), start, i)
+            else:
+                m = PUNCT_RE.match(src, i)
+                if not m:
+                    raise JSTokenizeError(f"无法识别的字符 {ch!r}", i)
+                p = m.group(0)
+                # a?.5 是三元表达式而不是可选链
+                if p == "?." and i + 2 < n and src[i + 2].isdigit():
+                    p = "?"
+                i += len(p)
+                tok = Token("punct", p, start, i)
+                if p in BRACKETS:
+                    brackets.append(p)
+                elif p in CLOSING:
+                    if not brackets or BRACKETS[brackets[-1]] != p:
+                        raise JSTokenizeError(f"多余或不匹配的 {p}", start)
+                    brackets.pop()
+        append(tok)
+        prev = tok
+
+    if template_stack:
+        raise JSTokenizeError("模板字符串中的 ${ 未闭合", n)
+    if brackets:
+        raise JSTokenizeError(f"未闭合的 {brackets[-1]}", n)
+    return tokens
+
+
+def line_of(src, pos):
+    """位置所在的行号 (从 1 开始)"""
+    return src.count("\n", 0, pos) + 1
@@ -0,0 +1,239 @@
+"""
+嵌入脚本的批量检查 / 改写引擎
+
+每段脚本只切分一次 (jstokens.tokenize)，然后在一次线性扫描中按记号值分发给所有规则：
+规则注册时声明自己关心的 "锚点" 记号 (如 "actor"、"computedLevel")，
+扫描到该记号时才会被调用，因此规则数量增加不会增加扫描次数。
+
+规则既可以只报告问题，也可以附带修改 (Edit)；修改由引擎统一按位置倒序应用，
+重叠的修改只保留先报告的一个。规则位于 xjzl_tools/rules/ 下。
+在数据上运行使用引擎中的 "lint" pass：
+    python -m xjzl_tools.run lint             # 应用所有可自动修复的规则并报告其余问题
+    python -m xjzl_tools.run lint --dry-run   # 只报告
+    python -m xjzl_tools.lint --list          # 列出所有规则
+    python -m xjzl_tools.lint --selftest      # 用规则自带的示例检查规则本身 (修改规则后运行)
+"""
+import argparse
+import sys
+from collections import namedtuple
+
+from . import engine
+from .jstokens import JSTokenizeError, line_of, tokenize
+
+# 已注册的规则，按注册顺序排列
+RULES = {}
+
+# 一处文本修改：把 source[start:end] 替换为 text (start == end 时为插入)
+Edit = namedtuple("Edit", ["start", "end", "text"])
+
+
+class Rule:
+    """
+    anchors: 触发规则的记号值
+    triggers / categories: 适用的脚本触发器与数据分类，engine.ALL 表示全部
+    move_only: 只检查招式脚本
+    examples: [(脚本, 修复后的脚本)]，供 --selftest 检查规则本身
+    """
+
+    def __init__(self, name, func, anchors, triggers, categories, move_only, description, examples=()):
+        self.name = name
+        self.func = func
+        self.anchors = anchors
+        self.triggers = triggers
+        self.categories = categories
+        self.move_only = move_only
+        self.description = description
+        self.examples = list(examples)
+
+    def applies_to(self, ref, category):
+        if self.move_only and ref.move is None:
+            return False
+        if self.triggers != engine.ALL and ref.trigger not in self.triggers:
+            return False
+        return self.categories == engine.ALL or category in self.categories
+
+
+class Issue:
+    """规则在脚本中发现的一个问题，edits 非空表示可以自动修复"""
+
+    def __init__(self, rule, pos, message, edits=()):
+        self.rule = rule
+        self.pos = pos
+        self.message = message
+        self.edits = list(edits)
+        self.line = None
+
+    @property
+    def fixable(self):
+        return bool(self.edits)
+
+
+class ScriptContext:
+    """传给规则的单段脚本上下文，state 供规则保存本段脚本内的中间结果"""
+
+    def __init__(self, source, tokens, ref, category):
+        self.source = source
+        self.tokens = tokens
+        self.ref = ref
+        self.category = category
+        self.state = {}
+
+    def value(self, i):
+        """第 i 个记号的值，越界时返回 None"""
+        return self.tokens[i].value if 0 <= i < len(self.tokens) else None
+
+    def match(self, i, values):
+        """从第 i 个记号开始依次匹配 values (None 表示任意记号)"""
+        if i < 0 or i + len(values) > len(self.tokens):
+            return False
+        return all(v is None or self.tokens[i + k].value == v for k, v in enumerate(values))
+
+    def is_member(self, i, obj):
+        """第 i 个记号是否为 obj.<记号> 形式，且 obj 本身不是其他对象的属性"""
+        return self.match(i - 2, (obj, ".")) and self.value(i - 3) not in (".", "?.")
+
+    def is_property(self, i):
+        """第 i 个记号是否为属性访问 (前面是 . 或 ?.)"""
+        return self.value(i - 1) in (".", "?.")
+
+
+def register_rule(name, anchors, triggers=engine.ALL, categories=engine.ALL, move_only=False, description="",
+                  examples=()):
+    """
+    装饰器：注册一条规则
+    被装饰的函数签名为 func(ctx, i)，i 为锚点记号的下标，返回 Issue 或 None
+    examples 为 [(脚本, 修复后的脚本)]，只报告不修复的规则修复后的脚本与原脚本相同
+    """
+    if triggers != engine.ALL:
+        triggers = tuple(triggers)
+    if categories != engine.ALL:
+        categories = tuple(categories)
+
+    def decorator(func):
+        if name in RULES:
+            raise ValueError(f"重复注册的规则: {name}")
+        RULES[name] = Rule(name, func, tuple(anchors), triggers, categories, move_only,
+                           description or (func.__doc__ or "").strip(), examples)
+        return func
+
+    return decorator
+
+
+def load_rules():
+    """导入所有内置规则模块，触发注册"""
+    from . import rules  # noqa: F401
+    return RULES
+
+
+def lint_script(ref, category, rules=None):
+    """
+    检查单段脚本，返回问题列表
+    脚本无法切分时返回一个 rule 为 "syntax" 的问题
+    """
+    rules = RULES.values() if rules is None else rules
+    by_anchor = {}
+    for rule in rules:
+        if rule.applies_to(ref, category):
+            for anchor in rule.anchors:
+                by_anchor.setdefault(anchor, []).append(rule)
+    if not by_anchor:
+        return []
+
+    source = ref.content
+    try:
+        tokens = tokenize(source)
+    except JSTokenizeError as e:
+        issue = Issue("syntax", e.pos, str(e))
+        issue.line = line_of(source, e.pos)
+        return [issue]
+
+    ctx = ScriptContext(source, tokens, ref, category)
+    issues = []
+    for i, tok in enumerate(tokens):
+        hits = by_anchor.get(tok.value)
+        if hits is None or tok.kind != "ident":
+            continue
+        for rule in hits:
+            issue = rule.func(ctx, i)
+            if issue is not None:
+                issue.line = line_of(source, issue.pos)
+                issues.append(issue)
+    return issues
+
+
+def apply_fixes(source, issues):
+    """
+    应用可修复问题的修改，返回 (新脚本, 实际应用的问题列表)
+    同一问题的多处修改要么全部应用，要么在与已接受的修改重叠时整体放弃
+    """
+    accepted = []
+    taken = []
+    for issue in issues:
+        if not issue.edits:
+            continue
+        spans = [(e.start, e.end) for e in issue.edits]
+        if any(s < te and ts < e or (s == e == ts == te) for s, e in spans for ts, te in taken):
+            continue
+        taken.extend(spans)
+        accepted.append(issue)
+
+    edits = sorted((e for issue in accepted for e in issue.edits), key=lambda e: (e.start, e.end), reverse=True)
+    for edit in edits:
+        source = source[:edit.start] + edit.text + source[edit.end:]
+    return source, accepted
+
+
+def _example_ref(rule, source):
+    """示例脚本的 ScriptRef：取规则适用的第一个触发器，招式规则挂在一个空招式上"""
+    from .scripts import ScriptRef
+    trigger = rule.triggers[0] if rule.triggers != engine.ALL else None
+    move = {} if rule.move_only else None
+    return ScriptRef(None, None, move, None, None, None, trigger, None, True, "", source, None)
+
+
+def selftest(rules):
+    """逐条运行规则自带的示例，返回失败列表 [(规则名, 脚本, 期望, 实际)]"""
+    failures = []
+    for rule in rules:
+        category = rule.categories[0] if rule.categories != engine.ALL else None
+        for source, expected in rule.examples:
+            issues = lint_script(_example_ref(rule, source), category, [rule])
+            fixed, _ = apply_fixes(source, issues)
+            if fixed != expected:
+                failures.append((rule.name, source, expected, fixed))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="嵌入脚本检查规则 (在数据上运行请使用 python -m xjzl_tools.run lint)")
+    parser.add_argument("--list", action="store_true", help="列出所有规则")
+    parser.add_argument("--selftest", action="store_true", help="运行规则自带的示例")
+    args = parser.parse_args()
+
+    # 以 python -m 运行时本模块是 __main__，规则注册在包内的 xjzl_tools.lint 中
+    from . import lint
+    if args.selftest:
+        rules = lint.load_rules().values()
+        failures = lint.selftest(rules)
+        for name, source, expected, fixed in failures:
+            print(f"❌ {name}\n    脚本: {source!r}\n    期望: {expected!r}\n    实际: {fixed!r}")
+        total = sum(len(rule.examples) for rule in rules)
+        if failures:
+            print(f"\n❌ {total} 个示例中 {len(failures)} 个失败")
+            sys.exit(1)
+        print(f"✅ {total} 个示例全部通过")
+        return
+    for rule in lint.load_rules().values():
+        scope = []
+        if rule.triggers != engine.ALL:
+            scope.append("/".join(rule.triggers))
+        if rule.categories != engine.ALL:
+            scope.append("/".join(rule.categories))
+        if rule.move_only:
+            scope.append("招式")
+        print(f"{rule.name:<24} 锚点: {', '.join(rule.anchors):<20} 范围: {' '.join(scope) or '全部'}")
+        print(f"    {rule.description}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import os
+import sys
+import json
+import types
+import inspect
+import hashlib
+
+from . import engine, serialize
+
+# 缓存目录 (以 . 开头，不会被当作数据文件扫描)
+CACHE_DIR = os.path.join(engine.DATA_DIR, ".xjzl_cache")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+
+# 清单格式版本，结构变化时递增，旧清单整体作废
+MANIFEST_VERSION = 1
+
+PACKAGE = __name__.rsplit(".", 1)[0]
+
+
+def _package_modules(module, seen):
+    """收集 module 及其引用到的本包内模块 (递归)"""
+    if module.__name__ in seen:
+        return
+    seen[module.__name__] = module
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            dep = value
+        else:
+            dep = sys.modules.get(getattr(value, "__module__", None) or "")
+        if dep is not None and dep.__name__.startswith(PACKAGE + "."):
+            _package_modules(dep, seen)
+
+
+def pass_fingerprint(p):
+    """
+    计算 pass 代码的指纹：pass 所在模块及其依赖的本包模块的源码 hash
+    修改 pass 或它用到的公共代码后，旧的缓存结果自动失效
+    """
+    modules = {}
+    _package_modules(sys.modules[p.func.__module__], modules)
+    digest = hashlib.sha1(f"{MANIFEST_VERSION}:{p.name}:{p.kind}".encode("utf-8"))
+    for name in sorted(modules):
+        digest.update(name.encode("utf-8"))
+        digest.update(inspect.getsource(modules[name]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class Manifest:
+    """
+    记录每个数据文件的内容 hash 与各 pass 的执行结果
+
+    只有 "干净" 的结果会被记录 (fix 类 pass 没有产生修改)，
+    下次运行时文件未变化且 pass 指纹一致，就直接回放记录的检查结果，不再解析文件。
+    """
+
+    def __init__(self, path=MANIFEST_PATH, data_dir=engine.DATA_DIR):
+        self.path = path
+        self.data_dir = data_dir
+        self.files = {}
+        self.dirty = False
+        self._fingerprints = {}
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH, data_dir=engine.DATA_DIR):
+        manifest = cls(path, data_dir)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if content.get("version") == MANIFEST_VERSION:
+            manifest.files = content.get("files", {})
+        return manifest
+
+    def save(self):
+        if not self.dirty:
+            return
+        serialize.write_json(self.path, {"version": MANIFEST_VERSION, "files": self.files}, minify=True)
+        self.dirty = False
+
+    def fingerprint(self, p):
+        if p.name not in self._fingerprints:
+            self._fingerprints[p.name] = pass_fingerprint(p)
+        return self._fingerprints[p.name]
+
+    def current_hash(self, rel_path):
+        """
+        获取文件当前的内容 hash
+        mtime 与大小都没变时直接信任清单中的 hash，避免重新读取
+        """
+        file_path = os.path.join(self.data_dir, rel_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        entry = self.files.get(rel_path)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return entry["hash"]
+
+        with open(file_path, 'rb') as f:
+            return engine.hash_bytes(f.read())
+
+    def replay(self, rel_path, passes):
+        """
+        文件与 pass 都未变化时，返回由缓存重建的 FileResult；否则返回 None
+        """
+        category = engine.category_of(rel_path)
+        applicable = [p for p in passes if p.applies_to(category)]
+        entry = self.files.get(rel_path)
+        if not applicable or not entry:
+            return None
+        if self.current_hash(rel_path) != entry["hash"]:
+            return None
+
+        cached_passes = entry.get("passes", {})
+        result = engine.FileResult(rel_path)
+        for p in applicable:
+            cached = cached_passes.get(p.name)
+            if cached is None or cached["fingerprint"] != self.fingerprint(p):
+                return None
+            report = engine.PassReport(p.name, rel_path)
+            report.findings = [dict(issue) for issue in cached["findings"]]
+            result.reports.append(report)
+
+        result.hash = entry["hash"]
+        result.cached = True
+        return result
+
+    def record(self, result, passes):
+        """记录一次实际执行的结果；有修改或出错的文件不记录，下次会重新处理"""
+        rel_path = result.rel_path
+        if result.error or result.modified or result.hash is None:
+            if self.files.pop(rel_path, None) is not None:
+                self.dirty = True
+            return
+
+        file_path = os.path.join(self.data_dir, rel_path)
+        stat = os.stat(file_path)
+        entry = self.files.get(rel_path)
+        if not entry or entry["hash"] != result.hash:
+            entry = {"hash": result.hash, "passes": {}}
+            self.files[rel_path] = entry
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+
+        by_name = {p.name: p for p in passes}
+        for report in result.reports:
+            entry["passes"][report.name] = {
+                "fingerprint": self.fingerprint(by_name[report.name]),
+                "findings": report.findings
+            }
+        self.dirty = True
@@ -0,0 +1,344 @@
+"""
+武学招式的列式数据表
+
+把所有武学的 system.moves[] 展平为按列存放的 NumPy 数组 (每个招式一行)，
+每列单独保存为 build/movetable/<列名>.npy，可以用 mmap 方式直接映射，不必解析 JSON：
+    分类列 (存编码，取值不超过 32767 种时为 int16，否则为 int32；-1 表示缺失，取值表在 meta.json 中)
+        file sect item move type element damageType weaponType actionCost
+    数值列
+        tier (int8，招式自身的 tier 优先，-1 表示缺失)、calculation.base / calculation.growth (float32，NaN 表示缺失)
+    消耗列
+        costs.mp / costs.rage / costs.hp，形状 (招式数, 最高重数) 的 float32，不足的重数为 NaN
+
+meta.json 记录数据文件的 hash，数据未变化时不会重新构建；无法读取的文件不进入表，记录在 meta.json 的 errors 中。
+需要 numpy。
+
+    from xjzl_tools.movetable import MoveTable
+    table = MoveTable.load()
+    table.aggregate("costs.mp", by=["tier"], where={"type": "stance", "weaponType": "blade"})
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.movetable                                  # 构建 / 更新
+    python -m xjzl_tools.movetable costs.mp --by tier --where type=stance weaponType=blade
+    python -m xjzl_tools.movetable calculation.growth --by sect --agg max
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import corpus, engine, serialize
+from .passes.cost_length import resolve_move_tier
+
+DEFAULT_DIR = os.path.join(engine.ROOT_DIR, "build", "movetable")
+META_FILE = "meta.json"
+
+TABLE_VERSION = 2
+
+CATEGORY_COLUMNS = ("file", "sect", "item", "move", "type", "element", "damageType", "weaponType", "actionCost")
+NUMBER_COLUMNS = ("tier", "calculation.base", "calculation.growth")
+COST_RESOURCES = ("mp", "rage", "hp")
+
+AGGREGATES = ("mean", "sum", "min", "max", "count")
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("需要 numpy: pip install numpy")
+
+
+def _number(value):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+
+def _move_tier(move, system):
+    """与 cost_length / costcheck 相同：招式自身的 tier 优先于物品的 tier"""
+    try:
+        return resolve_move_tier(move, system.get("tier", 1))
+    except (TypeError, ValueError):
+        return None
+
+
+def category_dtype(count):
+    """分类编码的类型：-1 表示缺失，编码最大为 count - 1"""
+    return np.int16 if count <= np.iinfo(np.int16).max else np.int32
+
+
+def source_files(data_dir=engine.DATA_DIR):
+    return [rel for rel in engine.iter_data_files(data_dir) if engine.category_of(rel) == "wuxue"]
+
+
+def source_hash(snapshot, files):
+    return engine.hash_bytes("".join(f"{rel}:{snapshot.hash(rel)}\n" for rel in files).encode("utf-8"))
+
+
+def collect_rows(snapshot, files):
+    """
+    展平为逐行的 Python 列表
+    返回 ({列名: [值, ...]}, {资源: [消耗数列, ...]}, 无法读取的文件 [{"file", "reason"}])
+    """
+    columns = {name: [] for name in CATEGORY_COLUMNS + NUMBER_COLUMNS}
+    costs = {res: [] for res in COST_RESOURCES}
+    errors = []
+
+    for rel_path in files:
+        try:
+            data = snapshot.data(rel_path)
+        except (ValueError, OSError) as e:
+            errors.append({"file": rel_path, "reason": str(e)})
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if not isinstance(item, dict):
+                continue
+            system = item.get("system") or {}
+            moves = system.get("moves")
+            if not isinstance(moves, list):
+                continue
+            for move in moves:
+                if not isinstance(move, dict):
+                    continue
+                calculation = move.get("calculation") or {}
+                row = {
+                    "file": rel_path, "sect": system.get("sect"), "item": item.get("name"),
+                    "move": move.get("name"), "tier": _move_tier(move, system),
+                    "calculation.base": _number(calculation.get("base")),
+                    "calculation.growth": _number(calculation.get("growth")),
+                }
+                for key in ("type", "element", "damageType", "weaponType", "actionCost"):
+                    row[key] = move.get(key)
+                for name, values in columns.items():
+                    values.append(row[name])
+
+                move_costs = move.get("costs") or {}
+                for res in COST_RESOURCES:
+                    series = move_costs.get(res)
+                    costs[res].append([_number(v) for v in series] if isinstance(series, list) else [])
+    return columns, costs, errors
+
+
+def build(out_dir=DEFAULT_DIR, data_dir=engine.DATA_DIR, force=False):
+    """构建列式表，返回 (MoveTable, 是否重新构建)"""
+    _require_numpy()
+    snapshot = corpus.shared()
+    files = source_files(data_dir)
+    digest = source_hash(snapshot, files)
+
+    meta_path = os.path.join(out_dir, META_FILE)
+    if not force:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get("version") == TABLE_VERSION and meta.get("hash") == digest:
+                return MoveTable.load(out_dir), False
+        except (OSError, ValueError):
+            pass
+
+    columns, costs, errors = collect_rows(snapshot, files)
+    rows = len(columns["file"])
+    arrays = {}
+    meta = {"version": TABLE_VERSION, "hash": digest, "rows": rows, "columns": {}, "errors": errors}
+
+    for name in CATEGORY_COLUMNS:
+        categories = sorted({str(v) for v in columns[name] if v not in (None, "")})
+        lookup = {value: code for code, value in enumerate(categories)}
+        arrays[name] = np.array([lookup.get(str(v), -1) if v not in (None, "") else -1 for v in columns[name]],
+                                dtype=category_dtype(len(categories)))
+        meta["columns"][name] = {"kind": "category", "categories": categories}
+
+    arrays["tier"] = np.array([-1 if v is None else v for v in columns["tier"]], dtype=np.int8)
+    meta["columns"]["tier"] = {"kind": "number"}
+    for name in ("calculation.base", "calculation.growth"):
+        arrays[name] = np.array([np.nan if v is None else v for v in columns[name]], dtype=np.float32)
+        meta["columns"][name] = {"kind": "number"}
+
+    levels = max((len(s) for series in costs.values() for s in series), default=0)
+    for res in COST_RESOURCES:
+        matrix = np.full((rows, levels), np.nan, dtype=np.float32)
+        for i, series in enumerate(costs[res]):
+            matrix[i, :len(series)] = [np.nan if v is None else v for v in series]
+        name = f"costs.{res}"
+        arrays[name] = matrix
+        meta["columns"][name] = {"kind": "cost", "levels": levels}
+
+    os.makedirs(out_dir, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(out_dir, f"{name}.npy"), array)
+    serialize.write_json(meta_path, meta)
+    return MoveTable.load(out_dir), True
+
+
+class MoveTable:
+    """
+    招式列式表
+    值表达式 (value / where 中的列名)：
+        分类列与数值列直接使用列名
+        costs.mp        各重消耗的平均值 (忽略缺失的重数)
+        costs.mp.2      第 2 重的消耗
+        costs.mp.len    消耗数组的长度
+    """
+
+    def __init__(self, meta, arrays):
+        self.meta = meta
+        self.arrays = arrays
+
+    @classmethod
+    def load(cls, path=DEFAULT_DIR, mmap=True):
+        _require_numpy()
+        with open(os.path.join(path, META_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in meta["columns"]}
+        return cls(meta, arrays)
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    @property
+    def errors(self):
+        """构建时无法读取的文件 [{"file", "reason"}]"""
+        return self.meta.get("errors", [])
+
+    def categories(self, name):
+        return self.meta["columns"][name]["categories"]
+
+    def decode(self, name, codes):
+        """分类编码 -> 字符串 (缺失为 None)"""
+        categories = self.categories(name)
+        return [categories[c] if c >= 0 else None for c in np.asarray(codes).tolist()]
+
+    def values(self, expr):
+        """按值表达式取一列 float 数组 (分类列返回编码)"""
+        if expr in self.arrays and self.meta["columns"][expr]["kind"] != "cost":
+            return self.arrays[expr]
+        resource, _, level = expr.rpartition(".")
+        if expr.startswith("costs.") and expr.count(".") == 2 and resource in self.arrays:
+            matrix = self.arrays[resource]
+            if level == "len":
+                return np.count_nonzero(~np.isnan(matrix), axis=1)
+            index = int(level) - 1
+            if not 0 <= index < matrix.shape[1]:
+                return np.full(len(self), np.nan, dtype=np.float32)
+            return matrix[:, index]
+        if expr in self.arrays:
+            matrix = self.arrays[expr]
+            filled = np.count_nonzero(~np.isnan(matrix), axis=1)
+            totals = np.nansum(matrix, axis=1)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.where(filled > 0, totals / np.maximum(filled, 1), np.nan)
+        raise KeyError(f"未知的列: {expr}")
+
+    def mask(self, where=None):
+        """where: {列名: 值或值的列表}，分类列按字符串比较，其他列按数值比较"""
+        selected = np.ones(len(self), dtype=bool)
+        for name, wanted in (where or {}).items():
+            wanted = wanted if isinstance(wanted, (list, tuple, set)) else [wanted]
+            column = self.meta["columns"].get(name)
+            if column and column["kind"] == "category":
+                lookup = {value: code for code, value in enumerate(column["categories"])}
+                codes = [lookup[str(w)] for w in wanted if str(w) in lookup]
+                selected &= np.isin(self.arrays[name], codes)
+            else:
+                selected &= np.isin(self.values(name), [float(w) for w in wanted])
+        return selected
+
+    def aggregate(self, value, by=(), where=None, agg="mean"):
+        """
+        按 by 中的列分组聚合 value，缺失值 (NaN) 不参与计算
+        返回 [(分组取值元组, 聚合值, 参与计算的行数)]，按分组排序
+        """
+        if agg not in AGGREGATES:
+            raise ValueError(f"未知的聚合方式: {agg}")
+        values = np.asarray(self.values(value), dtype=np.float64)
+        selected = self.mask(where) & ~np.isnan(values)
+        values = values[selected]
+
+        if by:
+            keys = np.stack([np.asarray(self.values(name))[selected] for name in by], axis=1)
+            groups, inverse = np.unique(keys, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+        else:
+            groups, inverse = np.zeros((1, 0)), np.zeros(len(values), dtype=np.intp)
+
+        counts = np.bincount(inverse, minlength=len(groups))
+        if agg in ("mean", "sum"):
+            result = np.bincount(inverse, weights=values, minlength=len(groups))
+            if agg == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result = result / counts
+        elif agg == "count":
+            result = counts.astype(np.float64)
+        else:
+            fill = np.inf if agg == "min" else -np.inf
+            result = np.full(len(groups), fill)
+            (np.minimum if agg == "min" else np.maximum).at(result, inverse, values)
+
+        out = []
+        for g, group in enumerate(groups):
+            if not counts[g]:
+                continue
+            labels = []
+            for name, code in zip(by, group.tolist()):
+                kind = self.meta["columns"].get(name, {}).get("kind")
+                labels.append(self.decode(name, [int(code)])[0] if kind == "category" else code)
+            out.append((tuple(labels), float(result[g]), int(counts[g])))
+        return out
+
+
+def parse_where(items):
+    where = {}
+    for item in items or []:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"条件格式应为 列名=值[,值...]: {item}")
+        where[name] = value.split(",")
+    return where
+
+
+def main():
+    parser = argparse.ArgumentParser(description="构建武学招式的列式数据表，并做分组统计")
+    parser.add_argument("value", nargs="?", help="要统计的值表达式 (如 costs.mp、costs.mp.2、calculation.growth)")
+    parser.add_argument("--by", nargs="+", default=[], metavar="COLUMN", help="分组列")
+    parser.add_argument("--where", nargs="+", metavar="COLUMN=VALUE", help="筛选条件，多个取值用逗号分隔")
+    parser.add_argument("--agg", choices=AGGREGATES, default="mean", help="聚合方式，默认 mean")
+    parser.add_argument("--rebuild", action="store_true", help="忽略 hash 强制重新构建")
+    parser.add_argument("--out", default=DEFAULT_DIR, help=f"表的目录，默认 {DEFAULT_DIR}")
+    args = parser.parse_args()
+
+    if np is None:
+        parser.exit(1, "❌ 需要 numpy: pip install numpy\n")
+
+    start = time.perf_counter()
+    table, rebuilt = build(args.out, force=args.rebuild)
+    elapsed = time.perf_counter() - start
+    status = "已重新构建" if rebuilt else "数据未变化，直接加载"
+    print(f"📦 招式表 {len(table)} 行，{status} ({elapsed * 1000:.0f} ms): {args.out}")
+    for error in table.errors:
+        print(f"❌ 无法读取: {error['file']} | {error['reason']}")
+
+    if not args.value:
+        sys.exit(1 if table.errors else 0)
+    try:
+        where = parse_where(args.where)
+        start = time.perf_counter()
+        results = table.aggregate(args.value, by=args.by, where=where, agg=args.agg)
+        elapsed = time.perf_counter() - start
+    except (KeyError, ValueError, argparse.ArgumentTypeError) as e:
+        parser.exit(1, f"❌ {e}\n")
+
+    header = " | ".join(args.by) if args.by else "全部"
+    print(f"\n{header} | {args.agg}({args.value}) | 行数")
+    for labels, value, count in results:
+        label = " | ".join(str(v) for v in labels) if labels else "全部"
+        print(f"{label} | {value:.2f} | {count}")
+    print(f"\n⏱️  查询用时 {elapsed * 1000:.2f} ms")
+    sys.exit(1 if table.errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+内功阶段属性矩阵与向量化校验
+
+把全部内功 (data/neigong/*.json) 的 config.stage1..3.stats 装入形状 (内功数, 3, 6) 的 NumPy 矩阵
+(缺失为 NaN)，一次完成全部检查：
+    missing     缺少某个阶段的配置或属性块
+    monotonic   某项属性在后一阶段反而降低
+    budget      阶段属性总和与同品阶的主流总和不同 (主流值取该品阶各阶段最常见的总和)
+    ratio       xpCostRatio 不在 (0, 1] 范围内 (系数用于打折，大于 1 会让门槛高于标准)
+
+--write 时输出 build/neigong/stage-matrix.json：按 门派 × 品阶 × 阶段 × 属性 的平均值矩阵 (无数据为 null)，
+以及数据中出现的各种 {"品阶|系数1|系数2|系数3": [门槛1, 门槛2, 门槛3]}，
+门槛与 neigong.mjs 的 stageThresholds 完全相同 (原始门槛直接从 neigong.mjs 的 BASE_THRESHOLDS 读取)。
+--since 时统计仍基于全部内功，只报告有变化的文件，且不写输出。
+
+需要 numpy。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.neigongtable                   # 只报告
+    python -m xjzl_tools.neigongtable --write           # 同时写出矩阵
+    python -m xjzl_tools.neigongtable --only monotonic budget
+"""
+import argparse
+import os
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import corpus, engine, serialize, since
+from .jsliteral import read_literal
+
+STAGES = ("stage1", "stage2", "stage3")
+STAGE_LABELS = ("领悟", "小成", "圆满")
+STATS = ("liliang", "shenfa", "tipo", "neixi", "qigan", "shencai")
+CHECKS = ("missing", "monotonic", "budget", "ratio")
+
+NEIGONG_MODEL = os.path.join(engine.ROOT_DIR, "module", "data", "item", "neigong.mjs")
+MATRIX_PATH = os.path.join(engine.ROOT_DIR, "build", "neigong", "stage-matrix.json")
+
+
+class StageMatrix:
+    """
+    全部内功的阶段属性
+    rows[i] = (相对路径, 物品序号, 名称)；stats 形状 (n, 3, 6)，ratios 形状 (n, 3)，缺失为 NaN
+    errors 为无法读取的文件 [(相对路径, 原因)]
+    """
+
+    def __init__(self, rows, tiers, sects, stats, ratios, errors=()):
+        self.rows = rows
+        self.errors = list(errors)
+        self.tiers = np.array(tiers, dtype=np.int64)
+        self.sect_names = sorted(set(sects))
+        lookup = {name: code for code, name in enumerate(self.sect_names)}
+        self.sects = np.array([lookup[s] for s in sects], dtype=np.int64)
+        self.stats = np.array(stats, dtype=np.float64).reshape(len(rows), len(STAGES), len(STATS))
+        self.ratios = np.array(ratios, dtype=np.float64).reshape(len(rows), len(STAGES))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def effective_ratios(self):
+        """运行时的系数：未填写时为 1 (xpCostRatio ?? 1)"""
+        return np.where(np.isnan(self.ratios), 1.0, self.ratios)
+
+
+def _number(value):
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+
+
+def collect(data_dir=engine.DATA_DIR):
+    """从共享快照收集全部内功的阶段属性"""
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    rows, tiers, sects, stats, ratios, errors = [], [], [], [], [], []
+    for rel_path in engine.iter_data_files(data_dir):
+        if engine.category_of(rel_path) != "neigong":
+            continue
+        try:
+            if snapshot is not None:
+                data = snapshot.data(rel_path)
+            else:
+                data = engine.read_json(os.path.join(data_dir, rel_path))
+        except (ValueError, OSError) as e:
+            errors.append((rel_path, str(e)))
+            continue
+        if not isinstance(data, list):
+            continue
+        for item_index, item in enumerate(data):
+            system = item.get("system") if isinstance(item, dict) else None
+            if not isinstance(system, dict):
+                continue
+            config = system.get("config") if isinstance(system.get("config"), dict) else {}
+            item_stats, item_ratios = [], []
+            for stage in STAGES:
+                stage_config = config.get(stage) if isinstance(config.get(stage), dict) else {}
+                block = stage_config.get("stats") if isinstance(stage_config.get("stats"), dict) else {}
+                item_stats.append([_number(block.get(stat)) for stat in STATS])
+                item_ratios.append(_number(stage_config.get("xpCostRatio")))
+            rows.append((rel_path, item_index, item.get("name")))
+            tiers.append(system.get("tier") if isinstance(system.get("tier"), int) else 0)
+            sects.append(system.get("sect") or "")
+            stats.append(item_stats)
+            ratios.append(item_ratios)
+    return StageMatrix(rows, tiers, sects, stats, ratios, errors)
+
+
+def base_thresholds(path=NEIGONG_MODEL):
+    """neigong.mjs 中的 BASE_THRESHOLDS，{品阶: [领悟, 小成, 圆满]}"""
+    return {int(tier): values for tier, values in read_literal(path, "BASE_THRESHOLDS").items()}
+
+
+def compute_thresholds(tiers, ratios, base):
+    """
+    向量化计算各内功的累积门槛，形状 (n, 3)，与 neigong.mjs 的 stageThresholds 一致：
+    各阶段增量乘以对应系数后累加，再取整
+    """
+    raw = np.zeros((len(tiers), len(STAGES)))
+    for tier, values in base.items():
+        raw[tiers == tier] = values
+    steps = np.diff(raw, axis=1, prepend=0)
+    return np.floor(np.cumsum(steps * ratios, axis=1))
+
+
+def check_missing(table):
+    return np.flatnonzero(np.isnan(table.stats).any(axis=(1, 2)))
+
+
+def check_monotonic(table):
+    """返回 (问题行号, 形状 (n, 2, 6) 的降低标记)"""
+    drops = np.diff(table.stats, axis=1) < 0
+    return np.flatnonzero(drops.any(axis=(1, 2))), drops
+
+
+def stage_totals(table):
+    """各阶段属性总和，缺少属性时为 NaN"""
+    return table.stats.sum(axis=2)
+
+
+def expected_totals(table, totals):
+    """{品阶: 各阶段最常见的总和}，只统计属性完整的内功"""
+    expected = {}
+    complete = ~np.isnan(totals).any(axis=1)
+    for tier in np.unique(table.tiers).tolist():
+        group = totals[complete & (table.tiers == tier)]
+        if len(group):
+            values, counts = np.unique(group, axis=0, return_counts=True)
+            expected[tier] = values[np.argmax(counts)]
+    return expected
+
+
+def check_budget(table):
+    """返回 (问题行号, 各阶段总和, 每行对应的主流总和)"""
+    totals = stage_totals(table)
+    expected = np.full_like(totals, np.nan)
+    for tier, values in expected_totals(table, totals).items():
+        expected[table.tiers == tier] = values
+    differs = (totals != expected) & ~np.isnan(totals) & ~np.isnan(expected)
+    return np.flatnonzero(differs.any(axis=1)), totals, expected
+
+
+def check_ratio(table):
+    bad = (table.ratios <= 0) | (table.ratios > 1)
+    return np.flatnonzero(bad.any(axis=1))
+
+
+def _plain(values):
+    return [int(v) if float(v).is_integer() else float(v) for v in values]
+
+
+def _format_stats(values):
+    return "/".join("?" if np.isnan(v) else f"{v:g}" for v in values)
+
+
+def validate(table, checks=CHECKS):
+    findings = [{"kind": "error", "file": rel_path, "item": None, "reason": reason}
+                for rel_path, reason in table.errors]
+
+    def report(kind, rows, reason):
+        for row in np.unique(rows).tolist():
+            rel_path, _, name = table.rows[row]
+            findings.append({"kind": kind, "file": rel_path, "item": name, "reason": reason(row)})
+
+    if "missing" in checks:
+        def missing_reason(row):
+            parts = []
+            for s, label in enumerate(STAGE_LABELS):
+                absent = [STATS[k] for k in np.flatnonzero(np.isnan(table.stats[row, s]))]
+                if len(absent) == len(STATS):
+                    parts.append(f"{label}阶段无属性配置")
+                elif absent:
+                    parts.append(f"{label}阶段缺少 {', '.join(absent)}")
+            return "；".join(parts)
+        report("missing", check_missing(table), missing_reason)
+    if "monotonic" in checks:
+        bad, drops = check_monotonic(table)
+
+        def monotonic_reason(row):
+            parts = []
+            for k in np.flatnonzero(drops[row].any(axis=0)):
+                parts.append(f"{STATS[k]} {_format_stats(table.stats[row, :, k])}")
+            return f"属性在后一阶段降低: {', '.join(parts)}"
+        report("monotonic", bad, monotonic_reason)
+    if "budget" in checks:
+        bad, totals, expected = check_budget(table)
+        report("budget", bad, lambda row: f"品阶 {table.tiers[row]} 阶段属性总和 {_format_stats(totals[row])}，"
+                                           f"同品阶通常为 {_format_stats(expected[row])}")
+    if "ratio" in checks:
+        report("ratio", check_ratio(table),
+               lambda row: f"xpCostRatio {_format_stats(table.ratios[row])} 不在 (0, 1] 范围内")
+    return findings
+
+
+def threshold_table(table, base):
+    """{"品阶|系数1|系数2|系数3": [门槛]}"""
+    ratios = table.effective_ratios()
+    thresholds = compute_thresholds(table.tiers, ratios, base)
+    entries = {}
+    for row in range(len(table)):
+        # 与 JS 的数字格式一致：整数不带小数点 (1 而不是 1.0)
+        key = "|".join(str(v) for v in [int(table.tiers[row])] + _plain(ratios[row]))
+        entries[key] = [int(v) for v in thresholds[row]]
+    return dict(sorted(entries.items()))
+
+
+def stage_matrix(table):
+    """门派 × 品阶 × 阶段 × 属性 的平均值矩阵 (NaN 输出为 null)"""
+    tier_values = sorted(t for t in np.unique(table.tiers).tolist() if t > 0)
+    shape = (len(table.sect_names), len(tier_values), len(STAGES), len(STATS))
+    sums = np.zeros(shape)
+    counts = np.zeros(shape)
+    tier_index = np.searchsorted(tier_values, table.tiers)
+    valid = np.isin(table.tiers, tier_values)
+    present = ~np.isnan(table.stats[valid])
+    np.add.at(sums, (table.sects[valid], tier_index[valid]), np.where(present, table.stats[valid], 0))
+    np.add.at(counts, (table.sects[valid], tier_index[valid]), present)
+    with np.errstate(invalid="ignore"):
+        means = np.round(sums / counts, 2)
+    items = np.zeros(shape[:2], dtype=np.int64)
+    np.add.at(items, (table.sects[valid], tier_index[valid]), 1)
+
+    def nested(values):
+        if isinstance(values, list):
+            return [nested(v) for v in values]
+        return None if np.isnan(values) else (int(values) if float(values).is_integer() else values)
+
+    return {
+        "sects": table.sect_names,
+        "tiers": tier_values,
+        "stages": list(STAGES),
+        "stats": list(STATS),
+        "counts": items.tolist(),
+        "mean": nested(means.tolist()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="内功阶段属性的向量化校验")
+    parser.add_argument("--only", nargs="+", choices=CHECKS, metavar="CHECK",
+                        help=f"只执行指定的检查 ({', '.join(CHECKS)})，默认全部")
+    parser.add_argument("--write", action="store_true",
+                        help=f"写出 {MATRIX_PATH}")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    if np is None:
+        parser.exit(1, "❌ 需要 numpy: pip install numpy\n")
+
+    changes = since.resolve_since(args.since)
+    start = time.perf_counter()
+    table = collect()
+    loaded = time.perf_counter()
+    findings = validate(table, args.only or CHECKS)
+    checked = time.perf_counter()
+    if changes is not None:
+        selected = set(changes.data_files())
+        findings = [issue for issue in findings if issue["file"] in selected]
+
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item") if issue.get(k))
+        print(f"[{issue['kind']}] {location} | {issue['reason']}")
+    print(f"\n📊 {len(table)} 部内功 ({len(table.sect_names)} 个门派，读取 {(loaded - start) * 1000:.0f} ms，"
+          f"校验 {(checked - loaded) * 1000:.1f} ms)，发现 {len(findings)} 个问题")
+
+    if args.write and table.errors:
+        print("⚠️  有文件无法读取，矩阵不完整，不写输出")
+    elif args.write and changes is None:
+        matrix = stage_matrix(table)
+        matrix["thresholds"] = threshold_table(table, base_thresholds())
+        if serialize.write_json(MATRIX_PATH, matrix):
+            print(f"💾 [保存] 阶段属性矩阵: {MATRIX_PATH}")
+    elif args.write:
+        print("⚠️  --since 时只报告问题，不写输出")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+合集包差异与最小变更集
+
+对比两个版本的 data/ (默认：HEAD 与当前工作区)，分别用 packs.py 构建合集包文档，
+再按物品 / 招式 / 特效 / 脚本逐级比较，输出每个合集包的 create / update / delete 操作。
+游戏内用 SeedingManager.applyChangeset() 导入，只改动真正变化的文档，不再全量重置。
+
+文档按 _id 匹配 (见 stable_ids pass)；没有 _id 时按 "文件夹/名称#序号" 匹配。
+两个版本都使用当前的 seed-*.mjs 转换规则，差异只来自数据本身。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.packdiff                    # HEAD -> 工作区
+    python -m xjzl_tools.packdiff --base v0.6.0      # 指定基准版本
+    python -m xjzl_tools.packdiff --base A --head B  # 两个提交之间
+"""
+import argparse
+import os
+import tempfile
+from collections import Counter
+
+from . import engine, gitutil, packs, serialize
+
+DEFAULT_OUT = os.path.join(engine.ROOT_DIR, "build", "changeset.json")
+
+# 构建时缺少 id 的招式统一使用占位符，避免随机 ID 造成虚假差异
+MISSING_ID = ""
+
+
+def keyed(entries, id_field, label_of):
+    """
+    为一组条目生成匹配键：有 ID 用 ID，否则用 label#序号
+    返回有序字典 {键: 条目}
+    """
+    seen = Counter()
+    result = {}
+    for entry in entries:
+        entry_id = entry.get(id_field)
+        if entry_id:
+            result[entry_id] = entry
+            continue
+        label = label_of(entry)
+        seen[label] += 1
+        result[f"{label}#{seen[label]}"] = entry
+    return result
+
+
+def flat_diff(old, new, prefix="", out=None, skip=()):
+    """
+    比较两个字典，输出 Foundry update 所需的扁平化字段：{"system.price": 10, "system.-=foo": None}
+    列表视为整体，变化时整体替换
+    """
+    out = {} if out is None else out
+    for key, value in new.items():
+        path = f"{prefix}{key}"
+        if path in skip:
+            continue
+        if key not in old:
+            out[path] = value
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            flat_diff(old[key], value, f"{path}.", out, skip)
+        elif value != old[key]:
+            out[path] = value
+    for key in old:
+        path = f"{prefix}{key}"
+        if key not in new and path not in skip:
+            out[f"{prefix}-={key}"] = None
+    return out
+
+
+def diff_scripts(old_scripts, new_scripts):
+    """脚本按 trigger#序号 匹配，返回变化的脚本描述"""
+    old = keyed(old_scripts, None, lambda s: s.get("trigger", ""))
+    new = keyed(new_scripts, None, lambda s: s.get("trigger", ""))
+    changes = []
+    for key in new:
+        if key not in old:
+            changes.append(f"+{key}")
+        elif new[key] != old[key]:
+            changes.append(f"~{key}")
+    changes.extend(f"-{key}" for key in old if key not in new)
+    return changes
+
+
+def diff_moves(old_moves, new_moves):
+    """招式级差异 (仅用于报告；Foundry 中 system.moves 只能整体替换)"""
+    old = keyed(old_moves, "id", lambda m: m.get("name", ""))
+    new = keyed(new_moves, "id", lambda m: m.get("name", ""))
+    report = {"create": [], "update": {}, "delete": []}
+    for key, move in new.items():
+        if key not in old:
+            report["create"].append(move.get("name"))
+            continue
+        if move == old[key]:
+            continue
+        fields = sorted(flat_diff(old[key], move, skip=("scripts",)))
+        scripts = diff_scripts(old[key].get("scripts", []), move.get("scripts", []))
+        if scripts:
+            fields.append(f"scripts[{', '.join(scripts)}]")
+        report["update"][move.get("name")] = fields
+    report["delete"] = [old[key].get("name") for key in old if key not in new]
+    return {k: v for k, v in report.items() if v}
+
+
+def effect_label(effect):
+    return effect.get("name", "")
+
+
+def diff_effects(old_effects, new_effects):
+    """嵌入特效的 create / update / delete"""
+    old = keyed(old_effects, "_id", effect_label)
+    new = keyed(new_effects, "_id", effect_label)
+    ops = {"create": [], "update": [], "delete": []}
+    for key, effect in new.items():
+        if key not in old:
+            ops["create"].append(effect)
+        elif effect != old[key]:
+            update = flat_diff(old[key], effect)
+            ops["update"].append(dict(update, _id=effect.get("_id"), name=effect.get("name"), key=key))
+    for key, effect in old.items():
+        if key not in new:
+            ops["delete"].append({"_id": effect.get("_id"), "name": effect.get("name"), "key": key})
+    return {k: v for k, v in ops.items() if v}
+
+
+def document_label(doc):
+    return f"{doc.get('folder') or ''}/{doc.get('name', '')}"
+
+
+def diff_pack(old_pack, new_pack):
+    """单个合集包的变更集"""
+    old_docs = keyed(old_pack["documents"], "_id", document_label)
+    new_docs = keyed(new_pack["documents"], "_id", document_label)
+    changeset = {
+        "type": new_pack["type"],
+        "folders": [f for f in new_pack["folders"] if f not in old_pack["folders"]],
+        "create": [],
+        "update": [],
+        "delete": []
+    }
+
+    for key, doc in new_docs.items():
+        if key not in old_docs:
+            changeset["create"].append(doc)
+            continue
+        old = old_docs[key]
+        if doc == old:
+            continue
+
+        op = {"_id": doc.get("_id"), "name": doc.get("name"), "folder": doc.get("folder"), "key": key}
+        op["fields"] = flat_diff(old, doc, skip=("effects", "system.moves"))
+        old_moves = old.get("system", {}).get("moves", [])
+        new_moves = doc.get("system", {}).get("moves", [])
+        if old_moves != new_moves:
+            # system.moves 是数组字段，只能整体替换；moves 记录招式级别的变化供审阅
+            op["fields"]["system.moves"] = new_moves
+            op["moves"] = diff_moves(old_moves, new_moves)
+        effects = diff_effects(old.get("effects", []), doc.get("effects", []))
+        if effects:
+            op["effects"] = effects
+        changeset["update"].append(op)
+
+    for key, doc in old_docs.items():
+        if key not in new_docs:
+            changeset["delete"].append({"_id": doc.get("_id"), "name": doc.get("name"),
+                                        "folder": doc.get("folder"), "key": key})
+    return changeset
+
+
+def build_revision(ref, names, tmp_dir):
+    """构建某个版本的合集包；ref 为 None 表示当前工作区"""
+    data_dir = engine.DATA_DIR
+    if ref is not None:
+        data_dir = gitutil.export_tree(gitutil.resolve(ref), "data", os.path.join(tmp_dir, ref.replace("/", "_")))
+    built = packs.build_packs(names, data_dir=data_dir, id_factory=lambda: MISSING_ID)
+    return {name: pack.to_json() for name, pack in built.items()}
+
+
+def compute_changeset(base="HEAD", head=None, names=None):
+    names = names or packs.system_pack_names()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old = build_revision(base, names, tmp_dir)
+        new = build_revision(head, names, tmp_dir)
+    return {
+        "base": base,
+        "head": head or "working-tree",
+        "packs": {name: diff_pack(old[name], new[name]) for name in names}
+    }
+
+
+def summarize(changeset):
+    total = 0
+    for name, pack in changeset["packs"].items():
+        count = len(pack["create"]) + len(pack["update"]) + len(pack["delete"])
+        total += count
+        if not count:
+            continue
+        print(f"📦 {name}: +{len(pack['create'])} ~{len(pack['update'])} -{len(pack['delete'])}")
+        for doc in pack["create"]:
+            print(f"    + {document_label(doc)}")
+        for op in pack["update"]:
+            parts = [k for k in op["fields"] if k != "system.moves"]
+            for kind, entries in op.get("moves", {}).items():
+                if kind == "update":
+                    parts.extend(f"招式[{n}]: {', '.join(f)}" for n, f in entries.items())
+                else:
+                    parts.append(f"招式 {kind}: {', '.join(map(str, entries))}")
+            for kind, entries in op.get("effects", {}).items():
+                parts.append(f"特效 {kind}: {', '.join(str(e.get('name')) for e in entries)}")
+            print(f"    ~ {op['key']} | {'; '.join(parts)}")
+        for op in pack["delete"]:
+            print(f"    - {op['key']}")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成两个版本数据之间的合集包最小变更集")
+    parser.add_argument("packs", nargs="*", help="只比较指定合集包，默认全部")
+    parser.add_argument("--base", default="HEAD", help="基准版本 (git ref)，默认 HEAD")
+    parser.add_argument("--head", default=None, help="目标版本 (git ref)，默认当前工作区")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"变更集输出路径，默认 {DEFAULT_OUT}")
+    parser.add_argument("--pretty", action="store_true", help="以缩进格式输出 (默认压缩)")
+    args = parser.parse_args()
+
+    changeset = compute_changeset(args.base, args.head, args.packs)
+    total = summarize(changeset)
+    if not total:
+        print("✅ 两个版本之间没有文档变化。")
+
+    serialize.write_json(args.out, changeset, minify=not args.pretty)
+    print(f"💾 变更集 ({total} 个操作) 已写入: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,782 @@
+"""
+离线合集包构建：在 Python 中完成 module/utils/seeding/seed-*.mjs 的数据转换
+
+输出 build/packs/<合集包>.json，内容为可直接导入的文件夹与文档数据，
+游戏内的种子管理器 (SeedingManager.prebuilt) 只需读取并写入，不再逐条转换原始 JSON。
+
+转换规则与各 seed-*.mjs 保持一一对应 (包括 JS 的 || / ?? 取值语义)，
+门派映射、文件列表等配置直接从 .mjs 源码中解析，避免两处维护。
+用 python -m xjzl_tools.golden 与 JS 版本的输出逐字段对比。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.packs               # 构建 system.json 中的全部合集包
+    python -m xjzl_tools.packs wuxue neigong # 只构建指定合集包
+"""
+import argparse
+import json
+import os
+
+from . import corpus, engine, serialize, since
+from .ids import random_id
+from .jsliteral import read_literal
+
+SEEDING_DIR = os.path.join(engine.ROOT_DIR, "module", "utils", "seeding")
+CONFIG_PATH = os.path.join(engine.ROOT_DIR, "module", "config.mjs")
+LANG_PATH = os.path.join(engine.ROOT_DIR, "lang", "zh-cn.json")
+SYSTEM_JSON = os.path.join(engine.ROOT_DIR, "system.json")
+BUILD_DIR = os.path.join(engine.ROOT_DIR, "build", "packs")
+
+# seed-neigong.mjs 中江湖势力内功的分卷数 (jianghushili1.json ~ jianghushili4.json)
+NEIGONG_JIANGHU_VOLUMES = 4
+
+
+class _Undefined:
+    """对应 JS 的 undefined：序列化时该字段被省略 (与 JSON.stringify 一致)"""
+
+    def __repr__(self):
+        return "undefined"
+
+    def __bool__(self):
+        return False
+
+
+UNDEFINED = _Undefined()
+
+
+# ---------------------------------------------------------------------------
+# JS 取值语义
+# ---------------------------------------------------------------------------
+
+def get(obj, key):
+    """obj?.key：对象不存在或没有该字段时返回 UNDEFINED"""
+    if isinstance(obj, dict) and key in obj:
+        return obj[key]
+    return UNDEFINED
+
+
+def truthy(value):
+    """JS 的真值判断：[] 与 {} 为真，0 / "" / null / undefined / false 为假"""
+    if value is UNDEFINED or value is None or value is False:
+        return False
+    if isinstance(value, (int, float)) and value == 0:
+        return False
+    return value != ""
+
+
+def js_or(value, fallback):
+    """value || fallback"""
+    return value if truthy(value) else fallback
+
+
+def nullish(value, fallback):
+    """value ?? fallback"""
+    return fallback if value is UNDEFINED or value is None else value
+
+
+def is_array(value):
+    return isinstance(value, list)
+
+
+def js_string(value):
+    """String(value)"""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def prune(value):
+    """递归去除 UNDEFINED 字段，得到与 JSON.stringify 一致的结构"""
+    if isinstance(value, dict):
+        return {k: prune(v) for k, v in value.items() if v is not UNDEFINED}
+    if isinstance(value, list):
+        return [None if v is UNDEFINED else prune(v) for v in value]
+    return value
+
+
+# ---------------------------------------------------------------------------
+# 数据读取
+# ---------------------------------------------------------------------------
+
+def seeder_literal(file_name, name):
+    return read_literal(os.path.join(SEEDING_DIR, file_name), name)
+
+
+def load_array(rel_path, data_dir=engine.DATA_DIR):
+    """读取数据文件并保证为数组；文件不存在时返回 None (对应 fetch 失败被跳过)"""
+    path = os.path.join(data_dir, rel_path)
+    if not os.path.exists(path):
+        return None
+    data = corpus.read(rel_path, data_dir)
+    return data if isinstance(data, list) else [data]
+
+
+class PackSource:
+    """单个合集包的构建结果：文件夹列表 + 文档列表 (文档的 folder 字段为文件夹名称)"""
+
+    def __init__(self, name, doc_type="Item"):
+        self.name = name
+        self.type = doc_type
+        self.folders = []
+        self.documents = []
+
+    def add_folder(self, name, **extra):
+        self.folders.append(dict({"name": name, "type": self.type}, **extra))
+        return name
+
+    def to_json(self):
+        return prune({
+            "name": self.name,
+            "type": self.type,
+            "folders": self.folders,
+            "documents": self.documents
+        })
+
+
+def map_effect(e, icon, transfer_default, defaults=True):
+    """
+    各装备类 seeder 共用的 ActiveEffect 转换
+    defaults=False 对应 seed-consumables.mjs：changes / flags / description 原样透传
+    """
+    effect = {
+        "_id": get(e, "_id"),
+        "name": get(e, "name"),
+        "icon": icon,
+        "transfer": nullish(get(e, "transfer"), transfer_default),
+    }
+    if defaults:
+        effect["disabled"] = nullish(get(e, "disabled"), False)
+        effect["changes"] = js_or(get(e, "changes"), [])
+        effect["flags"] = js_or(get(e, "flags"), {})
+        effect["description"] = js_or(get(e, "description"), "")
+    else:
+        effect["changes"] = get(e, "changes")
+        effect["flags"] = get(e, "flags")
+        effect["description"] = get(e, "description")
+    effect.update({
+        "duration": js_or(get(e, "duration"), {}),
+        "statuses": js_or(get(e, "statuses"), []),
+        "tint": js_or(get(e, "tint"), None),
+        "origin": js_or(get(e, "origin"), None)
+    })
+    return effect
+
+
+def map_effects(d, icon_of, transfer_default, defaults=True):
+    effects = get(d, "effects")
+    if not truthy(effects):
+        return []
+    return [map_effect(e, icon_of(e), transfer_default, defaults) for e in effects]
+
+
+# ---------------------------------------------------------------------------
+# 各合集包 (与 seed-*.mjs 一一对应)
+# ---------------------------------------------------------------------------
+
+def build_origins(data_dir=engine.DATA_DIR, **_):
+    """seed-origins.mjs"""
+    icons = seeder_literal("seed-origins.mjs", "ICONS")
+    pack = PackSource("origins")
+    folder_p = pack.add_folder("性格特质")
+    folder_b = pack.add_folder("身世背景")
+
+    for d in load_array("personalities.json", data_dir) or []:
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "personality",
+            "img": icons["personality"],
+            "folder": folder_p,
+            "system": {
+                "description": get(d, "desc"),
+                "options": get(d, "options"),
+                "chosen": [],
+                "bonus": 2,
+                "presetKey": get(d, "id")
+            }
+        })
+
+    for d in load_array("backgrounds.json", data_dir) or []:
+        effects = []
+        modifiers = get(d, "modifiers")
+        if truthy(modifiers):
+            effects.append({
+                "name": "背景加成",
+                "icon": icons["ae"],
+                "transfer": True,
+                "changes": [{"key": k, "value": js_string(v), "mode": 2} for k, v in modifiers.items()],
+                "flags": {"xjzl-system": {"slug": "background-modifier", "stackable": False}}
+            })
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "background",
+            "img": icons["background"],
+            "folder": folder_b,
+            "system": {
+                "description": get(d, "desc"),
+                "assets": get(d, "assets")
+            },
+            "effects": effects
+        })
+    return pack
+
+
+def build_consumables(data_dir=engine.DATA_DIR, **_):
+    """seed-consumables.mjs"""
+    types = seeder_literal("seed-consumables.mjs", "types")
+    labels = seeder_literal("seed-consumables.mjs", "typeLabels")
+    pack = PackSource("consumables")
+    folders = {t: pack.add_folder(js_or(get(labels, t), t)) for t in types}
+
+    for t in types:
+        for d in load_array(f"consumables/{t}.json", data_dir) or []:
+            system = d["system"]
+            pack.documents.append({
+                "_id": get(d, "_id"),
+                "name": get(d, "name"),
+                "type": get(d, "type"),
+                "img": get(d, "img"),
+                "folder": js_or(get(folders, get(system, "type")), get(folders, "other")),
+                "system": {
+                    "quantity": get(system, "quantity"),
+                    "price": get(system, "price"),
+                    "quality": get(system, "quality"),
+                    "type": get(system, "type"),
+                    "description": get(system, "description"),
+                    "usageScript": get(system, "usageScript"),
+                    "automationNote": get(system, "automationNote"),
+                    "recovery": js_or(get(system, "recovery"), {"hp": 0, "mp": 0, "rage": 0})
+                },
+                "effects": map_effects(d, lambda e: get(e, "icon"), False, defaults=False)
+            })
+    return pack
+
+
+def localize(lang, key):
+    """按语言文件翻译 "XJZL.Arts.Duanzao" 这样的 key，找不到时原样返回"""
+    node = lang
+    for part in key.split("."):
+        if not isinstance(node, dict) or part not in node:
+            return key
+        node = node[part]
+    return node if isinstance(node, str) else key
+
+
+def build_artbooks(data_dir=engine.DATA_DIR, **_):
+    """seed-artbooks.mjs (文件夹名称按 XJZL.arts 与语言文件本地化)"""
+    arts = read_literal(CONFIG_PATH, "XJZL.arts")
+    lang = engine.read_json(LANG_PATH)
+
+    pack = PackSource("artbooks")
+    books = load_array("artbooks/artbooks.json", data_dir) or []
+    folders = {}
+    for d in books:
+        type_key = get(d["system"], "artType")
+        if type_key in folders:
+            continue
+        label = localize(lang, arts[type_key]) if truthy(get(arts, type_key)) else type_key
+        folders[type_key] = pack.add_folder(label, sorting="a")
+
+    for d in books:
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "art_book",
+            "img": get(d, "img"),
+            "folder": folders[get(d["system"], "artType")],
+            "system": d["system"]
+        })
+    return pack
+
+
+def build_misc(data_dir=engine.DATA_DIR, **_):
+    """seed-misc.mjs (没有文件夹)"""
+    pack = PackSource("misc")
+    for d in load_array("misc/misc.json", data_dir) or []:
+        system = get(d, "system")
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "misc",
+            "img": js_or(get(d, "img"), "icons/svg/item-bag.svg"),
+            "system": {
+                "quantity": nullish(get(system, "quantity"), 1),
+                "price": nullish(get(system, "price"), 0),
+                "quality": nullish(get(system, "quality"), 0),
+                "description": nullish(get(system, "description"), "")
+            },
+            "effects": []
+        })
+    return pack
+
+
+def build_armor(data_dir=engine.DATA_DIR, **_):
+    """seed-armor.mjs"""
+    types = seeder_literal("seed-armor.mjs", "types")
+    labels = seeder_literal("seed-armor.mjs", "typeLabels")
+    pack = PackSource("armor")
+    folders = {t: pack.add_folder(js_or(get(labels, t), t)) for t in types}
+
+    for t in types:
+        for d in load_array(f"armor/{t}.json", data_dir) or []:
+            system = d["system"]
+            pack.documents.append({
+                "_id": get(d, "_id"),
+                "name": get(d, "name"),
+                "type": "armor",
+                "img": get(d, "img"),
+                "folder": get(folders, get(system, "type")),
+                "system": {
+                    "type": get(system, "type"),
+                    "price": nullish(get(system, "price"), 0),
+                    "quality": nullish(get(system, "quality"), 0),
+                    "quantity": nullish(get(system, "quantity"), 1),
+                    "equipped": False,
+                    "description": js_or(get(system, "description"), ""),
+                    "automationNote": js_or(get(system, "automationNote"), ""),
+                    "scripts": js_or(get(system, "scripts"), [])
+                },
+                "effects": map_effects(d, lambda e: js_or(get(e, "icon"), get(d, "img")), True)
+            })
+    return pack
+
+
+def build_weapons(data_dir=engine.DATA_DIR, **_):
+    """seed-weapons.mjs"""
+    types = seeder_literal("seed-weapons.mjs", "types")
+    labels = seeder_literal("seed-weapons.mjs", "typeLabels")
+    pack = PackSource("weapons")
+    folders = {t: pack.add_folder(js_or(get(labels, t), t)) for t in types}
+
+    for t in types:
+        for d in load_array(f"weapons/{t}.json", data_dir) or []:
+            system = d["system"]
+            pack.documents.append({
+                "_id": get(d, "_id"),
+                "name": get(d, "name"),
+                "type": "weapon",
+                "img": get(d, "img"),
+                "folder": js_or(get(folders, get(system, "type")), None),
+                "system": {
+                    "equipped": False,
+                    "quantity": nullish(get(system, "quantity"), 1),
+                    "price": nullish(get(system, "price"), 0),
+                    "quality": nullish(get(system, "quality"), 0),
+                    "type": get(system, "type"),
+                    "subtype": js_or(get(system, "subtype"), ""),
+                    "damage": nullish(get(system, "damage"), 0),
+                    "block": nullish(get(system, "block"), 0),
+                    "scripts": js_or(get(system, "scripts"), []),
+                    "description": js_or(get(system, "description"), ""),
+                    "automationNote": js_or(get(system, "automationNote"), "")
+                },
+                "effects": map_effects(d, lambda e: js_or(get(e, "icon"), get(d, "img")), True),
+                "flags": js_or(get(d, "flags"), {})
+            })
+    return pack
+
+
+def build_qizhen(data_dir=engine.DATA_DIR, **_):
+    """seed-qizhen.mjs (按品质分文件夹)"""
+    labels = seeder_literal("seed-qizhen.mjs", "qualityLabels")
+    qualities = seeder_literal("seed-qizhen.mjs", "qualities")
+    pack = PackSource("qizhen")
+    folders = {js_string(q): pack.add_folder(labels[js_string(q)]) for q in qualities}
+
+    for d in load_array("qizhen/qizhen.json", data_dir) or []:
+        system = get(d, "system")
+        quality = nullish(get(system, "quality"), 0)
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "qizhen",
+            "img": get(d, "img"),
+            "folder": get(folders, js_string(quality)),
+            "system": {
+                "equipped": False,
+                "quantity": nullish(get(system, "quantity"), 1),
+                "price": nullish(get(system, "price"), 0),
+                "quality": quality,
+                "acupoint": "",
+                "scripts": js_or(get(system, "scripts"), []),
+                "description": js_or(get(system, "description"), ""),
+                "automationNote": js_or(get(system, "automationNote"), "")
+            },
+            "effects": map_effects(d, lambda e: js_or(get(e, "icon"), get(d, "img")), True),
+            "flags": js_or(get(d, "flags"), {})
+        })
+    return pack
+
+
+def active_sect_folders(pack, entries, sect_map):
+    """仅为有数据的门派创建文件夹 (顺序为首次出现的顺序)"""
+    folders = {}
+    for d in entries:
+        sect = d["system"]["sect"]
+        if sect not in folders:
+            folders[sect] = pack.add_folder(js_or(get(sect_map, sect), sect))
+    return folders
+
+
+def tag_sect(data_array, sect):
+    """如果 JSON 里没写 sect，用文件对应的门派补全"""
+    for d in data_array:
+        if not truthy(get(d, "system")):
+            d["system"] = {}
+        if not truthy(get(d["system"], "sect")):
+            d["system"]["sect"] = sect
+    return data_array
+
+
+def process_stage(stage):
+    """seed-neigong.mjs 的 processStage"""
+    if not truthy(stage):
+        return {}
+    scripts = get(stage, "scripts")
+    return {
+        "stats": js_or(get(stage, "stats"), {"liliang": 0, "shenfa": 0, "tipo": 0, "neixi": 0, "qigan": 0, "shencai": 0}),
+        "description": js_or(get(stage, "description"), ""),
+        "xpCostRatio": nullish(get(stage, "xpCostRatio"), 1),
+        "scripts": [{
+            "label": js_or(get(s, "label"), "阶段特效"),
+            "trigger": js_or(get(s, "trigger"), "passive"),
+            "script": js_or(get(s, "script"), ""),
+            "active": nullish(get(s, "active"), True)
+        } for s in scripts] if is_array(scripts) else []
+    }
+
+
+def neigong_files(sect_map):
+    for sect in sect_map:
+        if sect == "jianghushili":
+            for i in range(1, NEIGONG_JIANGHU_VOLUMES + 1):
+                yield sect, f"neigong/{sect}{i}.json"
+        else:
+            yield sect, f"neigong/{sect}.json"
+
+
+def build_neigong(data_dir=engine.DATA_DIR, **_):
+    """seed-neigong.mjs"""
+    sect_map = seeder_literal("seed-neigong.mjs", "SECT_MAP")
+    entries = []
+    for sect, rel_path in neigong_files(sect_map):
+        data_array = load_array(rel_path, data_dir)
+        if data_array is not None:
+            entries.extend(tag_sect(data_array, sect))
+
+    pack = PackSource("neigong")
+    folders = active_sect_folders(pack, entries, sect_map)
+
+    for d in entries:
+        system = d["system"]
+        config = get(system, "config")
+        mastery_changes = get(system, "masteryChanges")
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "neigong",
+            "img": get(d, "img"),
+            "folder": folders[system["sect"]],
+            "system": {
+                "tier": nullish(get(system, "tier"), 1),
+                "element": js_or(get(system, "element"), "taiji"),
+                "sect": js_or(get(system, "sect"), "none"),
+                "description": js_or(get(system, "description"), ""),
+                "requirement": js_or(get(system, "requirement"), ""),
+                "automationNote": js_or(get(system, "automationNote"), ""),
+                "config": {
+                    "stage1": process_stage(get(config, "stage1")),
+                    "stage2": process_stage(get(config, "stage2")),
+                    "stage3": process_stage(get(config, "stage3"))
+                },
+                "masteryEffect": js_or(get(system, "masteryEffect"), ""),
+                "masteryChanges": mastery_changes if is_array(mastery_changes) else [],
+                "xpInvested": 0,
+                "active": False,
+                "sourceBreakdown": {"general": 0, "specific": 0}
+            },
+            "effects": map_effects(d, lambda e: js_or(get(e, "icon"), get(d, "img")), False)
+        })
+    return pack
+
+
+def wuxue_files(sect_map, multi_file_config, extra_files):
+    """seed-wuxue.mjs 的文件加载顺序"""
+    for sect in sect_map:
+        files = []
+        if truthy(get(multi_file_config, sect)):
+            files = list(multi_file_config[sect])
+        elif sect != "jianghushili":
+            files.append(sect)
+        # 借用“江湖势力”的循环，顺便把额外文件加载了
+        if sect == "jianghushili":
+            files.extend(extra_files)
+        for file_name in files:
+            yield sect, f"wuxue/{file_name}.json"
+
+
+def resolve_requirements(move_req, base_req):
+    """招式需求继承与拼接 (processMoves 中的核心逻辑)"""
+    if not move_req:
+        # 招式没写需求 -> 直接继承书本
+        return base_req
+    if move_req == base_req:
+        return move_req
+    # 检查子集是否已经包含了父集的内容（防止人工录入时已经手动拼接过了）
+    if base_req and base_req not in move_req:
+        return f"{base_req}；{move_req}"
+    return move_req
+
+
+def process_moves(raw_moves, book_reqs="", default_tier=None, id_factory=random_id):
+    """
+    seed-wuxue.mjs 的 processMoves：将 JSON 中的简略招式补全为 WuxueDataModel 的完整结构
+    招式 id 由 stable_ids pass 写入数据文件；id_factory 只为尚未运行该 pass 的新招式兜底
+    """
+    if not is_array(raw_moves):
+        return []
+
+    base_req = (book_reqs or "").strip()
+    moves = []
+    for m in raw_moves:
+        progression = get(m, "progression")
+        calculation = get(m, "calculation")
+        costs = get(m, "costs")
+        scripts = get(m, "scripts")
+        thresholds = get(progression, "customThresholds")
+        scalings = get(calculation, "scalings")
+
+        moves.append({
+            "id": m["id"] if truthy(get(m, "id")) else id_factory(),
+            "name": js_or(get(m, "name"), "新招式"),
+            "img": js_or(get(m, "img"), "icons/svg/sword.svg"),
+            "type": js_or(get(m, "type"), "real"),
+            "element": js_or(get(m, "element"), "none"),
+            "damageType": js_or(get(m, "damageType"), "none"),
+            "weaponType": js_or(get(m, "weaponType"), "none"),
+
+            "description": js_or(get(m, "description"), ""),
+            "range": js_or(get(m, "range"), "1米"),
+            "targetInfo": js_or(get(m, "targetInfo"), "单体"),
+            "actionCost": js_or(get(m, "actionCost"), "主要动作"),
+            "automationNote": js_or(get(m, "automationNote"), ""),
+            "requirements": resolve_requirements(js_or(get(m, "requirements"), "").strip(), base_req),
+
+            "isUltimate": js_or(get(m, "isUltimate"), False),
+            "actionType": js_or(get(m, "actionType"), "buff"),
+            "tier": nullish(nullish(get(m, "tier"), default_tier), None),
+
+            "level": 1,
+            "xpInvested": 0,
+            "xpCostRatio": nullish(get(m, "xpCostRatio"), 1),
+
+            "progression": {
+                "mode": js_or(get(progression, "mode"), "standard"),
+                "customThresholds": thresholds if is_array(thresholds) else [],
+                "mappedStage": nullish(get(progression, "mappedStage"), 0)
+            },
+
+            "sourceBreakdown": {"general": 0, "specific": 0},
+
+            "calculation": {
+                "base": js_or(get(calculation, "base"), 0),
+                "growth": js_or(get(calculation, "growth"), 0),
+                "scalings": scalings if is_array(scalings) else []
+            },
+
+            "costs": {
+                key: get(costs, key) if is_array(get(costs, key)) else []
+                for key in ("mp", "rage", "hp")
+            },
+
+            "scripts": [{
+                "label": js_or(get(s, "label"), "招式特效"),
+                "trigger": js_or(get(s, "trigger"), "hit"),
+                "script": js_or(get(s, "script"), ""),
+                "active": nullish(get(s, "active"), True)
+            } for s in scripts] if is_array(scripts) else []
+        })
+    return moves
+
+
+class SeedError(RuntimeError):
+    pass
+
+
+def map_wuxue_effect(d, e):
+    """武学特效转换，包含根目录 scripts 迁移到 flags 的自动修复"""
+    if truthy(get(e, "scripts")):
+        # 有 scripts 但连 flags 对象都没有，视为严重结构错误 (JS 版会中止导入)
+        if not truthy(get(e, "flags")):
+            raise SeedError(f"武学 [{get(d, 'name')}] 的特效 [{get(e, 'name')}] 在根目录定义了 scripts，但完全缺失 flags 字段。")
+        if not truthy(get(e["flags"], "xjzl-system")):
+            e["flags"]["xjzl-system"] = {}
+        e["flags"]["xjzl-system"]["scripts"] = e["scripts"]
+
+    return {
+        "_id": get(e, "_id"),
+        "name": get(e, "name"),
+        # 特效统一使用物品图标
+        "icon": get(d, "img"),
+        "transfer": nullish(get(e, "transfer"), False),
+        "disabled": nullish(get(e, "disabled"), False),
+        "changes": js_or(get(e, "changes"), []),
+        "flags": js_or(get(e, "flags"), {}),
+        "description": js_or(get(e, "description"), ""),
+        "duration": js_or(get(e, "duration"), {}),
+        "statuses": js_or(get(e, "statuses"), []),
+        "tint": js_or(get(e, "tint"), None),
+        "origin": js_or(get(e, "origin"), None)
+    }
+
+
+def build_wuxue(data_dir=engine.DATA_DIR, id_factory=random_id, **_):
+    """seed-wuxue.mjs"""
+    sect_map = seeder_literal("seed-wuxue.mjs", "SECT_MAP")
+    multi_file_config = seeder_literal("seed-wuxue.mjs", "MULTI_FILE_CONFIG")
+    extra_files = seeder_literal("seed-wuxue.mjs", "EXTRA_FILES")
+
+    entries = []
+    for sect, rel_path in wuxue_files(sect_map, multi_file_config, extra_files):
+        data_array = load_array(rel_path, data_dir)
+        if data_array is not None:
+            entries.extend(tag_sect(data_array, sect))
+
+    pack = PackSource("wuxue")
+    folders = active_sect_folders(pack, entries, sect_map)
+
+    for d in entries:
+        system = d["system"]
+        book_tier = get(system, "tier")
+        moves = process_moves(get(system, "moves"), nullish(get(system, "requirements"), ""),
+                              None if book_tier is UNDEFINED else book_tier, id_factory)
+
+        # 书本品阶：优先读取 JSON，否则取招式中最低的数字品阶，默认为 1
+        final_tier = book_tier
+        if final_tier is UNDEFINED or final_tier is None:
+            valid_tiers = [m["tier"] for m in moves
+                           if isinstance(m["tier"], (int, float)) and not isinstance(m["tier"], bool)]
+            final_tier = min(valid_tiers) if valid_tiers else 1
+
+        raw_effects = js_or(get(d, "effects"), js_or(get(system, "effects"), []))
+        item_scripts = get(system, "scripts")
+
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": "wuxue",
+            "img": get(d, "img"),
+            "folder": get(folders, system["sect"]),
+            "system": {
+                "category": js_or(get(system, "category"), "wuxue"),
+                "sect": js_or(get(system, "sect"), "none"),
+                "tier": final_tier,
+                "description": js_or(get(system, "description"), ""),
+                "requirements": js_or(get(system, "requirements"), ""),
+                "moves": moves,
+                "scripts": [{
+                    "label": get(s, "label"),
+                    "trigger": get(s, "trigger"),
+                    "script": get(s, "script"),
+                    "active": get(s, "active")
+                } for s in item_scripts] if is_array(item_scripts) else []
+            },
+            "effects": [map_wuxue_effect(d, e) for e in raw_effects]
+        })
+    return pack
+
+
+def build_macros(data_dir=engine.DATA_DIR, **_):
+    """seed-macros.mjs (author 由游戏内导入时填写为当前用户)"""
+    file_map = seeder_literal("seed-macros.mjs", "fileMap")
+    pack = PackSource("macros", "Macro")
+    entries = []
+    for file_name, folder_name in file_map.items():
+        for d in load_array(f"macros/{file_name}.json", data_dir) or []:
+            entries.append((d, folder_name))
+
+    folders = {}
+    for _, folder_name in entries:
+        if folder_name not in folders:
+            folders[folder_name] = pack.add_folder(folder_name)
+
+    for d, folder_name in entries:
+        pack.documents.append({
+            "_id": get(d, "_id"),
+            "name": get(d, "name"),
+            "type": js_or(get(d, "type"), "script"),
+            "img": js_or(get(d, "img"), "icons/svg/dice-target.svg"),
+            "command": get(d, "command"),
+            "folder": folders[folder_name],
+            "ownership": {"default": 2},
+            "flags": js_or(get(d, "flags"), {})
+        })
+    return pack
+
+
+BUILDERS = {
+    "origins": build_origins,
+    "consumables": build_consumables,
+    "artbooks": build_artbooks,
+    "misc": build_misc,
+    "armor": build_armor,
+    "weapons": build_weapons,
+    "qizhen": build_qizhen,
+    "neigong": build_neigong,
+    "wuxue": build_wuxue,
+    "macros": build_macros
+}
+
+
+def system_pack_names():
+    """system.json 中声明的合集包 (顺序与 SeedingManager.all 一致)"""
+    with open(SYSTEM_JSON, 'r', encoding='utf-8') as f:
+        return [p["name"] for p in json.load(f)["packs"]]
+
+
+def build_packs(names=None, data_dir=engine.DATA_DIR, id_factory=random_id):
+    """构建合集包，返回 {名称: PackSource}"""
+    names = names or system_pack_names()
+    missing = [n for n in names if n not in BUILDERS]
+    if missing:
+        raise KeyError(f"没有对应的构建函数: {', '.join(missing)}")
+    return {name: BUILDERS[name](data_dir=data_dir, id_factory=id_factory) for name in names}
+
+
+def write_pack(pack, out_dir=BUILD_DIR, minify=True):
+    """写出合集包 (默认压缩格式，内容未变化时不重写)"""
+    path = os.path.join(out_dir, f"{pack.name}.json")
+    serialize.write_json(path, pack.to_json(), minify=minify)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="离线构建合集包数据 (替代游戏内的逐条转换)")
+    parser.add_argument("packs", nargs="*", help="要构建的合集包名称，默认为 system.json 中的全部")
+    parser.add_argument("--out", default=BUILD_DIR, help=f"输出目录，默认 {BUILD_DIR}")
+    parser.add_argument("--pretty", action="store_true", help="以缩进格式输出 (默认压缩)")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    names = args.packs or system_pack_names()
+    changes = since.resolve_since(args.since)
+    if changes is not None:
+        names = [n for n in names if n in changes.touched_categories()]
+        if not names:
+            print("✅ 没有受影响的合集包，无需构建")
+            return
+
+    print(f"📦 开始构建合集包 -> {args.out}")
+    for name, pack in build_packs(names).items():
+        path = write_pack(pack, args.out, minify=not args.pretty)
+        print(f"  ✅ {name:<12} {len(pack.documents):>5} 个文档, {len(pack.folders):>3} 个文件夹 -> {os.path.basename(path)}")
+
+
+if __name__ == "__main__":
+    main()
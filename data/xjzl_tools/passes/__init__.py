@@ -0,0 +1,14 @@
+"""
+内置 pass 列表
+
+导入顺序即执行顺序：
+先整理特效结构 (脚本位置、change key)，再修复脚本内容，最后处理招式字段与检查。
+"""
+from . import ae_scripts
+from . import ae_keys
+from . import lint
+from . import wuxue_weapon
+from . import action_cost
+from . import cost_length
+from . import stable_ids
+from . import progression
@@ -0,0 +1,129 @@
+from .. import textscan
+from ..engine import register_pass
+
+# 1. 定义最终允许的标准动作列表
+VALID_ACTIONS = {
+    "主要动作",
+    "次要动作",
+    "蓄力动作",
+    "反应动作",
+    "全回合动作",
+    "简要动作",
+    "无"
+}
+
+# 2. 定义用于在 description 中搜索的关键词（不包含“无”）
+SEARCH_KEYWORDS = [
+    "主要动作",
+    "次要动作",
+    "蓄力动作",
+    "反应动作",
+    "全回合动作",
+    "简要动作"
+]
+textscan.register_keywords("action", SEARCH_KEYWORDS)
+
+# 3. 定义简称映射（用于补全）
+# 如果分割后剩下的是 key，则自动映射为 value
+SHORT_NAMES = {
+    "主要": "主要动作",
+    "次要": "次要动作",
+    "蓄力": "蓄力动作",
+    "反应": "反应动作",
+    "全回合": "全回合动作",
+    "简要": "简要动作"
+}
+
+
+def find_action_in_description(desc):
+    """
+    在描述文本中查找最早出现的动作关键词
+    """
+    if not desc or not isinstance(desc, str):
+        return None
+
+    # 与其他描述检查共用一次扫描 (textscan)，结果按文本缓存
+    hit = textscan.first(desc, "action")
+    return hit.keyword if hit else None
+
+
+def normalize_cost_string(raw_val):
+    """
+    清洗并规范化 actionCost 字符串
+    返回: (清洗后的值, 是否在白名单中)
+    """
+    if not isinstance(raw_val, str):
+        return "无", True  # 非字符串强制转无
+
+    # 1. 去掉 / 及其后面的内容，并去空格
+    clean_val = raw_val.split('/')[0].strip()
+
+    # 2. 如果已经在白名单里，直接返回
+    if clean_val in VALID_ACTIONS:
+        return clean_val, True
+
+    # 3. 尝试补全（例如 "主要" -> "主要动作"）
+    if clean_val in SHORT_NAMES:
+        return SHORT_NAMES[clean_val], True
+
+    # 4. 如果都不匹配（例如 "被动"），返回原始清洗值，标记为 False
+    return clean_val, False
+
+
+@register_pass("action_cost", categories=["wuxue"])
+def fix_action_cost(data, report):
+    """补全并规范化招式的 actionCost"""
+    # 兼容 List 或 Dict 根节点
+    if isinstance(data, list):
+        items_list = data
+    elif isinstance(data, dict):
+        items_list = [data]
+    else:
+        return
+
+    for item in items_list:
+        item_name = item.get("name", "未命名")
+        system = item.get("system", {})
+        if not isinstance(system, dict):
+            continue
+
+        moves = system.get("moves", [])
+        if not isinstance(moves, list):
+            continue
+
+        for i, move in enumerate(moves):
+            move_name = move.get("name", f"招式#{i+1}")
+            original_cost = move.get("actionCost")
+
+            new_cost = None
+            log_msg = ""
+
+            # 1. 缺少 actionCost 字段
+            if "actionCost" not in move:
+                found_action = find_action_in_description(move.get("description", ""))
+
+                if found_action:
+                    new_cost = found_action
+                    log_msg = f"缺少字段 -> 从描述提取: {new_cost}"
+                else:
+                    new_cost = "无"
+                    log_msg = "缺少字段 -> 描述未匹配 -> 设为: 无"
+
+            # 2. 存在 actionCost 字段，需要清洗
+            else:
+                processed_val, is_valid = normalize_cost_string(original_cost)
+
+                if is_valid:
+                    # 如果不一样才更新（例如 "主要/反应" -> "主要动作"）
+                    if processed_val != original_cost:
+                        new_cost = processed_val
+                        log_msg = f"规范化: '{original_cost}' -> '{new_cost}'"
+                elif original_cost != "无":
+                    # 不在白名单且无法补全（例如 "被动"），强制改为 "无"
+                    new_cost = "无"
+                    log_msg = f"非法值强制置空: '{original_cost}' -> '无'"
+
+            # --- 应用修改 ---
+            if new_cost is not None:
+                move["actionCost"] = new_cost
+                report.change(f"{item_name} - {move_name}: {log_msg}")
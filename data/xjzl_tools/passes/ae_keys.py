@@ -0,0 +1,59 @@
+from ..engine import register_pass
+
+# 不需要添加 system. 前缀的特殊根路径 (Foundry VTT 标准)
+# 如果 key 以这些开头，将忽略它
+EXCLUDED_PREFIXES = (
+    "system.",
+    "flags.",
+    "macro.",
+    "token.",
+    "actor."
+)
+
+
+def should_add_prefix(key):
+    """
+    判断是否需要添加 system. 前缀
+    """
+    if not key:
+        return False
+    # 如果已经以 system. 开头，或者以 flags. 等特殊根节点开头，则不修改
+    if key.startswith(EXCLUDED_PREFIXES):
+        return False
+    return True
+
+
+def traverse_and_fix(data, report):
+    """
+    递归遍历 JSON 数据结构
+    """
+    if isinstance(data, dict):
+        # 1. 检查是否存在 'changes' 字段 (ActiveEffect 的修改项)
+        if 'changes' in data and isinstance(data['changes'], list):
+            for change in data['changes']:
+                if isinstance(change, dict) and 'key' in change:
+                    original_key = change['key']
+
+                    if should_add_prefix(original_key):
+                        new_key = f"system.{original_key}"
+                        change['key'] = new_key
+                        report.change(f"Key: '{original_key}' -> '{new_key}'")
+
+        # 2. 递归遍历字典的其他键
+        for k, v in data.items():
+            # 【重要】严格跳过 masteryChanges，不进入该字段内部扫描
+            if k == 'masteryChanges':
+                continue
+
+            traverse_and_fix(v, report)
+
+    elif isinstance(data, list):
+        # 递归遍历列表中的每一项
+        for item in data:
+            traverse_and_fix(item, report)
+
+
+@register_pass("ae_keys")
+def fix_ae_keys(data, report):
+    """为 ActiveEffect changes[].key 补全 system. 前缀"""
+    traverse_and_fix(data, report)
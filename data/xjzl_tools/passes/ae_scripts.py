@@ -0,0 +1,85 @@
+import re
+
+from ..engine import register_pass
+
+
+def generate_slug(name):
+    """
+    将中文名称转换为拼音 slug (如 '威风' -> 'weifeng')
+    """
+    if not name:
+        return "unnamed_effect"
+
+    # pypinyin 只在确实需要生成 slug 时才导入，其他 pass 不依赖它
+    from pypinyin import lazy_pinyin
+
+    # 获取拼音列表
+    pinyin_list = lazy_pinyin(name)
+    slug = "".join(pinyin_list)
+
+    # 移除非字母数字字符，替换为空或是下划线
+    slug = re.sub(r'[^a-zA-Z0-9_]', '', slug)
+    return slug.lower()
+
+
+def fix_effect_object(effect, report):
+    """
+    修复单个 Effect 对象：将根目录的 scripts 移至 flags.xjzl-system.scripts
+    """
+    # 检查是否存在根目录的 scripts
+    if 'scripts' not in effect:
+        return
+
+    scripts_data = effect['scripts']
+    effect_name = effect.get('name', 'Unknown Effect')
+
+    # 1. 确保 flags 结构存在
+    if 'flags' not in effect:
+        effect['flags'] = {}
+
+    if 'xjzl-system' not in effect['flags']:
+        effect['flags']['xjzl-system'] = {}
+
+    sys_flags = effect['flags']['xjzl-system']
+
+    # 2. 检查或生成 Slug
+    if 'slug' not in sys_flags or not sys_flags['slug']:
+        new_slug = generate_slug(effect_name)
+        sys_flags['slug'] = new_slug
+        report.change(f"[{effect_name}] 生成 Slug: {new_slug}")
+
+    # 3. 移动 Scripts
+    # 通常错误的数据里 flags 里是没有 scripts 的，直接覆盖
+    sys_flags['scripts'] = scripts_data
+
+    # 4. 删除根目录 Scripts
+    del effect['scripts']
+
+    report.change(f"[{effect_name}] Scripts 移至 flags.xjzl-system.scripts")
+
+
+def traverse_and_fix(data, report):
+    """
+    递归遍历 JSON 数据，寻找 "effects" 数组
+    """
+    if isinstance(data, dict):
+        for key, value in data.items():
+            # 只有 key 是 "effects" 且 value 是列表时，才视为 Active Effects 列表
+            if key == "effects" and isinstance(value, list):
+                for effect in value:
+                    if isinstance(effect, dict):
+                        fix_effect_object(effect, report)
+
+            # 递归继续查找 (以防 Item 嵌套或其他结构)
+            elif isinstance(value, (dict, list)):
+                traverse_and_fix(value, report)
+
+    elif isinstance(data, list):
+        for item in data:
+            traverse_and_fix(item, report)
+
+
+@register_pass("ae_scripts")
+def fix_ae_scripts(data, report):
+    """将写错位置的特效 scripts 迁移到 flags.xjzl-system.scripts"""
+    traverse_and_fix(data, report)
@@ -0,0 +1,95 @@
+from ..engine import register_pass
+
+
+def calculate_next_value(values):
+    """
+    根据列表最后两个值计算等差数列的下一个值
+    """
+    if not isinstance(values, list) or len(values) < 2:
+        return None
+    # 确保列表里是数字
+    if not all(isinstance(x, (int, float)) for x in values):
+        return None
+
+    # 取最后两个数计算差值
+    last_val = values[-1]
+    prev_val = values[-2]
+
+    diff = last_val - prev_val
+    next_val = last_val + diff
+
+    # 保持类型一致（如果是整数就保持整数）
+    if isinstance(last_val, int) and isinstance(prev_val, int):
+        return int(next_val)
+    return next_val
+
+
+def resolve_move_tier(move, parent_tier):
+    """
+    优先读取招式(move)里的 tier，如果没有则使用父级(system)的 tier
+    """
+    move_specific_tier = move.get("tier")
+
+    if move_specific_tier is not None:
+        try:
+            return int(move_specific_tier)
+        except ValueError:
+            pass
+    return int(parent_tier)
+
+
+def target_cost_length(tier):
+    """Tier 3 需要 4 个数值，其他 Tier 需要 3 个"""
+    return 4 if tier == 3 else 3
+
+
+@register_pass("cost_length", categories=["wuxue"])
+def fix_cost_length(data, report):
+    """按品阶截断或补全招式 costs 数组"""
+    # 遍历最外层的列表 (武学列表)
+    if not isinstance(data, list):
+        return
+
+    for item in data:
+        system_data = item.get("system", {})
+
+        # 获取父级 Tier，默认1
+        parent_tier = system_data.get("tier", 1)
+        item_name = item.get("name", "未知武学")
+
+        for move in system_data.get("moves", []):
+            current_tier = resolve_move_tier(move, parent_tier)
+            target_len = target_cost_length(current_tier)
+
+            costs = move.get("costs", {})
+            move_name = move.get("name", "未知招式")
+
+            # 遍历 costs 下的所有消耗类型
+            for cost_type in list(costs.keys()):
+                values = costs[cost_type]
+
+                # 跳过非列表或空列表
+                if not isinstance(values, list):
+                    continue
+
+                current_len = len(values)
+
+                # === 情况 A: 数据过多，需要截断 ===
+                if current_len > target_len:
+                    costs[cost_type] = values[:target_len]
+                    report.change(f"[截断] {item_name}-{move_name} | {cost_type} | Tier:{current_tier} -> 目标长度:{target_len} | 原: {values} -> 新: {values[:target_len]}")
+
+                # === 情况 B: 数据过少，需要补全 (只要>=2个就能补) ===
+                elif target_len > current_len >= 2:
+                    # 循环补全直到达到目标长度
+                    temp_values = list(values)
+                    while len(temp_values) < target_len:
+                        next_val = calculate_next_value(temp_values)
+                        if next_val is None:
+                            break
+                        temp_values.append(next_val)
+
+                    # 只有当成功补全到目标长度才应用修改
+                    if len(temp_values) == target_len:
+                        costs[cost_type] = temp_values
+                        report.change(f"[补全] {item_name}-{move_name} | {cost_type} | Tier:{current_tier} -> 目标长度:{target_len} | 原: {values} -> 新: {temp_values}")
@@ -0,0 +1,27 @@
+from .. import lint, scripts
+from ..engine import category_of, register_pass
+
+
+@register_pass("lint")
+def lint_scripts(data, report):
+    """对所有嵌入脚本执行 xjzl_tools/rules 中的规则：可修复的直接改写，其余报告为问题"""
+    rules = list(lint.load_rules().values())
+    category = category_of(report.rel_path)
+
+    for ref in scripts.iter_scripts(data):
+        issues = lint.lint_script(ref, category, rules)
+        if not issues:
+            continue
+
+        new_content, applied = lint.apply_fixes(ref.content, issues)
+        if applied:
+            scripts.set_content(ref, new_content)
+        where = " -> ".join(f"{label}: {name}" for label, name in
+                            (("物品", ref.item), ("招式", ref.move), ("特效", ref.effect)) if name)
+        for issue in issues:
+            if issue in applied:
+                report.change(f"{where} ({ref.trigger}) [{issue.rule}] 第 {issue.line} 行: {issue.message}")
+            else:
+                report.finding(file=report.file_name, item=ref.item, move=ref.move, trigger=ref.trigger,
+                               rule=issue.rule, line=issue.line,
+                               reason=f"[{issue.rule}] {ref.trigger} 脚本第 {issue.line} 行: {issue.message}")
@@ -0,0 +1,136 @@
+import re
+
+from .. import corpus, textscan
+from ..engine import register_pass
+
+# 增强版正则：同时匹配 "修为 1000" 和 "1000 修为"
+# group(1): 匹配 "修为 1000" 格式中的数字
+# group(2): 匹配 "1000 修为" 格式中的数字
+REGEX_PATTERN = r"(?:修为\s*[:：]?\s*(\d+))|(\d+)\s*(?:点)?\s*修为"
+CULTIVATION_RE = re.compile(REGEX_PATTERN)
+textscan.register_keywords("cultivation", ["修为"])
+
+
+def strip_html(text):
+    """简单的去HTML标签函数 (描述文本的纯文本已在 corpus 快照中预先计算)"""
+    return corpus.plain_text(text)
+
+
+def find_cultivation_nums(text):
+    """
+    从文本中提取大于等于100的修为数值
+    返回: list of ints
+    """
+    # 每个匹配都包含 "修为"：共享扫描中没有 "修为" 的文本 (绝大多数) 不必再运行正则
+    if textscan.first(text, "cultivation") is None:
+        return []
+
+    clean_text = strip_html(text)
+    nums = []
+
+    for match in CULTIVATION_RE.finditer(clean_text):
+        # group(1) 是 "修为 1000", group(2) 是 "1000 修为"
+        num_str = match.group(1) if match.group(1) else match.group(2)
+        if not num_str:
+            continue
+
+        number = int(num_str)
+
+        # 过滤小数字，只关注 >= 100 的门槛
+        if number >= 100:
+            nums.append(number)
+
+    return nums
+
+
+def check_move_progression(move_data, system_reqs):
+    """
+    检查单个招式的数据一致性
+    :param system_reqs: 顶层 item.system.requirements 的文本
+    返回: (错误原因, 检测到的数值) 或 None
+    """
+    # === 1. 收集所有可能的文本源 ===
+    # 构造检查队列：(来源名称, 文本内容)
+    sources = [
+        ("招式描述", move_data.get('description', '')),
+        ("招式需求", move_data.get('requirements', '')),
+        ("系统总需求", system_reqs)
+    ]
+
+    found_info = []  # 存储 (来源, 数值)
+    all_found_nums = set()  # 用于后续判断是否为空
+
+    # === 2. 遍历所有文本源查找数值 ===
+    for source_name, text in sources:
+        nums = find_cultivation_nums(text)
+        if nums:
+            found_info.append(f"{source_name}:{nums}")
+            all_found_nums.update(nums)
+
+    # 如果所有地方都没找到修为要求，直接跳过
+    if not all_found_nums:
+        return None
+
+    # === 3. 检查数据结构 ===
+    progression = move_data.get('progression', {})
+    mode = progression.get('mode', 'standard')
+    thresholds = progression.get('customThresholds', [])
+
+    # === 4. 判定逻辑 ===
+    # 只要检测到大额修为数字，我们严格要求必须是 custom 模式且有阈值
+    if mode != 'custom':
+        return f"检测到数值 {found_info}，但 mode='{mode}' (需改为 custom)", sorted(all_found_nums)
+    if not thresholds:
+        return f"检测到数值 {found_info}，但 customThresholds 为空", sorted(all_found_nums)
+
+    return None
+
+
+@register_pass("progression", kind="check", categories=["wuxue"])
+def check_progression(data, report):
+    """检查描述中的修为门槛与 progression.customThresholds 是否一致"""
+    items = data if isinstance(data, list) else [data]
+
+    for item in items:
+        item_name = item.get('name', '未命名物品')
+        system = item.get('system', {})
+
+        # 有些数据里 requirements 可能是 null，用 "" 兜底
+        system_reqs = system.get('requirements') or ""
+
+        for move in system.get('moves', []) or []:
+            result = check_move_progression(move, system_reqs)
+            if result:
+                reason, nums = result
+                report.finding(
+                    file=report.file_name,
+                    item=item_name,
+                    move=move.get('name', '未命名招式'),
+                    reason=reason,
+                    nums=nums
+                )
+
+
+def print_issues(issues):
+    """按表格格式输出检查结果"""
+    if not issues:
+        print("\n✅ 检查完成，未发现异常。")
+        return
+
+    print(f"\n⚠️  发现 {len(issues)} 个潜在的数据不一致：")
+    print("请检查下列招式：需补全 progression 字段。\n")
+
+    # 格式化输出表头
+    header = f"{'JSON文件':<20} | {'物品名称':<12} | {'招式名称':<12} | {'错误原因 (来源:数值)'}"
+    print(header)
+    print("-" * 100)
+
+    for issue in issues:
+        # 缩短一下文件名显示
+        f_name = issue['file']
+        if len(f_name) > 20:
+            f_name = f_name[:17] + "..."
+
+        print(f"{f_name:<20} | {issue['item']:<12} | {issue['move']:<12} | {issue['reason']}")
+
+    print("\n提示: 系统会自动扫描 Item.system.requirements、Move.requirements 和 Move.description。")
@@ -0,0 +1,76 @@
+from collections import Counter
+
+from ..engine import register_pass
+from ..ids import is_valid_id, stable_id
+
+
+class _Namer:
+    """同名条目按出现顺序编号 (第二个同名招式得到不同的 ID)"""
+
+    def __init__(self):
+        self.seen = Counter()
+
+    def key(self, name):
+        self.seen[name] += 1
+        return f"{name}#{self.seen[name]}"
+
+
+def assign(obj, field, derived, label, report, taken):
+    """
+    为 obj[field] 分配 ID：已有合法且不重复的 ID 保持不变，否则写入推导出的稳定 ID
+    """
+    current = obj.get(field)
+    if is_valid_id(current) and current not in taken:
+        taken.add(current)
+        return current
+
+    if current:
+        reason = "重复" if current in taken else "格式非法"
+        report.finding(reason=f"{label} 的 {field} '{current}' {reason}，已替换为稳定 ID")
+
+    obj[field] = derived
+    taken.add(derived)
+    report.change(f"{label}: {field} = {derived}")
+    return derived
+
+
+def item_effects(item):
+    """物品的特效列表 (兼容写在 system.effects 里的旧数据)"""
+    for container in (item, item.get("system")):
+        if isinstance(container, dict) and isinstance(container.get("effects"), list):
+            yield from container["effects"]
+
+
+# 不在默认集合中：会给全部数据写入 _id，只在需要时显式执行 python -m xjzl_tools.run stable_ids
+@register_pass("stable_ids", default=False)
+def assign_stable_ids(data, report):
+    """为物品、招式与特效写入由路径和名称推导的稳定 ID"""
+    items = data if isinstance(data, list) else [data]
+    item_namer = _Namer()
+    item_ids = set()
+
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        name = item.get("name", "")
+        item_key = item_namer.key(name)
+        item_id = assign(item, "_id", stable_id(report.rel_path, item.get("type", ""), item_key),
+                         f"[{name}]", report, item_ids)
+
+        move_namer = _Namer()
+        move_ids = set()
+        system = item.get("system")
+        moves = system.get("moves") if isinstance(system, dict) else None
+        for move in moves if isinstance(moves, list) else []:
+            move_name = move.get("name", "")
+            assign(move, "id", stable_id(item_id, "move", move_namer.key(move_name)),
+                   f"[{name}] 招式 [{move_name}]", report, move_ids)
+
+        effect_namer = _Namer()
+        effect_ids = set()
+        for effect in item_effects(item):
+            if not isinstance(effect, dict):
+                continue
+            effect_name = effect.get("name", "")
+            assign(effect, "_id", stable_id(item_id, "effect", effect_namer.key(effect_name)),
+                   f"[{name}] 特效 [{effect_name}]", report, effect_ids)
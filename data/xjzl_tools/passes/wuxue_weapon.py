@@ -0,0 +1,64 @@
+from ..engine import register_pass
+
+
+def process_moves(moves_list):
+    """
+    处理招式列表，返回是否进行了修改
+    """
+    if not moves_list:
+        return False
+
+    # --- 1. 第一步：寻找基准 weaponType ---
+    # 默认为 unarmed (都没写或全都没读取到)
+    target_weapon_type = "unarmed"
+
+    # 遍历寻找第一个有效的、非 none 的 weaponType
+    for move in moves_list:
+        wt = move.get("weaponType")
+        # 如果存在且不为 none，则认定为该武学的基准类型
+        if wt and wt != "none":
+            target_weapon_type = wt
+            break
+
+    # --- 2. 第二步：应用修改 ---
+    is_modified = False
+
+    for move in moves_list:
+        current_wt = move.get("weaponType")
+        move_type = move.get("type")
+
+        # 规则 1：如果没有 weaponType 字段，添加它
+        if "weaponType" not in move:
+            move["weaponType"] = target_weapon_type
+            is_modified = True
+
+        # 规则 2：如果是 qi (气招) 或 stance (架招)，且 weaponType 为 none，强制修改
+        elif move_type in ["qi", "stance"] and current_wt == "none":
+            move["weaponType"] = target_weapon_type
+            is_modified = True
+
+        # 其他情况（已有具体类型，或者非 qi/stance 招式的 none）不处理，保持原样
+
+    return is_modified
+
+
+@register_pass("wuxue_weapon", categories=["wuxue"])
+def fix_wuxue_weapon(data, report):
+    """统一武学招式的 weaponType"""
+    # 确保数据是个列表
+    if not isinstance(data, list):
+        return
+
+    for item in data:
+        # 严格检查 system.category 是否为 wuxue
+        # 只要 category 不是 wuxue，绝对不动
+        system_data = item.get("system", {})
+        if system_data.get("category") != "wuxue":
+            continue
+
+        moves = system_data.get("moves", [])
+        if not isinstance(moves, list):
+            continue
+
+        if process_moves(moves):
+            report.change(f"修正武学: {item.get('name', '未命名')} (兵器类型统一为: {moves[0].get('weaponType', 'unknown')})")
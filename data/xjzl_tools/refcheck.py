@@ -0,0 +1,179 @@
+"""
+引用完整性检查
+
+先一次性建立三类哈希集合索引，再对 data/ 的每个文件做一次遍历，每个引用都是 O(1) 查找：
+    assets      assets/ 目录下的全部文件 -> 检查 img / icon 等 systems/xjzl-system/... 路径是否存在
+    effects     每个物品导入合集包后会带上的特效名称 (与 seeder 的取法一致)
+                -> 检查脚本中 thisItem.effects.getName("X") 的 X 是否存在
+    sects       seed-wuxue.mjs / seed-neigong.mjs 中的 SECT_MAP -> 检查 system.sect 是否有对应门派
+
+数据从共享快照 (corpus.py) 读取，整个 data/ 的检查在一秒内完成。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.refcheck
+    python -m xjzl_tools.refcheck --only effects sects
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+from . import corpus, engine, packs, scripts, since
+
+SYSTEM_PREFIX = "systems/xjzl-system/"
+ASSETS_DIR = os.path.join(engine.ROOT_DIR, "assets")
+
+# 数据分类 -> 定义其 SECT_MAP 的 seeder
+SECT_SEEDERS = {
+    "wuxue": "seed-wuxue.mjs",
+    "neigong": "seed-neigong.mjs",
+}
+
+KINDS = ("assets", "effects", "sects")
+
+GET_NAME_RE = re.compile(r"""\bthisItem\s*\.\s*effects\s*\.\s*getName\(\s*(["'])(.*?)\1\s*\)""")
+
+
+class Indexes:
+    """检查前一次性建立的查找表"""
+
+    def __init__(self):
+        self.assets = set()
+        # 小写路径 -> 实际路径，用于提示大小写写错的引用
+        self.assets_lower = {}
+        self.sects = {}
+        for root, dirs, files in os.walk(ASSETS_DIR):
+            for file in files:
+                rel = os.path.relpath(os.path.join(root, file), engine.ROOT_DIR).replace(os.sep, "/")
+                self.assets.add(rel)
+                self.assets_lower[rel.lower()] = rel
+        for category, seeder in SECT_SEEDERS.items():
+            self.sects[category] = set(packs.seeder_literal(seeder, "SECT_MAP"))
+
+
+def seeded_effects(item, category):
+    """
+    物品经 seeder 导入后拥有的特效列表
+    武学的 seeder 使用 d.effects || d.system?.effects，其他 seeder 只读取 d.effects；
+    招式中的 effects 不会被导入
+    """
+    effects = packs.get(item, "effects")
+    if category == "wuxue" and not packs.truthy(effects):
+        effects = packs.get(packs.get(item, "system"), "effects")
+    return effects if isinstance(effects, list) else []
+
+
+def _stray_effects(node, path, seeded, out):
+    """收集不会被导入的特效 (写在招式或 system 中) 名称 -> 位置"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            sub = f"{path}.{key}"
+            if key == "effects" and isinstance(value, list) and value is not seeded:
+                for effect in value:
+                    if isinstance(effect, dict):
+                        out.setdefault(effect.get("name"), sub)
+            _stray_effects(value, sub, seeded, out)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            _stray_effects(value, f"{path}[{i}]", seeded, out)
+    return out
+
+
+def _check_paths(node, path, indexes, report):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            _check_paths(value, f"{path}.{key}", indexes, report)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            _check_paths(value, f"{path}[{i}]", indexes, report)
+    elif isinstance(node, str) and node.startswith(SYSTEM_PREFIX):
+        target = node[len(SYSTEM_PREFIX):]
+        if target.startswith("assets/") and target not in indexes.assets:
+            hint = indexes.assets_lower.get(target.lower())
+            reason = f"图片不存在: {node}" + (f" (大小写不符，实际为 {hint})" if hint else "")
+            report(path=path, reason=reason)
+
+
+def check_item(item, index, category, indexes, kinds, report):
+    name = item.get("name")
+
+    if "assets" in kinds:
+        _check_paths(item, f"[{index}]", indexes,
+                     lambda **f: report(kind="assets", item=name, **f))
+
+    if "effects" in kinds:
+        seeded = seeded_effects(item, category)
+        names = {e.get("name") for e in seeded if isinstance(e, dict)}
+        stray = None
+        for ref in scripts.iter_item_scripts(item, index):
+            for m in GET_NAME_RE.finditer(ref.content):
+                effect = m.group(2)
+                if effect in names:
+                    continue
+                if stray is None:
+                    stray = _stray_effects(item, f"[{index}]", seeded, {})
+                reason = f'脚本引用了物品上不存在的特效 "{effect}"'
+                if effect in stray:
+                    reason += f" (定义在 {stray[effect]}，seeder 不会导入)"
+                report(kind="effects", item=name, move=ref.move, path=ref.path, reason=reason)
+
+    if "sects" in kinds and category in indexes.sects:
+        sect = (item.get("system") or {}).get("sect")
+        if sect and sect not in indexes.sects[category]:
+            report(kind="sects", item=name,
+                   reason=f"门派 {sect!r} 不在 {SECT_SEEDERS[category]} 的 SECT_MAP 中")
+
+
+def check(kinds=KINDS, files=None, data_dir=engine.DATA_DIR):
+    """返回问题列表 (字典，字段同引擎的检查结果)；files 为 None 时检查全部文件"""
+    indexes = Indexes()
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    findings = []
+
+    for rel_path in engine.iter_data_files(data_dir) if files is None else files:
+        try:
+            if snapshot is not None:
+                data = snapshot.data(rel_path)
+            else:
+                data = engine.read_json(os.path.join(data_dir, rel_path))
+        except (ValueError, OSError) as e:
+            findings.append({"kind": "error", "file": rel_path, "reason": str(e)})
+            continue
+
+        category = engine.category_of(rel_path)
+
+        def report(**fields):
+            findings.append(dict(fields, file=rel_path))
+
+        items = data if isinstance(data, list) else [data]
+        for index, item in enumerate(items):
+            if isinstance(item, dict):
+                check_item(item, index, category, indexes, kinds, report)
+    return findings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="检查图片路径、脚本中的特效名称与门派 key 等引用是否有效")
+    parser.add_argument("--only", nargs="+", choices=KINDS, metavar="KIND",
+                        help=f"只执行指定的检查 ({', '.join(KINDS)})，默认全部")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    changes = since.resolve_since(args.since)
+    start = time.perf_counter()
+    findings = check(args.only or KINDS, changes.data_files() if changes else None)
+    elapsed = time.perf_counter() - start
+
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item", "move") if issue.get(k))
+        print(f"[{issue['kind']}] {location} | {issue['reason']}")
+    if findings:
+        print(f"\n⚠️  发现 {len(findings)} 个无效引用 ({elapsed:.2f}s)")
+    else:
+        print(f"✅ 未发现无效引用 ({elapsed:.2f}s)")
+    sys.exit(1 if findings else 0)
+
+
+if __name__ == "__main__":
+    main()
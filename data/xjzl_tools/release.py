@@ -0,0 +1,88 @@
+"""
+发布打包：生成游戏内读取的 build/ 产物，与仓库中的文件一起打成系统安装包
+
+build/ 由数据生成，不提交 (见 .gitignore)，但游戏内会读取其中的：
+    build/packs/<合集包>.json    种子管理器的预构建导入 (seed-prebuilt.mjs)
+    build/search-index.json      江湖万卷阁的预构建搜索索引 (compendium-browser.mjs)
+    build/changeset.json         种子管理器的变更集导入 (apply-changeset.mjs)，只在指定 --base 时生成
+这些文件只存在于本工具打出的安装包中；直接使用仓库源码时需先在本地运行 packs / searchindex / packdiff。
+
+安装包为 git archive 导出的 HEAD 加上以上产物。工作区有未提交的修改时拒绝打包，
+保证安装包中的产物与提交的数据一致。数据中有条目缺少稳定 ID 时同样拒绝打包
+(先运行 python -m xjzl_tools.run stable_ids 并提交)，否则这些条目每次导入都会得到新的随机 ID。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.release                    # 输出 build/xjzl-system.zip
+    python -m xjzl_tools.release --base v0.6.0      # 同时生成相对上一版本的变更集
+"""
+import argparse
+import io
+import os
+import zipfile
+
+from . import engine, gitutil, packdiff, packs, searchindex, serialize
+
+BUILD_ROOT = os.path.join(engine.ROOT_DIR, "build")
+DEFAULT_OUT = os.path.join(BUILD_ROOT, "xjzl-system.zip")
+
+
+def missing_ids():
+    """以 dry-run 方式执行 stable_ids pass，返回需要补写 ID 的文件列表"""
+    results = engine.run(pass_names=["stable_ids"], dry_run=True)
+    return [r.rel_path for r in results if r.modified or r.error]
+
+
+def build_artifacts(base=None):
+    """生成游戏内读取的产物，返回其绝对路径列表"""
+    paths = []
+    for name, pack in packs.build_packs().items():
+        paths.append(packs.write_pack(pack))
+        print(f"  ✅ {name:<12} {len(pack.documents):>5} 个文档 -> build/packs/{name}.json")
+
+    index = searchindex.build_index()
+    serialize.write_json(searchindex.DEFAULT_OUT, index, minify=True)
+    paths.append(searchindex.DEFAULT_OUT)
+    print(f"  ✅ 搜索索引{'' if index['pinyin'] else ' (未安装 pypinyin，不含拼音)'} -> build/search-index.json")
+
+    if base is not None:
+        changeset = packdiff.compute_changeset(base)
+        total = packdiff.summarize(changeset)
+        serialize.write_json(packdiff.DEFAULT_OUT, changeset, minify=True)
+        paths.append(packdiff.DEFAULT_OUT)
+        print(f"  ✅ 变更集 {base} -> HEAD ({total} 个操作) -> build/changeset.json")
+    return paths
+
+
+def package(paths, out):
+    """git archive 导出的 HEAD 加上 paths 中的产物 (保持相对仓库根目录的路径)"""
+    buffer = io.BytesIO(gitutil.git("archive", "--format=zip", "HEAD", binary=True))
+    with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED) as archive:
+        for path in paths:
+            archive.write(path, os.path.relpath(path, engine.ROOT_DIR).replace(os.sep, "/"))
+    serialize.write_bytes(out, buffer.getvalue())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成 build/ 产物并打包系统安装包")
+    parser.add_argument("--base", help="上一个发布版本 (git ref)，指定时同时生成变更集")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"安装包路径，默认 {DEFAULT_OUT}")
+    parser.add_argument("--allow-dirty", action="store_true", help="工作区有未提交的修改时仍然打包")
+    args = parser.parse_args()
+
+    dirty = gitutil.git("status", "--porcelain").strip()
+    if dirty and not args.allow_dirty:
+        parser.exit(1, f"❌ 工作区有未提交的修改，安装包中的产物会与提交不一致：\n{dirty}\n")
+
+    unstable = missing_ids()
+    if unstable:
+        listing = "\n".join(f"  {rel}" for rel in unstable)
+        parser.exit(1, f"❌ 以下文件有条目缺少稳定 ID，请先运行 python -m xjzl_tools.run stable_ids 并提交：\n{listing}\n")
+
+    print(f"📦 生成 build/ 产物 (HEAD {gitutil.resolve('HEAD')[:10]})")
+    paths = build_artifacts(args.base)
+    package(paths, args.out)
+    print(f"💾 安装包已写入: {args.out} ({os.path.getsize(args.out) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
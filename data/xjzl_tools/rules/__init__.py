@@ -0,0 +1,7 @@
+"""
+内置脚本规则列表 (见 xjzl_tools/lint.py)
+
+每个模块用 register_rule 注册一条或多条规则，导入顺序即报告顺序。
+"""
+from . import args_actor
+from . import computed_level
@@ -0,0 +1,11 @@
+from ..lint import Edit, Issue, register_rule
+
+
+@register_rule("args_actor", anchors=["actor"])
+def args_actor(ctx, i):
+    """脚本中的 args.actor 改为直接使用上下文变量 actor"""
+    # 只处理独立的 args.actor，不影响 args.actorData、foo.args.actor 以及字符串和注释
+    if not ctx.is_member(i, "args"):
+        return None
+    start = ctx.tokens[i - 2].start
+    return Issue("args_actor", start, "args.actor 应改为 actor", [Edit(start, ctx.tokens[i].end, "actor")])
@@ -0,0 +1,78 @@
+from ..lint import Edit, Issue, register_rule
+
+# 正确的代码块 (用于计算真实等级)
+# 注意：这里我们加上换行符，确保插入时格式整洁
+CORRECT_LOGIC_BLOCK = (
+    "// 获取当前架招等级\n"
+    "    const stanceId = actor.system.martial.stance;\n"
+    "    const moveData = thisItem.system.moves.find(m => m.id === stanceId);\n"
+    "    const lvl = Math.max(1, moveData?.computedLevel || 1);"
+)
+
+# 旧模板中的声明: const lvl = Math.max(1, [args.]move.computedLevel || 1);
+DECL_HEAD = ("const", "lvl", "=", "Math", ".", "max", "(", "1", ",")
+DECL_TAIL = ("move", ".", "computedLevel", "||", "1", ")", ";")
+
+
+def _reference_start(ctx, i):
+    """
+    第 i 个记号 (computedLevel) 是否为 move.computedLevel 或 args.move.computedLevel
+    是则返回整个引用的起始记号下标，否则返回 None
+    """
+    if not ctx.match(i - 2, ("move", ".")):
+        return None
+    if ctx.match(i - 4, ("args", ".")) and ctx.value(i - 5) not in (".", "?."):
+        return i - 4
+    if ctx.value(i - 3) in (".", "?."):
+        return None
+    return i - 2
+
+
+def _declarations(ctx):
+    """找出脚本中所有旧模板声明，返回 [(起始记号下标, 结束记号下标)]，每段脚本只扫描一次"""
+    if "decls" not in ctx.state:
+        decls = []
+        for k, tok in enumerate(ctx.tokens):
+            if tok.value != "const" or not ctx.match(k, DECL_HEAD):
+                continue
+            j = k + len(DECL_HEAD)
+            if ctx.match(j, ("args", ".")):
+                j += 2
+            if ctx.match(j, DECL_TAIL):
+                decls.append((k, j + len(DECL_TAIL) - 1))
+        ctx.state["decls"] = decls
+    return ctx.state["decls"]
+
+
+@register_rule("damaged_computed_level", anchors=["computedLevel"], triggers=["damaged"],
+               categories=["wuxue"], move_only=True, examples=[
+                   ("  const dmg = move.computedLevel * 2;",
+                    CORRECT_LOGIC_BLOCK + "\n\n    const dmg = lvl * 2;"),
+                   ("// 受伤时按招式等级反击\nconst dmg = move.computedLevel * 2;",
+                    CORRECT_LOGIC_BLOCK + "\n\n    // 受伤时按招式等级反击\nconst dmg = lvl * 2;"),
+               ])
+def damaged_computed_level(ctx, i):
+    """damaged 时机脚本不能使用 move.computedLevel (那是攻击方的招式)，改为读取当前架招等级"""
+    first = _reference_start(ctx, i)
+    if first is None:
+        return None
+    tokens = ctx.tokens
+    message = "damaged 脚本中的 move.computedLevel 应改为当前架招等级"
+
+    # 情况 A: 脚本里本来就定义了 const lvl = ... (旧模板)，直接把这一行替换成正确的逻辑块
+    decls = _declarations(ctx)
+    if decls:
+        for start, end in decls:
+            if start <= i <= end:
+                return Issue("damaged_computed_level", tokens[start].start, message,
+                             [Edit(tokens[start].start, tokens[end].end, CORRECT_LOGIC_BLOCK)])
+        return None
+
+    # 情况 B: 内联使用，把引用替换成 lvl，并在脚本开头插入一次 lvl 的定义
+    # 只替换开头的空白：记号不含注释，不能以第一个记号为界，否则会删掉开头的注释
+    edits = [Edit(tokens[first].start, tokens[i].end, "lvl")]
+    if not ctx.state.get("block_inserted"):
+        ctx.state["block_inserted"] = True
+        leading = len(ctx.source) - len(ctx.source.lstrip())
+        edits.insert(0, Edit(0, leading, CORRECT_LOGIC_BLOCK + "\n\n    "))
+    return Issue("damaged_computed_level", tokens[first].start, message, edits)
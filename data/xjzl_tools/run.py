@@ -0,0 +1,128 @@
+import argparse
+
+from . import engine, since
+from .corpus import Corpus
+from .manifest import Manifest
+
+
+def print_results(results):
+    """
+    按文件顺序输出每个 pass 的修改记录与检查结果
+    返回: (修改的文件数, 检查发现的问题列表)
+    """
+    modified_files = 0
+    findings = []
+
+    for result in results:
+        if result.error:
+            print(f"❌ [错误] {result.rel_path}: {result.error}")
+            continue
+
+        for report in result.reports:
+            for message in report.changes:
+                print(f"🔧 [{report.name}] {result.rel_path} | {message}")
+            for issue in report.findings:
+                findings.append(dict(issue, **{"pass": report.name}))
+
+        if result.modified:
+            modified_files += 1
+            if result.written:
+                print(f"💾 [保存] 已更新文件: {result.rel_path}")
+
+    return modified_files, findings
+
+
+def print_findings(findings):
+    if not findings:
+        return
+    print(f"\n⚠️  发现 {len(findings)} 个问题：")
+    for issue in findings:
+        location = " | ".join(str(issue[k]) for k in ("file", "item", "move") if issue.get(k))
+        print(f"[{issue['pass']}] {location} | {issue.get('reason', '')}")
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("必须是正整数")
+    return number
+
+
+def add_engine_arguments(parser):
+    """所有基于引擎的脚本共享的命令行参数"""
+    parser.add_argument("--dry-run", action="store_true", help="只报告修改，不写回文件")
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument("--files", nargs="+", metavar="PATH", help="只处理指定文件 (相对 data/ 的路径)")
+    since.add_since_argument(scope)
+    parser.add_argument("-j", "--jobs", type=positive_int, default=1, metavar="N",
+                        help="并行处理的进程数，默认 1 (串行)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="忽略内容 hash 清单，强制重新处理所有文件")
+    return parser
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="在 data/ 目录上执行注册的修复/检查 pass (每个文件只解析一次)")
+    parser.add_argument("passes", nargs="*", help="要执行的 pass 名称，默认执行除 stable_ids 等需指定的 pass 之外的全部")
+    parser.add_argument("--list", action="store_true", help="列出所有已注册的 pass")
+    return add_engine_arguments(parser)
+
+
+def run_engine(args, pass_names=None):
+    """
+    按命令行参数执行引擎
+    默认启用清单缓存：上次干净运行后未变化的文件直接回放结果
+    --since 时只处理相对该版本有变化的文件及其依赖
+    """
+    files = args.files
+    changes = since.resolve_since(getattr(args, "since", None))
+    if changes is not None:
+        files = changes.data_files()
+    manifest = None if args.no_cache else Manifest.load()
+    # 进程池模式下各子进程自行读取文件，快照只在串行模式使用
+    corpus = Corpus.load() if not args.no_cache and args.jobs <= 1 else None
+    results = engine.run(files=files, pass_names=pass_names, dry_run=args.dry_run,
+                         jobs=args.jobs, manifest=manifest, corpus=corpus)
+    if manifest is not None:
+        manifest.save()
+        cached = sum(1 for r in results if r.cached)
+        if cached:
+            print(f"♻️  {cached} 个文件未变化，已从清单回放结果")
+    return results
+
+
+def run_cli(pass_names=None, argv=None):
+    """
+    命令行入口，各旧脚本也通过它只执行自己的 pass
+    返回: FileResult 列表
+    """
+    args = build_parser().parse_args(argv)
+    names = pass_names or args.passes
+
+    if args.list:
+        for p in engine.select_passes(include_optional=True):
+            scope = "全部" if p.categories == engine.ALL else ", ".join(p.categories)
+            optional = "" if p.default else " (需按名称指定)"
+            print(f"{p.name:<18} [{p.kind}] ({scope}) {p.description}{optional}")
+        return []
+
+    passes = engine.select_passes(names)
+    print(f"📂 开始处理目录: {engine.DATA_DIR}")
+    print(f"🧩 执行 pass: {', '.join(p.name for p in passes)}")
+    print("-" * 60)
+
+    results = run_engine(args, names)
+    modified_files, findings = print_results(results)
+    print_findings(findings)
+
+    print("-" * 60)
+    print(f"✅ 处理完成。共扫描 {len(results)} 个 JSON 文件，修改 {modified_files} 个文件。")
+    return results
+
+
+def main():
+    run_cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+/* data/xjzl_tools/schema_harness.mjs */
+
+/**
+ * 在 Node 中加载 module/data/actor 下真实的数据模型，导出 Active Effect 可以修改的字段路径。
+ * 用最小化的 foundry.data.fields 桩记录 defineSchema() 的结构，按字段初始值构造 system 数据，
+ * 再执行 prepareBaseData() (AE 应用之前挂载的运行时字段)，最后列出所有叶子字段。
+ * 供 changekeys.py 建立字段路径 trie。
+ *
+ * 用法: node schema_harness.mjs
+ * 输出: { "actors": { 类型: { 路径: 值类型 } }, "flags": [ flags.xjzl-system 下的已知 flag ] }
+ */
+import { fileURLToPath, pathToFileURL } from "node:url";
+import path from "node:path";
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..", "..");
+
+// 与 xjzl-system.mjs 中 CONFIG.Actor.dataModels 的注册一致
+const ACTOR_MODELS = {
+    character: ["character.mjs", "XJZLCharacterData"],
+    npc: ["character.mjs", "XJZLCharacterData"],
+    creature: ["creature.mjs", "XJZLCreatureData"]
+};
+
+// 记录构造参数的字段桩：SchemaField(fields, options)、ArrayField(element, options)、其他 Field(options)
+const isPlainObject = value => value !== null && typeof value === "object" && value.constructor === Object;
+const fieldClasses = {};
+const makeFieldClass = kind => class {
+    constructor(...args) {
+        this.kind = kind;
+        if (kind === "SchemaField") {
+            this.fields = args[0];
+            this.options = args[1] ?? {};
+        } else {
+            this.options = [...args].reverse().find(isPlainObject) ?? {};
+        }
+    }
+};
+
+const { XJZL } = await import(pathToFileURL(path.join(ROOT, "module", "config.mjs")));
+globalThis.CONFIG = { XJZL };
+globalThis.foundry = {
+    abstract: {
+        TypeDataModel: class {
+            prepareBaseData() {}
+            prepareDerivedData() {}
+        }
+    },
+    data: {
+        fields: new Proxy(fieldClasses, { get: (target, kind) => target[kind] ??= makeFieldClass(kind) })
+    },
+    utils: { randomID: () => "" }
+};
+
+const DEFAULTS = {
+    NumberField: 0, StringField: "", HTMLField: "", BooleanField: false,
+    ArrayField: [], SetField: [], ObjectField: {}, TypedObjectField: {}
+};
+
+function initialValue(field) {
+    if (field.kind === "SchemaField") {
+        return Object.fromEntries(Object.entries(field.fields).map(([key, sub]) => [key, initialValue(sub)]));
+    }
+    const initial = field.options.initial;
+    if (typeof initial === "function") return initial();
+    if (initial !== undefined) return structuredClone(initial);
+    return structuredClone(DEFAULTS[field.kind] ?? null);
+}
+
+function collectPaths(node, prefix, out) {
+    for (const [key, value] of Object.entries(node)) {
+        const sub = prefix ? `${prefix}.${key}` : key;
+        if (isPlainObject(value) && Object.keys(value).length) collectPaths(value, sub, out);
+        else out[sub] = Array.isArray(value) ? "array" : value === null ? "null" : typeof value;
+    }
+    return out;
+}
+
+const actors = {};
+for (const [type, [file, className]] of Object.entries(ACTOR_MODELS)) {
+    const module = await import(pathToFileURL(path.join(ROOT, "module", "data", "actor", file)));
+    const Model = module[className];
+    const system = Object.create(Model.prototype);
+    Object.assign(system, initialValue({ kind: "SchemaField", fields: Model.defineSchema() }));
+    system.prepareBaseData();
+    actors[type] = collectPaths(system, "", {});
+}
+
+const flags = [...Object.keys(XJZL.statusFlags ?? {}), ...Object.keys(XJZL.checkFlags ?? {})];
+process.stdout.write(JSON.stringify({ actors, flags }));
@@ -0,0 +1,26 @@
+/* data/xjzl_tools/script_harness.mjs */
+
+/**
+ * 用 V8 真实的解析器检查嵌入脚本能否作为函数体编译。
+ * 与运行时一致：同步时机用 new Function，其余用 new AsyncFunction (actor.mjs 的 runScripts)。
+ * 只构造函数，不执行脚本。供 scriptcheck.py 使用。
+ *
+ * 用法: node script_harness.mjs < scripts.json
+ * 输入: [ { "hash": 内容 hash, "async": 是否异步, "source": 脚本 } ]
+ * 输出: { 内容 hash: 错误信息 }，只包含无法编译的脚本
+ */
+const AsyncFunction = Object.getPrototypeOf(async function () { }).constructor;
+
+let input = "";
+process.stdin.setEncoding("utf-8");
+for await (const chunk of process.stdin) input += chunk;
+
+const errors = {};
+for (const { hash, async: isAsync, source } of JSON.parse(input)) {
+    try {
+        isAsync ? new AsyncFunction(source) : new Function(source);
+    } catch (err) {
+        errors[hash] = `${err.name}: ${err.message}`;
+    }
+}
+process.stdout.write(JSON.stringify(errors));
@@ -0,0 +1,197 @@
+"""
+嵌入脚本的离线语法预检与脚本包
+
+提取 data/ 中的全部脚本 (scripts.py)，按运行时的方式检查能否编译为函数体：
+同步时机 (passive / calc / check) 对应 new Function，其余时机与 usageScript 对应 new AsyncFunction。
+检查由 script_harness.mjs 在 Node 中用 V8 解析器完成，结果按内容 hash 缓存在
+data/.xjzl_cache/scriptcheck.json，再次运行只检查新出现的脚本；没有 Node 时退回 jstokens 的词法检查
+(只能发现未闭合的字符串、注释与括号)。
+
+全部通过时输出 build/scripts/bundle.json：以脚本内容 sha1 为 key 的去重脚本包
+({hash: {source, async, triggers}})，供构建与发布流程使用。
+运行时 actor.mjs / item.mjs 通过 module/utils/script-cache.mjs 按内容缓存编译好的函数，同一段脚本只编译一次。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.scriptcheck
+    python -m xjzl_tools.scriptcheck --since origin/main     # 只检查有变化的文件，不输出脚本包
+    python -m xjzl_tools.scriptcheck --no-node               # 只做词法检查
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from . import corpus, engine, manifest, scripts, serialize, since
+from .jstokens import JSTokenizeError, line_of, tokenize
+
+HARNESS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "script_harness.mjs")
+CACHE_PATH = os.path.join(manifest.CACHE_DIR, "scriptcheck.json")
+BUNDLE_PATH = os.path.join(engine.ROOT_DIR, "build", "scripts", "bundle.json")
+BUNDLE_VERSION = 1
+
+# actor.mjs runScripts 中同步执行的时机 (不能 await)
+SYNC_TRIGGERS = ("passive", "calc", "check")
+
+
+def script_hash(source):
+    return engine.hash_bytes(source.encode("utf-8"))
+
+
+def is_async(trigger):
+    return trigger not in SYNC_TRIGGERS
+
+
+def collect(files=None, data_dir=engine.DATA_DIR):
+    """
+    返回 (脚本列表 [(rel_path, ScriptRef, hash)], 去重后的脚本 {(hash, 是否异步): source},
+          无法读取的文件 [(rel_path, 原因)])
+    同一段脚本可能同时用于同步和异步时机，两种编译方式分别检查
+    """
+    snapshot = corpus.shared() if data_dir == engine.DATA_DIR else None
+    refs = []
+    unique = {}
+    unreadable = []
+    for rel_path in engine.iter_data_files(data_dir) if files is None else files:
+        try:
+            data = snapshot.data(rel_path) if snapshot is not None else corpus.read(rel_path, data_dir)
+        except (ValueError, OSError) as e:
+            unreadable.append((rel_path, str(e)))
+            continue
+        for ref in scripts.iter_scripts(data):
+            if not ref.content.strip():
+                continue
+            digest = script_hash(ref.content)
+            refs.append((rel_path, ref, digest))
+            unique[(digest, is_async(ref.trigger))] = ref.content
+    return refs, unique, unreadable
+
+
+def _cache_key(digest, async_):
+    return f"{'async' if async_ else 'sync'}:{digest}"
+
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("harness") == _harness_hash():
+            return cached.get("results", {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _harness_hash():
+    with open(HARNESS, 'rb') as f:
+        return engine.hash_bytes(f.read())
+
+
+def check_with_node(pending):
+    """pending: {(hash, 是否异步): source}，返回 {(hash, 是否异步): 错误信息或 None}"""
+    payload = [{"hash": _cache_key(digest, async_), "async": async_, "source": source}
+               for (digest, async_), source in pending.items()]
+    proc = subprocess.run(["node", HARNESS], input=json.dumps(payload, ensure_ascii=False),
+                          capture_output=True, text=True, encoding="utf-8")
+    if proc.returncode != 0:
+        raise RuntimeError(f"script_harness.mjs 执行失败:\n{proc.stderr}")
+    errors = json.loads(proc.stdout)
+    return {key: errors.get(_cache_key(*key)) for key in pending}
+
+
+def check_with_tokens(pending):
+    """没有 Node 时的词法检查"""
+    results = {}
+    for key, source in pending.items():
+        try:
+            tokenize(source)
+            results[key] = None
+        except JSTokenizeError as e:
+            results[key] = f"{e} (第 {line_of(source, e.pos)} 行)"
+    return results
+
+
+def check(unique, use_node=True):
+    """
+    检查去重后的脚本，返回 ({(hash, 是否异步): 错误信息或 None}, 实际检查的数量, 检查方式)
+    Node 的结果写入缓存，词法检查的结果不缓存
+    """
+    if not use_node:
+        return check_with_tokens(unique), len(unique), "jstokens"
+
+    cache = load_cache()
+    results = {}
+    pending = {}
+    for key, source in unique.items():
+        cache_key = _cache_key(*key)
+        if cache_key in cache:
+            results[key] = cache[cache_key]
+        else:
+            pending[key] = source
+    if pending:
+        checked = check_with_node(pending)
+        results.update(checked)
+        cache.update({_cache_key(*key): error for key, error in checked.items()})
+        serialize.write_json(CACHE_PATH, {"harness": _harness_hash(), "results": cache}, minify=True)
+    return results, len(pending), "node"
+
+
+def build_bundle(refs):
+    """{hash: {source, async, triggers}}，key 有序，内容不变时输出的字节也不变"""
+    bundle = {}
+    for _, ref, digest in refs:
+        entry = bundle.setdefault(digest, {"source": ref.content, "async": False, "triggers": []})
+        trigger = ref.trigger or scripts.USAGE_TRIGGER
+        if trigger not in entry["triggers"]:
+            entry["triggers"].append(trigger)
+        entry["async"] = entry["async"] or is_async(trigger)
+    for entry in bundle.values():
+        entry["triggers"].sort()
+    return {"version": BUNDLE_VERSION, "scripts": dict(sorted(bundle.items()))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="检查嵌入脚本能否编译为函数体，并输出按内容 hash 去重的脚本包")
+    parser.add_argument("--no-node", action="store_true", help="不使用 Node，只做词法检查")
+    parser.add_argument("--bundle", default=BUNDLE_PATH, help=f"脚本包输出路径，默认 {BUNDLE_PATH}")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    changes = since.resolve_since(args.since)
+    start = time.perf_counter()
+    refs, unique, unreadable = collect(changes.data_files() if changes else None)
+    try:
+        results, checked, method = check(unique, use_node=not args.no_node)
+    except (OSError, RuntimeError) as e:
+        print(f"⚠️  无法使用 Node ({e})，改为词法检查")
+        results, checked, method = check(unique, use_node=False)
+    elapsed = time.perf_counter() - start
+
+    failed = 0
+    for rel_path, ref, digest in refs:
+        error = results.get((digest, is_async(ref.trigger)))
+        if error:
+            failed += 1
+            location = " | ".join(str(v) for v in (rel_path, ref.item, ref.move, ref.effect) if v)
+            print(f"[{ref.trigger or scripts.USAGE_TRIGGER}] {location} | {ref.label or ref.path} | {error}")
+
+    for rel_path, reason in unreadable:
+        print(f"[error] {rel_path} | {reason}")
+
+    print(f"\n📜 {len(refs)} 段脚本 (去重后 {len(unique)} 段)，本次检查 {checked} 段 ({method})，用时 {elapsed:.2f}s")
+    if failed or unreadable:
+        problems = [f"{failed} 段脚本无法编译"] if failed else []
+        problems += [f"{len(unreadable)} 个文件无法读取"] if unreadable else []
+        print(f"❌ {'，'.join(problems)}，未输出脚本包")
+        sys.exit(1)
+
+    if changes is None:
+        bundle = build_bundle(refs)
+        written = serialize.write_json(args.bundle, bundle, minify=True)
+        print(f"💾 脚本包 ({len(bundle['scripts'])} 段) {'已写入' if written else '未变化'}: {args.bundle}")
+    print("✅ 所有脚本均可编译")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+嵌入脚本的 SQLite 索引
+
+把 data/ 中每段脚本连同位置 (文件 / 物品 / 招式 / 特效 / 触发器) 与内容 hash
+存入 data/.xjzl_cache/scripts.sqlite，并建立全文索引 (FTS5 trigram，支持任意子串)。
+每次运行只重新索引 mtime / 大小 / 内容发生变化的文件。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.scriptindex                                  # 更新索引并输出统计
+    python -m xjzl_tools.scriptindex search move.computedLevel        # 全文搜索
+    python -m xjzl_tools.scriptindex search toObject --trigger calc --file "wuxue/*"
+    python -m xjzl_tools.scriptindex duplicates                       # 列出重复出现的相同脚本
+    python -m xjzl_tools.scriptindex --rebuild                        # 丢弃旧索引重新建立
+"""
+import argparse
+import json
+import os
+import sqlite3
+
+from . import engine, manifest, scripts
+
+INDEX_PATH = os.path.join(manifest.CACHE_DIR, "scripts.sqlite")
+
+# 表结构版本，变化时整个索引重建
+SCHEMA_VERSION = 1
+
+# trigram 分词至少需要 3 个字符，更短的关键词退回 LIKE 查询
+MIN_FTS_LENGTH = 3
+
+SCHEMA = """
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE scripts (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL,
+    item TEXT, item_id TEXT,
+    move TEXT, move_id TEXT,
+    effect TEXT, effect_id TEXT,
+    trigger TEXT, label TEXT, active INTEGER,
+    path TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX scripts_file ON scripts(file);
+CREATE INDEX scripts_trigger ON scripts(trigger);
+CREATE INDEX scripts_hash ON scripts(hash);
+CREATE VIRTUAL TABLE scripts_fts USING fts5(content, content='scripts', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER scripts_ai AFTER INSERT ON scripts BEGIN
+    INSERT INTO scripts_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER scripts_ad AFTER DELETE ON scripts BEGIN
+    INSERT INTO scripts_fts(scripts_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+"""
+
+
+def connect(path=INDEX_PATH, rebuild=False):
+    """打开索引数据库；表结构版本不一致或 rebuild=True 时重新建表"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if rebuild and os.path.exists(path):
+        os.remove(path)
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.close()
+        os.remove(path)
+        conn = sqlite3.connect(path)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def _index_file(conn, rel_path, raw):
+    data = json.loads(raw.decode("utf-8"))
+    rows = [
+        (rel_path, ref.item, ref.item_id, ref.move, ref.move_id, ref.effect, ref.effect_id,
+         ref.trigger, ref.label, int(bool(ref.active)), ref.path,
+         engine.hash_bytes(ref.content.encode("utf-8")), ref.content)
+        for ref in scripts.iter_scripts(data)
+    ]
+    conn.execute("DELETE FROM scripts WHERE file = ?", (rel_path,))
+    conn.executemany(
+        "INSERT INTO scripts (file, item, item_id, move, move_id, effect, effect_id, trigger, label, active, path, hash, content)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+    )
+    return len(rows)
+
+
+def update(conn, data_dir=engine.DATA_DIR):
+    """
+    增量更新索引，返回 {"indexed": [...], "removed": [...], "unchanged": N}
+    mtime 与大小未变的文件直接跳过；变了但内容 hash 相同的文件只更新记录的 stat
+    """
+    known = {row["path"]: row for row in conn.execute("SELECT * FROM files")}
+    stats = {"indexed": [], "removed": [], "unchanged": 0}
+
+    with conn:
+        present = set()
+        for rel_path in engine.iter_data_files(data_dir):
+            present.add(rel_path)
+            file_path = os.path.join(data_dir, rel_path)
+            st = os.stat(file_path)
+            row = known.get(rel_path)
+            if row and row["mtime_ns"] == st.st_mtime_ns and row["size"] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            digest = engine.hash_bytes(raw)
+            if not row or row["hash"] != digest:
+                try:
+                    _index_file(conn, rel_path, raw)
+                except ValueError as e:
+                    print(f"❌ 无法解析 {rel_path}: {e}")
+                    continue
+                stats["indexed"].append(rel_path)
+            else:
+                stats["unchanged"] += 1
+            conn.execute("INSERT OR REPLACE INTO files (path, hash, mtime_ns, size) VALUES (?, ?, ?, ?)",
+                         (rel_path, digest, st.st_mtime_ns, st.st_size))
+
+        for rel_path in known.keys() - present:
+            conn.execute("DELETE FROM scripts WHERE file = ?", (rel_path,))
+            conn.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+            stats["removed"].append(rel_path)
+    return stats
+
+
+def search(conn, text, trigger=None, file_glob=None, limit=None):
+    """按内容子串搜索脚本，可按触发器与文件 glob 过滤"""
+    if len(text) >= MIN_FTS_LENGTH:
+        sql = "SELECT s.* FROM scripts_fts JOIN scripts s ON s.id = scripts_fts.rowid WHERE scripts_fts MATCH ?"
+        params = ['"' + text.replace('"', '""') + '"']
+    else:
+        sql = "SELECT s.* FROM scripts s WHERE instr(lower(s.content), lower(?)) > 0"
+        params = [text]
+    if trigger:
+        sql += " AND s.trigger = ?"
+        params.append(trigger)
+    if file_glob:
+        sql += " AND s.file GLOB ?"
+        params.append(file_glob)
+    sql += " ORDER BY s.file, s.id"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return conn.execute(sql, params).fetchall()
+
+
+def duplicates(conn, min_count=2):
+    """内容完全相同的脚本分组 (按出现次数降序)"""
+    return conn.execute(
+        "SELECT hash, trigger, COUNT(*) AS n, MIN(content) AS content FROM scripts"
+        " GROUP BY hash HAVING n >= ? ORDER BY n DESC, hash", (min_count,)
+    ).fetchall()
+
+
+def location(row):
+    parts = [row["file"], row["item"] or "?"]
+    if row["move"]:
+        parts.append(f"招式[{row['move']}]")
+    if row["effect"]:
+        parts.append(f"特效[{row['effect']}]")
+    return " | ".join(parts)
+
+
+def first_matching_line(content, text):
+    lowered = text.lower()
+    for line in content.splitlines():
+        if lowered in line.lower():
+            return line.strip()
+    return ""
+
+
+def print_stats(conn, stats):
+    total = conn.execute("SELECT COUNT(*), COUNT(DISTINCT hash) FROM scripts").fetchone()
+    print(f"📚 索引: {total[0]} 段脚本 ({total[1]} 段内容不同)，"
+          f"本次重新索引 {len(stats['indexed'])} 个文件，移除 {len(stats['removed'])} 个，"
+          f"{stats['unchanged']} 个未变化")
+    for row in conn.execute("SELECT trigger, COUNT(*) AS n FROM scripts GROUP BY trigger ORDER BY n DESC"):
+        print(f"    {row['trigger'] or '-':<14}{row['n']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="嵌入脚本的 SQLite 全文索引")
+    parser.add_argument("--db", default=INDEX_PATH, help="索引数据库路径")
+    parser.add_argument("--rebuild", action="store_true", help="丢弃旧索引，全部重新建立")
+    sub = parser.add_subparsers(dest="command")
+
+    p_search = sub.add_parser("search", help="按内容子串搜索脚本")
+    p_search.add_argument("text", help="要搜索的文本 (不区分大小写)")
+    p_search.add_argument("--trigger", help="只看指定触发器，如 calc / hit")
+    p_search.add_argument("--file", help="文件 glob，如 'wuxue/*'")
+    p_search.add_argument("--limit", type=int, help="最多输出条数")
+    p_search.add_argument("--full", action="store_true", help="输出完整脚本内容")
+
+    p_dupes = sub.add_parser("duplicates", help="列出重复出现的相同脚本")
+    p_dupes.add_argument("--min", type=int, default=5, help="最少出现次数 (默认 5)")
+
+    args = parser.parse_args()
+
+    conn = connect(args.db, rebuild=args.rebuild)
+    stats = update(conn)
+
+    if args.command == "search":
+        rows = search(conn, args.text, args.trigger, args.file, args.limit)
+        for row in rows:
+            print(f"📄 {location(row)} | {row['trigger']} | {row['label'] or ''}")
+            if args.full:
+                print("    " + row["content"].replace("\n", "\n    "))
+            else:
+                print(f"    {first_matching_line(row['content'], args.text)}")
+        print(f"🔍 共 {len(rows)} 段脚本包含 {args.text!r}")
+    elif args.command == "duplicates":
+        rows = duplicates(conn, args.min)
+        for row in rows:
+            preview = row["content"].strip().splitlines()[0] if row["content"].strip() else ""
+            print(f"×{row['n']:<5} {row['trigger'] or '-':<12} {row['hash'][:10]}  {preview[:80]}")
+        print(f"🔁 共 {len(rows)} 组出现至少 {args.min} 次的相同脚本")
+    else:
+        print_stats(conn, stats)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+遍历数据中嵌入的 JS 脚本
+
+脚本分布在 system.moves[].scripts、system.scripts、system.config.stageN.scripts、
+(system.)effects[].flags.xjzl-system.scripts 以及消耗品的 system.usageScript 中。
+iter_scripts() 统一给出每段脚本的位置 (物品 / 招式 / 特效 / 触发器 / JSON 路径)，
+各工具不必再各自写一遍递归遍历。
+"""
+from collections import namedtuple
+
+from . import corpus, engine
+
+# usageScript 没有 trigger 字段，统一记为 usage
+USAGE_TRIGGER = "usage"
+
+ScriptRef = namedtuple("ScriptRef", [
+    "item", "item_id", "move", "move_id", "effect", "effect_id",
+    "trigger", "label", "active", "path", "content", "holder"
+])
+ScriptRef.__doc__ = """
+一段嵌入脚本
+holder 为脚本所在的 dict (scripts 数组中的元素，或含 usageScript 的 system)，可用于原地修改
+"""
+
+
+def _walk(node, path, ctx, out):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            sub = f"{path}.{key}"
+            if key == "scripts" and isinstance(value, list):
+                for i, script in enumerate(value):
+                    if isinstance(script, dict) and isinstance(script.get("script"), str):
+                        out.append(ScriptRef(
+                            *ctx, script.get("trigger"), script.get("label"), script.get("active", True),
+                            f"{sub}[{i}]", script["script"], script
+                        ))
+            elif key == "usageScript" and isinstance(value, str):
+                if value.strip():
+                    out.append(ScriptRef(*ctx, USAGE_TRIGGER, None, True, sub, value, node))
+            elif key in ("moves", "effects") and isinstance(value, list):
+                for i, entry in enumerate(value):
+                    if not isinstance(entry, dict):
+                        continue
+                    if key == "moves":
+                        child = ctx[:2] + (entry.get("name"), entry.get("id")) + ctx[4:]
+                    else:
+                        child = ctx[:4] + (entry.get("name"), entry.get("_id"))
+                    _walk(entry, f"{sub}[{i}]", child, out)
+            else:
+                _walk(value, sub, ctx, out)
+    elif isinstance(node, list):
+        for i, value in enumerate(node):
+            _walk(value, f"{path}[{i}]", ctx, out)
+
+
+def iter_item_scripts(item, index=0):
+    """列出单个物品 (文件顶层数组中的一项) 中的全部脚本"""
+    out = []
+    if isinstance(item, dict):
+        ctx = (item.get("name"), item.get("_id"), None, None, None, None)
+        _walk(item, f"[{index}]", ctx, out)
+    return out
+
+
+def iter_scripts(data):
+    """列出一个数据文件 (已解析的 JSON) 中的全部脚本"""
+    items = data if isinstance(data, list) else [data]
+    for index, item in enumerate(items):
+        yield from iter_item_scripts(item, index)
+
+
+def iter_corpus_scripts(data_dir=engine.DATA_DIR):
+    """遍历整个 data/ 目录，产出 (rel_path, ScriptRef)"""
+    for rel_path in engine.iter_data_files(data_dir):
+        data = corpus.read(rel_path, data_dir)
+        for ref in iter_scripts(data):
+            yield rel_path, ref
+
+
+def set_content(ref, content):
+    """把修改后的脚本写回 ref 所在的位置"""
+    key = "usageScript" if ref.path.endswith(".usageScript") else "script"
+    ref.holder[key] = content
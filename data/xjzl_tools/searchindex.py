@@ -0,0 +1,173 @@
+"""
+江湖万卷阁 (compendium-browser.mjs) 的预构建搜索索引
+
+从 data/ 构建合集包文档 (packs.py)，为浏览器的每个标签页 (物品类型) 生成倒排索引：
+    grams   名称的单字 / 双字、全拼的双字母、拼音首字母的单字母 / 双字母 -> 有序序号列表
+    facets  filterConfig 中每个筛选字段的取值 -> 有序序号列表 (武学的属性类字段取所有招式的并集)
+    docs    按名称拼音预先排好序的文档，下标即序号，浏览器不必再 localeCompare 排序
+浏览器打开时懒加载 build/search-index.json，搜索与筛选变为倒排表求交集。
+
+需要 pypinyin 生成拼音；未安装时只生成汉字 n-gram 索引。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.searchindex                 # 输出到 build/search-index.json
+    python -m xjzl_tools.searchindex --out FILE
+"""
+import argparse
+import os
+import re
+import unicodedata
+
+from . import engine, packs, serialize
+
+BROWSER_PATH = os.path.join(engine.ROOT_DIR, "module", "applications", "compendium-browser.mjs")
+DEFAULT_OUT = os.path.join(engine.ROOT_DIR, "build", "search-index.json")
+
+INDEX_VERSION = 1
+
+# 武学的这些筛选字段位于 system.moves[] 中，只要有一招符合即可
+MOVE_FACET_KEYS = ("element", "damageType", "weaponType")
+
+# 同一文档的名称、全拼、首字母在 text 中以此分隔，保证查询不会跨字段匹配
+FIELD_SEPARATOR = "\n"
+
+
+def read_filter_keys(path=BROWSER_PATH):
+    """
+    从 compendium-browser.mjs 的 filterConfig 中读取每个标签页的筛选字段
+    返回 {标签页: [字段, ...]}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    start = source.index("get filterConfig()")
+    body = source[source.index("return {", start):source.index("\n    }\n", start)]
+
+    keys = {}
+    tab = None
+    for line in body.splitlines():
+        m = re.match(r"\s*(\w+): \[", line)
+        if m:
+            tab = m.group(1)
+            keys[tab] = []
+        if tab is not None:
+            keys[tab].extend(re.findall(r'key: "(\w+)"', line))
+    return keys
+
+
+def _load_pinyin():
+    try:
+        from pypinyin import lazy_pinyin
+    except ImportError:
+        print("⚠️  未安装 pypinyin (pip install pypinyin)，索引中不包含拼音")
+        return None
+    return lazy_pinyin
+
+
+def is_han(ch):
+    return "一" <= ch <= "鿿" or "㐀" <= ch <= "䶿"
+
+
+def pinyin_fields(name, lazy_pinyin):
+    """返回 (全拼, 首字母)，只保留字母数字"""
+    if lazy_pinyin is None:
+        return "", ""
+    syllables = [s.lower() for s in lazy_pinyin(name) if s]
+    full = re.sub(r"[^a-z0-9]", "", "".join(syllables))
+    initials = "".join(s[0] for s in syllables if s[0].isalnum())
+    return full, initials
+
+
+def sort_key(name, lazy_pinyin):
+    """
+    近似浏览器中 localeCompare(..., "zh") 的顺序：
+    标点符号 < 数字 < 拉丁字母 < 汉字，汉字之间按拼音排序
+    """
+    key = []
+    for ch in name:
+        if is_han(ch):
+            py = lazy_pinyin(ch)[0] if lazy_pinyin else ""
+            key.append((3, py, ch))
+        elif ch.isdigit():
+            key.append((1, "", ch))
+        elif ch.isalpha():
+            key.append((2, ch.lower(), ch))
+        else:
+            key.append((0, unicodedata.category(ch), ch))
+    return key
+
+
+def ngrams(text, sizes):
+    return {text[i:i + n] for n in sizes for i in range(len(text) - n + 1)}
+
+
+def facet_values(doc, key):
+    system = doc.get("system", {})
+    if doc.get("type") == "wuxue" and key in MOVE_FACET_KEYS:
+        moves = system.get("moves")
+        if not isinstance(moves, list):
+            return set()
+        return {packs.js_string(m[key]) for m in moves if isinstance(m, dict) and packs.truthy(m.get(key))}
+    value = system.get(key)
+    if value is None:
+        return set()
+    return {packs.js_string(value)}
+
+
+def build_tab(entries, facet_keys, lazy_pinyin):
+    """entries: [(合集包名称, 文档)]，返回单个标签页的索引"""
+    entries = sorted(entries, key=lambda e: (sort_key(e[1].get("name", ""), lazy_pinyin), e[0]))
+    docs, text = [], []
+    grams, facets = {}, {key: {} for key in facet_keys}
+
+    for ordinal, (pack_name, doc) in enumerate(entries):
+        name = doc.get("name", "")
+        lowered = name.lower()
+        full, initials = pinyin_fields(name, lazy_pinyin)
+        docs.append([pack_name, name, doc.get("_id")])
+        text.append(FIELD_SEPARATOR.join((lowered, full, initials)))
+
+        # 名称与首字母支持单字查询；全拼只建双字母索引 (单个字母按首字母处理)
+        for gram in ngrams(lowered, (1, 2)) | ngrams(full, (2,)) | ngrams(initials, (1, 2)):
+            grams.setdefault(gram, []).append(ordinal)
+        for key in facet_keys:
+            for value in facet_values(doc, key):
+                facets[key].setdefault(value, []).append(ordinal)
+
+    return {"size": len(docs), "docs": docs, "text": text, "grams": grams, "facets": facets}
+
+
+def build_index(data_dir=engine.DATA_DIR):
+    filter_keys = read_filter_keys()
+    lazy_pinyin = _load_pinyin()
+
+    by_type = {}
+    for pack_name, pack in packs.build_packs(data_dir=data_dir).items():
+        if pack.type != "Item":
+            continue
+        # to_json() 去掉了 UNDEFINED 字段，与写入合集包的数据一致
+        for doc in pack.to_json()["documents"]:
+            by_type.setdefault(doc.get("type"), []).append((pack_name, doc))
+
+    tabs = {
+        tab: build_tab(by_type.get(tab, []), keys, lazy_pinyin)
+        for tab, keys in filter_keys.items()
+    }
+    return {"version": INDEX_VERSION, "pinyin": lazy_pinyin is not None, "tabs": tabs}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="为江湖万卷阁生成预构建搜索索引")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"输出路径，默认 {DEFAULT_OUT}")
+    args = parser.parse_args()
+
+    index = build_index()
+    serialize.write_json(args.out, index, minify=True)
+
+    for tab, data in index["tabs"].items():
+        print(f"  ✅ {tab:<12} {data['size']:>5} 个文档, {len(data['grams']):>5} 个 n-gram, "
+              f"筛选字段: {', '.join(data['facets']) or '-'}")
+    print(f"💾 索引已写入: {args.out} ({os.path.getsize(args.out) // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+/* data/xjzl_tools/seed_harness.mjs */
+
+/**
+ * 在 Node 中运行 module/utils/seeding 下真实的 seed-*.mjs，
+ * 用最小化的 Foundry 桩对象截获传给 createDocuments 的数据，输出为 JSON。
+ * 供 golden.py 与 Python 版构建结果 (packs.py) 逐字段对比。
+ *
+ * 用法: node seed_harness.mjs [合集包名称...]
+ */
+import { readFile } from "node:fs/promises";
+import { fileURLToPath, pathToFileURL } from "node:url";
+import path from "node:path";
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..", "..");
+const SYSTEM_PREFIX = "systems/xjzl-system/";
+
+// randomID 生成的招式 ID 在两边不可能一致，统一替换为占位符
+export const RANDOM_ID = "__RANDOM_ID__";
+
+const lang = JSON.parse(await readFile(path.join(ROOT, "lang", "zh-cn.json"), "utf-8"));
+const localize = key => {
+    const value = key.split(".").reduce((node, part) => node?.[part], lang);
+    return typeof value === "string" ? value : key;
+};
+
+let captured = null;
+const makePack = () => ({
+    configure: async () => {},
+    getIndex: async () => ({ size: 0, map: () => [] }),
+    folders: { size: 0, map: () => [] }
+});
+
+globalThis.ui = { notifications: { info: () => {}, warn: () => {}, error: msg => { captured.errors.push(msg); } } };
+globalThis.foundry = {
+    utils: { randomID: () => RANDOM_ID },
+    applications: { api: { DialogV2: {} } }
+};
+globalThis.game = {
+    packs: { get: () => makePack() },
+    user: { id: undefined },
+    i18n: { localize }
+};
+globalThis.fetch = async url => {
+    const file = path.join(ROOT, url.startsWith(SYSTEM_PREFIX) ? url.slice(SYSTEM_PREFIX.length) : url);
+    try {
+        const text = await readFile(file, "utf-8");
+        return { ok: true, json: async () => JSON.parse(text) };
+    } catch {
+        return { ok: false, json: async () => null };
+    }
+};
+
+// 文件夹 ID 直接使用文件夹名称，与 Python 版的文档 folder 字段一致
+globalThis.Folder = {
+    create: async data => {
+        const { pack, ...folder } = data;
+        captured.folders.push(folder);
+        return { id: data.name };
+    },
+    deleteDocuments: async () => {}
+};
+const documentClass = {
+    createDocuments: async docs => { captured.documents.push(...docs); },
+    deleteDocuments: async () => {}
+};
+globalThis.Item = documentClass;
+globalThis.Macro = documentClass;
+
+// 屏蔽 seeder 的日志输出，stdout 只保留 JSON 结果
+console.log = () => {};
+console.warn = () => {};
+
+const { SeedingManager } = await import(pathToFileURL(path.join(ROOT, "module", "utils", "seeding", "index.mjs")));
+const systemJson = JSON.parse(await readFile(path.join(ROOT, "system.json"), "utf-8"));
+
+const names = process.argv.slice(2).length ? process.argv.slice(2) : systemJson.packs.map(p => p.name);
+const output = {};
+for (const name of names) {
+    captured = { folders: [], documents: [], errors: [] };
+    await SeedingManager[name]();
+    output[name] = captured;
+}
+process.stdout.write(JSON.stringify(output));
@@ -0,0 +1,152 @@
+"""
+统一的 JSON 序列化与写回
+
+所有工具写 JSON 都经过这里，保证同样的数据总是得到同样的字节：
+    - 规范格式：4 空格缩进，ensure_ascii=False (中文不转义)，末尾不加换行 (与 data/ 现有文件一致)
+    - 键顺序：保持数据中的顺序 (即文件中原有的顺序，读写往返不变)；清单等生成文件可用 sort_keys
+    - 写回前与磁盘上的字节比较，完全相同时不写 (不改 mtime，不触发 watch / 清单失效)
+    - 先写同目录下的临时文件再 os.replace，读者不会看到写了一半的文件
+另外提供压缩格式 (无空白)，用于构建产物与发布用的数据副本。
+
+用法 (在 data/ 目录下执行)：
+    python -m xjzl_tools.serialize                  # 列出不是规范格式的数据文件 (有则退出码为 1)
+    python -m xjzl_tools.serialize --write          # 改写为规范格式
+    python -m xjzl_tools.serialize --minify         # 输出压缩副本到 build/data/ (目录结构与 data/ 相同)
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+INDENT = 4
+MINIFIED_SEPARATORS = (",", ":")
+
+
+def dumps(data, minify=False, sort_keys=False):
+    if minify:
+        return json.dumps(data, ensure_ascii=False, separators=MINIFIED_SEPARATORS, sort_keys=sort_keys)
+    return json.dumps(data, ensure_ascii=False, indent=INDENT, sort_keys=sort_keys)
+
+
+def encode(data, minify=False, sort_keys=False):
+    return dumps(data, minify, sort_keys).encode("utf-8")
+
+
+def same_bytes(path, raw):
+    """磁盘上的文件内容是否与 raw 完全相同 (先比较大小，大小不同时不读文件)"""
+    try:
+        if os.path.getsize(path) != len(raw):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == raw
+    except OSError:
+        return False
+
+
+def write_bytes(path, raw):
+    """
+    原子写入：内容与磁盘相同时跳过，否则写同目录临时文件后替换
+    返回: 是否实际写入
+    """
+    if same_bytes(path, raw):
+        return False
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 临时文件以 . 开头，不会被 iter_data_files / watch 当作数据文件
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def write_json(path, data, minify=False, sort_keys=False):
+    """按规范格式 (或压缩格式) 写入 JSON，返回是否实际写入"""
+    return write_bytes(path, encode(data, minify, sort_keys))
+
+
+def check_files(files, data_dir):
+    """返回 [(相对路径, 规范格式的字节)]，只包含当前不是规范格式的文件"""
+    pending = []
+    for rel_path in files:
+        path = os.path.join(data_dir, rel_path)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        canonical = encode(json.loads(raw.decode("utf-8")))
+        if canonical != raw:
+            pending.append((rel_path, canonical))
+    return pending
+
+
+def minify_files(files, data_dir, out_dir):
+    """把数据文件的压缩副本写到 out_dir，返回 (原大小, 压缩后大小, 写入的文件数)"""
+    before = after = written = 0
+    for rel_path in files:
+        path = os.path.join(data_dir, rel_path)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        minified = encode(json.loads(raw.decode("utf-8")), minify=True)
+        before += len(raw)
+        after += len(minified)
+        written += write_bytes(os.path.join(out_dir, rel_path), minified)
+    return before, after, written
+
+
+def main():
+    # engine 依赖本模块，命令行入口中再导入
+    from . import engine, since
+
+    default_out = os.path.join(engine.ROOT_DIR, "build", "data")
+    parser = argparse.ArgumentParser(description="检查 / 改写数据文件为规范 JSON 格式，或输出压缩副本")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--write", action="store_true", help="把不是规范格式的文件改写为规范格式")
+    mode.add_argument("--minify", nargs="?", const=default_out, metavar="DIR",
+                      help=f"输出压缩副本 (默认 {default_out})")
+    since.add_since_argument(parser)
+    args = parser.parse_args()
+
+    changes = since.resolve_since(args.since)
+    files = changes.data_files() if changes else engine.iter_data_files()
+
+    if args.minify:
+        before, after, written = minify_files(files, engine.DATA_DIR, args.minify)
+        saved = (1 - after / before) * 100 if before else 0
+        print(f"📦 {len(files)} 个文件 -> {args.minify}：{before // 1024} KB -> {after // 1024} KB "
+              f"(减少 {saved:.1f}%)，更新 {written} 个文件")
+        return
+
+    try:
+        pending = check_files(files, engine.DATA_DIR)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"❌ 无法读取或解析 JSON: {e}\n")
+
+    for rel_path, canonical in pending:
+        if args.write:
+            write_bytes(os.path.join(engine.DATA_DIR, rel_path), canonical)
+            print(f"💾 [保存] 已改写为规范格式: {rel_path}")
+        else:
+            print(f"📝 不是规范格式: {rel_path}")
+    if not pending:
+        print(f"✅ {len(files)} 个文件均为规范格式")
+    elif not args.write:
+        print(f"\n⚠️  {len(pending)} 个文件不是规范格式 (python -m xjzl_tools.serialize --write 改写)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+--since <ref> 增量模式：只处理相对某个 git 版本有变化的数据文件
+
+向本地 git 查询工作区 (含暂存区与未跟踪文件) 相对 ref 变化的路径：
+    - data/ 下的 JSON 文件直接入选
+    - 决定某类数据如何解释的源码变化时，该分类的全部文件入选 (依赖关系见 DEPENDENTS)，
+      例如 seed-wuxue.mjs 中的 SECT_MAP 变化会选中全部 wuxue/ 文件
+    - 工具本身 (data/xjzl_tools/)、config.mjs、system.json 等全局输入变化时退回全量
+这样 CI 与 pre-commit 中的运行时间与改动大小成正比，结果仍与全量运行一致。
+
+所有 data/ 下的脚本通过 add_since_argument() 共享同一个命令行参数：
+    python -m xjzl_tools.run --since origin/main
+    python -m xjzl_tools.refcheck --since HEAD
+"""
+import os
+
+from . import engine, gitutil
+
+# 全部分类 (与 packs.BUILDERS 的合集包名称一致，根目录 JSON 为 origins)
+CATEGORIES = ("origins", "consumables", "artbooks", "misc", "armor", "weapons", "qizhen", "neigong", "wuxue", "macros")
+
+DATA_PREFIX = os.path.relpath(engine.DATA_DIR, engine.ROOT_DIR).replace(os.sep, "/") + "/"
+TOOLS_PREFIX = DATA_PREFIX + "xjzl_tools/"
+
+# 非数据文件 -> 依赖它的数据分类 (相对仓库根目录；以 / 结尾的为目录前缀)，engine.ALL 表示全部
+DEPENDENTS = {
+    TOOLS_PREFIX: engine.ALL,
+    "module/config.mjs": engine.ALL,
+    "module/data/actor/": engine.ALL,
+    "module/data/common.mjs": engine.ALL,
+    "system.json": engine.ALL,
+    "lang/zh-cn.json": ("artbooks",),
+    "module/utils/seeding/seed-origins.mjs": ("origins",),
+    "module/utils/seeding/seed-consumables.mjs": ("consumables",),
+    "module/utils/seeding/seed-artbooks.mjs": ("artbooks",),
+    "module/utils/seeding/seed-misc.mjs": ("misc",),
+    "module/utils/seeding/seed-armor.mjs": ("armor",),
+    "module/utils/seeding/seed-weapons.mjs": ("weapons",),
+    "module/utils/seeding/seed-qizhen.mjs": ("qizhen",),
+    "module/utils/seeding/seed-neigong.mjs": ("neigong",),
+    "module/utils/seeding/seed-wuxue.mjs": ("wuxue",),
+    "module/utils/seeding/seed-macros.mjs": ("macros",),
+    "module/data/item/background.mjs": ("origins",),
+    "module/data/item/personality.mjs": ("origins",),
+    "module/data/item/consumable.mjs": ("consumables",),
+    "module/data/item/art-book.mjs": ("artbooks",),
+    "module/data/item/misc.mjs": ("misc",),
+    "module/data/item/armor.mjs": ("armor",),
+    "module/data/item/weapon.mjs": ("weapons",),
+    "module/data/item/qizhen.mjs": ("qizhen",),
+    "module/data/item/neigong.mjs": ("neigong",),
+    "module/data/item/wuxue.mjs": ("wuxue",),
+}
+
+# 删除或改名的图标可能被任何文件引用 (refcheck)，新增与修改则不影响已有数据
+ASSETS_PREFIX = "assets/"
+
+
+def is_data_file(rel_path):
+    """与 engine.iter_data_files 的筛选规则一致"""
+    parts = rel_path.split("/")
+    return (rel_path.endswith(".json") and not parts[-1].startswith(".")
+            and not any(p.startswith((".", "_")) or p == "xjzl_tools" for p in parts[:-1]))
+
+
+def dependents_of(path, status):
+    """非数据文件变化时受影响的分类"""
+    for prefix, categories in DEPENDENTS.items():
+        if path == prefix or (prefix.endswith("/") and path.startswith(prefix)):
+            return set(CATEGORIES) if categories == engine.ALL else set(categories)
+    if path.startswith(ASSETS_PREFIX) and status == "D":
+        return set(CATEGORIES)
+    return set()
+
+
+class ChangeSet:
+    """
+    相对 ref 的变化
+    files: 内容变化的数据文件 (相对 data/)
+    categories: 因依赖变化需要全部重新处理的分类
+    reasons: {分类: 触发的源文件}，便于输出说明
+    """
+
+    def __init__(self, ref, files, categories, reasons):
+        self.ref = ref
+        self.files = files
+        self.categories = categories
+        self.reasons = reasons
+
+    @property
+    def full(self):
+        return self.categories >= set(CATEGORIES)
+
+    def data_files(self, data_dir=engine.DATA_DIR):
+        """需要处理的数据文件 (排序，均存在于工作区)"""
+        selected = set(self.files)
+        if self.categories:
+            selected.update(rel for rel in engine.iter_data_files(data_dir)
+                            if engine.category_of(rel) in self.categories)
+        return sorted(rel for rel in selected if os.path.isfile(os.path.join(data_dir, rel)))
+
+    def touched_categories(self):
+        """有任何文件需要处理的分类 (packs / golden 据此只构建受影响的合集包)"""
+        return self.categories | {engine.category_of(rel) for rel in self.files}
+
+    def describe(self, data_dir=engine.DATA_DIR):
+        total = len(self.data_files(data_dir))
+        if self.full:
+            return f"🔀 相对 {self.ref} 有全局依赖变化 ({self.reasons.get('*', '')})，处理全部 {total} 个文件"
+        extra = "".join(f"，{cat} 全部 ({source})" for cat, source in sorted(self.reasons.items()))
+        return f"🔀 相对 {self.ref}: {len(self.files)} 个数据文件有变化{extra}，共处理 {total} 个文件"
+
+
+def changes_since(ref):
+    """查询相对 ref 的变化，返回 ChangeSet (ref 无效时抛出 gitutil.GitError)"""
+    files, categories, reasons = set(), set(), {}
+    for path, status in sorted(gitutil.changed_paths(ref).items()):
+        if path.startswith(DATA_PREFIX) and not path.startswith(TOOLS_PREFIX):
+            rel_path = path[len(DATA_PREFIX):]
+            if is_data_file(rel_path) and status != "D":
+                files.add(rel_path)
+            continue
+        affected = dependents_of(path, status)
+        if affected >= set(CATEGORIES):
+            reasons.setdefault("*", path)
+        else:
+            for cat in sorted(affected - categories):
+                reasons[cat] = path
+        categories |= affected
+    return ChangeSet(ref, files, categories, reasons)
+
+
+def add_since_argument(parser):
+    parser.add_argument("--since", metavar="REF",
+                        help="只处理相对该 git 版本 (分支 / 标签 / 提交) 有变化的文件及其依赖")
+    return parser
+
+
+def resolve_since(ref, quiet=False):
+    """
+    解析 --since 参数：未指定时返回 None (全量)，否则返回 ChangeSet
+    ref 无效或不在 git 仓库中时以错误退出
+    """
+    if not ref:
+        return None
+    try:
+        changes = changes_since(ref)
+    except (gitutil.GitError, OSError) as e:
+        raise SystemExit(f"❌ 无法查询 --since {ref}: {e}")
+    if not quiet:
+        print(changes.describe())
+    return changes
@@ -0,0 +1,128 @@
+"""
+描述文本的多关键词扫描
+
+各检查在这里登记自己关心的关键词组 (动作类型、修为、伤害类型、持续时间……)，
+所有组合并为一个扫描器：每段文本去掉 HTML 后只扫描一遍，一次得到全部关键词的出现位置，
+结果按文本缓存。新增一种描述检查只需登记关键词，不会再多扫描一遍文本。
+
+扫描结果与 Aho–Corasick 相同：报告每个关键词的每一次出现 (允许重叠，例如 "全回合动作" 中的 "回合")，
+按起始位置排序。实现上把全部关键词编译为一个 "(?=(最长|...|最短))" 的正则，
+由 re 在 C 中逐位置匹配每个起点上最长的关键词，同一起点上作为其前缀的较短关键词再由前缀表补齐；
+在 Python 中逐字符推进自动机反而比这慢得多。
+
+    from xjzl_tools import textscan
+    textscan.register_keywords("action", ["主要动作", "次要动作"])
+    for hit in textscan.find(move["description"], "action"):
+        print(hit.start, hit.keyword)
+"""
+import re
+from collections import namedtuple
+
+from . import corpus, engine, packs
+from .jsliteral import read_literal
+
+# start / end 为在纯文本 (去掉 HTML 后) 中的位置
+Hit = namedtuple("Hit", ["start", "end", "keyword", "group"])
+
+# 持续时间的单位 (数值在关键词之前，由使用方解析)
+DURATION_UNITS = ("回合", "轮", "分钟", "小时")
+
+
+class TextScanner:
+    """一组关键词的扫描器；groups 为 {组名: 关键词列表}，同一个关键词可以属于多个组"""
+
+    def __init__(self, groups):
+        # 关键词 -> 所属的组
+        self.groups_of = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                if keyword:
+                    self.groups_of.setdefault(keyword, [])
+                    if group not in self.groups_of[keyword]:
+                        self.groups_of[keyword].append(group)
+        keywords = sorted(self.groups_of, key=lambda k: (-len(k), k))
+        # 每个关键词连同作为其前缀的较短关键词 (同一起点上只能匹配到最长的那个)
+        self.prefixes = {k: [p for p in keywords if k.startswith(p)] for k in keywords}
+        self.pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))") if keywords else None
+        self._cache = {}
+
+    def scan(self, text):
+        """返回文本 (可以带 HTML) 中全部关键词的出现位置 (tuple of Hit)，按起始位置排序"""
+        if not text or self.pattern is None:
+            return ()
+        hits = self._cache.get(text)
+        if hits is None:
+            hits = []
+            for m in self.pattern.finditer(corpus.plain_text(text)):
+                start = m.start()
+                for keyword in self.prefixes[m.group(1)]:
+                    for group in self.groups_of[keyword]:
+                        hits.append(Hit(start, start + len(keyword), keyword, group))
+            hits = self._cache[text] = tuple(hits)
+        return hits
+
+    def find(self, text, group):
+        return [hit for hit in self.scan(text) if hit.group == group]
+
+    def first(self, text, group):
+        for hit in self.scan(text):
+            if hit.group == group:
+                return hit
+        return None
+
+    def clear_cache(self):
+        self._cache.clear()
+
+
+# 组名 -> 关键词列表，或返回关键词列表的函数 (在第一次扫描时才读取，例如需要读取 config.mjs 的)
+_KEYWORDS = {}
+_SHARED = None
+
+
+def register_keywords(group, keywords):
+    """登记 (或替换) 一组关键词，之后的扫描包含该组"""
+    global _SHARED
+    _KEYWORDS[group] = keywords if callable(keywords) else tuple(keywords)
+    _SHARED = None
+
+
+def shared():
+    """包含全部已登记关键词组的扫描器"""
+    global _SHARED
+    if _SHARED is None:
+        _SHARED = TextScanner({group: keywords() if callable(keywords) else keywords
+                               for group, keywords in _KEYWORDS.items()})
+    return _SHARED
+
+
+def scan(text):
+    return shared().scan(text)
+
+
+def find(text, group):
+    return shared().find(text, group)
+
+
+def first(text, group):
+    return shared().first(text, group)
+
+
+def clear_cache():
+    if _SHARED is not None:
+        _SHARED.clear_cache()
+
+
+def config_labels(name):
+    """config.mjs 中 {key: 语言 key} 形式的配置 (如 XJZL.damageTypes) 本地化后的 {key: 中文名}"""
+    entries = read_literal(packs.CONFIG_PATH, name)
+    lang = engine.read_json(packs.LANG_PATH)
+    return {key: packs.localize(lang, label) for key, label in entries.items()}
+
+
+def damage_type_labels():
+    """XJZL.damageTypes 的中文名 ("外功伤害"、"气血流失" ……，不含 "无")"""
+    return [label for key, label in config_labels("XJZL.damageTypes").items() if key != "none"]
+
+
+register_keywords("damage", damage_type_labels)
+register_keywords("duration", DURATION_UNITS)
@@ -0,0 +1,223 @@
+"""
+监视 data/ 目录，保存文件后立即重新检查
+
+常驻进程，启动时载入共享快照 (corpus.py) 并保存在内存中。
+Linux 下通过 inotify (ctypes 直接调用 libc，不需要第三方库) 接收写入事件，其他系统退化为定时检查 mtime。
+每次保存只重新解码被修改的文件，只执行适用于该文件分类 (wuxue / neigong / armor ...) 的 pass，
+几毫秒内输出修改记录与检查结果。
+
+默认只报告 (相当于 --dry-run)，避免与编辑器同时写同一个文件；--fix 时会把 fix 类 pass 的修改写回。
+
+用法 (在 data/ 目录下执行，Ctrl+C 退出)：
+    python -m xjzl_tools.watch                       # 默认的 pass (同 run)
+    python -m xjzl_tools.watch action_cost progression
+    python -m xjzl_tools.watch --fix
+"""
+import argparse
+import ctypes
+import ctypes.util
+import os
+from errno import ENOENT, ENOTDIR
+import select
+import struct
+import time
+
+from . import engine
+from .corpus import Corpus
+from .run import print_findings, print_results
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+EVENT_HEADER = struct.Struct("iIII")
+
+# 编辑器保存时常常连续产生多个事件 (写临时文件、改名)，收到事件后再等这么久合并为一次处理
+DEBOUNCE_SECONDS = 0.05
+POLL_INTERVAL = 0.5
+
+
+def _skip_dir(name):
+    return name.startswith((".", "_")) or name == "xjzl_tools"
+
+
+def _is_data_file(rel_path):
+    return rel_path.endswith(".json") and not os.path.basename(rel_path).startswith(".")
+
+
+class InotifyWatcher:
+    """data/ 目录树的 inotify 监视 (inotify 不递归，每个子目录单独添加)"""
+
+    def __init__(self, data_dir=engine.DATA_DIR):
+        self.data_dir = data_dir
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 失败")
+        self.dirs = {}
+        self.add_tree(data_dir)
+
+    def add_tree(self, path):
+        for root, dirs, _ in os.walk(path):
+            dirs[:] = [d for d in dirs if not _skip_dir(d)]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(root), WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                # 目录在事件与添加监视之间被删除或改名 (编辑器保存时的临时目录等)，跳过即可
+                if errno in (ENOENT, ENOTDIR) and root != self.data_dir:
+                    continue
+                raise OSError(errno, f"无法监视目录: {root}")
+            self.dirs[wd] = os.path.relpath(root, self.data_dir)
+
+    def _read(self, changed):
+        """读取当前可读的全部事件，把涉及的数据文件加入 changed；返回是否需要全量检查"""
+        buf = os.read(self.fd, 64 * 1024)
+        overflow = False
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(buf[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            base = self.dirs.get(wd)
+            if base is None or not name:
+                continue
+            rel_path = os.path.normpath(os.path.join(base, name)).replace(os.sep, "/")
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not _skip_dir(name):
+                    self.add_tree(os.path.join(self.data_dir, rel_path))
+                    overflow = True
+            elif _is_data_file(rel_path):
+                changed.add(rel_path)
+        return overflow
+
+    def wait(self):
+        """阻塞直到有数据文件变化，返回相对路径集合；None 表示需要重新检查全部文件"""
+        changed = set()
+        overflow = False
+        while not changed and not overflow:
+            select.select([self.fd], [], [])
+            overflow = self._read(changed)
+            while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+                overflow = self._read(changed) or overflow
+        return None if overflow else changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """没有 inotify 时的退化实现：定时比较全部数据文件的 mtime 与大小"""
+
+    def __init__(self, data_dir=engine.DATA_DIR):
+        self.data_dir = data_dir
+        self.state = self._scan()
+
+    def _scan(self):
+        state = {}
+        for rel_path in engine.iter_data_files(self.data_dir):
+            try:
+                st = os.stat(os.path.join(self.data_dir, rel_path))
+            except OSError:
+                continue
+            state[rel_path] = (st.st_mtime_ns, st.st_size)
+        return state
+
+    def wait(self):
+        while True:
+            time.sleep(POLL_INTERVAL)
+            state = self._scan()
+            changed = {rel for rel in set(state) | set(self.state) if state.get(rel) != self.state.get(rel)}
+            self.state = state
+            if changed:
+                return changed
+
+    def close(self):
+        pass
+
+
+def create_watcher(poll=False, data_dir=engine.DATA_DIR):
+    if not poll:
+        try:
+            return InotifyWatcher(data_dir)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify 不可用 ({e})，改为每 {POLL_INTERVAL}s 检查一次")
+    return PollingWatcher(data_dir)
+
+
+def check_file(rel_path, passes, snapshot, fix):
+    """重新检查单个文件；内容未变化 (如 touch 或本进程刚写回) 时返回 False"""
+    start = time.perf_counter()
+    if not snapshot.refresh([rel_path]):
+        if rel_path not in snapshot:
+            print(f"🗑️  {rel_path} 已删除")
+            return True
+        return False
+    print("-" * 60)
+
+    result = engine.process_file(rel_path, passes, dry_run=not fix, data_dir=snapshot.data_dir, corpus=snapshot)
+    if result.written:
+        # 先更新快照，写回触发的下一次事件就会因内容未变化而跳过
+        snapshot.refresh([rel_path])
+    _, findings = print_results([result])
+    print_findings(findings)
+
+    elapsed = (time.perf_counter() - start) * 1000
+    applied = [r.name for r in result.reports]
+    if not result.error:
+        status = f"{len(findings)} 个问题" if findings else "没有问题"
+        print(f"✅ {rel_path} | {', '.join(applied) or '无适用的 pass'} | {status} ({elapsed:.1f} ms)")
+    return True
+
+
+def watch(pass_names=None, fix=False, poll=False, data_dir=engine.DATA_DIR):
+    passes = engine.select_passes(pass_names)
+    snapshot = Corpus.load(data_dir)
+    watcher = create_watcher(poll, data_dir)
+    print(f"👀 正在监视 {data_dir} ({len(snapshot.files())} 个文件)，pass: {', '.join(p.name for p in passes)}")
+    print("   按 Ctrl+C 退出")
+    try:
+        while True:
+            changed = watcher.wait()
+            if changed is None:
+                # 事件队列溢出或新增了目录，按 mtime 找出所有变化的文件
+                changed = set(snapshot.files()) | set(engine.iter_data_files(data_dir))
+            for rel_path in sorted(changed):
+                check_file(rel_path, passes, snapshot, fix)
+    except KeyboardInterrupt:
+        print("\n👋 已停止监视")
+    finally:
+        watcher.close()
+        snapshot.save()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="监视 data/ 目录，文件保存后立即执行适用的 pass")
+    parser.add_argument("passes", nargs="*", help="要执行的 pass 名称，默认执行除 stable_ids 等需指定的 pass 之外的全部")
+    parser.add_argument("--fix", action="store_true", help="写回 fix 类 pass 的修改 (默认只报告)")
+    parser.add_argument("--poll", action="store_true", help="不使用 inotify，定时检查文件变化")
+    args = parser.parse_args()
+
+    try:
+        watch(args.passes or None, fix=args.fix, poll=args.poll)
+    except KeyError as e:
+        parser.exit(1, f"❌ {e}\n")
+
+
+if __name__ == "__main__":
+    main()
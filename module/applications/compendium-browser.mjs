@@ -18,6 +18,9 @@ export class XJZLCompendiumBrowser extends HandlebarsApplicationMixin(Applicatio
         /** @type {boolean} 数据是否加载完毕 */
         this.isLoaded = false;
 
+        /** @type {Object<string, Object>} 预构建搜索索引，按 Tab 分类 (见 data/xjzl_tools/searchindex.py) */
+        this.searchIndex = {};
+
         /** @type {Object} UI 交互状态 */
         this.browserState = {
             activeTab: "weapon",
@@ -72,6 +75,12 @@ export class XJZLCompendiumBrowser extends HandlebarsApplicationMixin(Applicatio
         { id: "art_book", label: "技艺", icon: "fas fa-book" },
     ];
 
+    /** 预构建搜索索引 (python -m xjzl_tools.searchindex 生成；build/ 不提交，发布时由 python -m xjzl_tools.release 打入安装包) */
+    static SEARCH_INDEX_PATH = "systems/xjzl-system/build/search-index.json";
+
+    /** @type {Promise<Object|null>} 搜索索引只在第一次打开时加载，之后复用 */
+    static _searchIndexPromise = null;
+
     static INDEX_FIELDS = [
         "img", "system.quantity", "system.price", "system.quality",
         "system.type", "system.subtype", "system.tier",
@@ -149,11 +158,21 @@ export class XJZLCompendiumBrowser extends HandlebarsApplicationMixin(Applicatio
             } catch (err) { console.error(`XJZL Browser | Pack Load Error: ${pack.collection}`, err); }
         };
 
-        await Promise.all(targetPacks.map(pack => loadPackIndex(pack)));
+        const [searchIndex] = await Promise.all([
+            XJZLCompendiumBrowser.loadSearchIndex(),
+            ...targetPacks.map(pack => loadPackIndex(pack))
+        ]);
 
-        // 简单按名称排序，提升浏览体验
+        // 有预构建索引时按索引中预先排好的顺序排列，否则按名称排序
+        this.searchIndex = {};
         for (const key in tempCache) {
-            tempCache[key].sort((a, b) => a.name.localeCompare(b.name, "zh"));
+            const tabIndex = searchIndex?.tabs?.[key];
+            if (tabIndex) {
+                this.searchIndex[key] = this._attachSearchIndex(tabIndex, tempCache[key]);
+                tempCache[key] = [...this.searchIndex[key].entries.filter(Boolean), ...this.searchIndex[key].unindexed];
+            } else {
+                tempCache[key].sort((a, b) => a.name.localeCompare(b.name, "zh"));
+            }
         }
 
         this.cachedData = tempCache;
@@ -163,6 +182,48 @@ export class XJZLCompendiumBrowser extends HandlebarsApplicationMixin(Applicatio
         if (this.rendered) this.render();
     }
 
+    /**
+     * 懒加载预构建搜索索引，文件不存在时返回 null (退回线性扫描)
+     */
+    static loadSearchIndex() {
+        this._searchIndexPromise ??= fetch(this.SEARCH_INDEX_PATH)
+            .then(response => response.ok ? response.json() : null)
+            .catch(err => {
+                console.warn("XJZL Browser | 未找到预构建搜索索引，使用线性搜索", err);
+                return null;
+            });
+        return this._searchIndexPromise;
+    }
+
+    /**
+     * 将索引中的文档序号与合集包索引条目对应起来
+     * 优先按 _id 匹配，没有 _id 时按 "合集包/名称" 依次匹配；索引中没有的条目放入 unindexed (线性扫描)
+     */
+    _attachSearchIndex(tabIndex, entries) {
+        const byId = new Map();
+        const byName = new Map();
+        tabIndex.docs.forEach(([pack, name, id], ordinal) => {
+            if (id) byId.set(id, ordinal);
+            const key = `${pack}/${name}`;
+            if (!byName.has(key)) byName.set(key, []);
+            byName.get(key).push(ordinal);
+        });
+
+        const ordered = new Array(tabIndex.size);
+        const unindexed = [];
+        for (const entry of entries) {
+            let ordinal = byId.get(entry._id);
+            if (ordinal === undefined || ordered[ordinal]) {
+                const pack = entry.uuid.split(".")[2];
+                ordinal = byName.get(`${pack}/${entry.name}`)?.find(o => !ordered[o]);
+            }
+            if (ordinal === undefined) unindexed.push(entry);
+            else ordered[ordinal] = entry;
+        }
+        unindexed.sort((a, b) => a.name.localeCompare(b.name, "zh"));
+        return { ...tabIndex, entries: ordered, unindexed };
+    }
+
     async refreshData() {
         this.isLoaded = false;
         this.render(); // 显示 loading 状态
@@ -327,12 +388,71 @@ export class XJZLCompendiumBrowser extends HandlebarsApplicationMixin(Applicatio
 
     /**
      * 高性能内存过滤器
-     * 复杂度优化至 O(N * M)，利用预计算的 _searchName 加速
+     * 有预构建索引时为倒排表查询 (支持拼音与首字母)，否则退回线性扫描
      */
     _filterItems(items, filters = null, query = null) {
         const activeFilters = filters || this.browserState.filters;
         const activeQuery = (query !== null ? query : this.browserState.searchQuery).toLowerCase();
 
+        // 有预构建索引时走倒排表查询，只对索引之外的条目做线性扫描
+        const tabIndex = this.searchIndex[this.browserState.activeTab];
+        if (tabIndex && items === this.cachedData[this.browserState.activeTab]) {
+            return this._queryIndex(tabIndex, activeFilters, activeQuery);
+        }
+        return this._scanItems(items, activeFilters, activeQuery);
+    }
+
+    /**
+     * 索引查询：搜索词拆成 n-gram 后对倒排表求交集，筛选条件同字段取并集、跨字段取交集
+     * 倒排表中的序号已按名称排好序，结果无需再次排序
+     */
+    _queryIndex(tabIndex, activeFilters, activeQuery) {
+        let ordinals = null;
+
+        if (activeQuery) {
+            const chars = [...activeQuery];
+            const grams = chars.length === 1 ? chars : chars.slice(1).map((c, i) => chars[i] + c);
+            const lists = grams.map(g => tabIndex.grams[g] ?? []).sort((a, b) => a.length - b.length);
+            ordinals = lists.reduce((acc, list) => XJZLCompendiumBrowser._intersect(acc, list));
+            // n-gram 命中只是候选，确认名称、全拼或首字母中确实包含完整搜索词
+            ordinals = ordinals.filter(o => tabIndex.text[o].includes(activeQuery));
+        }
+
+        for (const [key, activeSet] of Object.entries(activeFilters)) {
+            if (!activeSet || activeSet.size === 0) continue;
+            const facet = tabIndex.facets[key] ?? {};
+            const matched = XJZLCompendiumBrowser._union([...activeSet].map(v => facet[v] ?? []));
+            ordinals = ordinals ? XJZLCompendiumBrowser._intersect(ordinals, matched) : matched;
+        }
+
+        const matched = ordinals ? ordinals.map(o => tabIndex.entries[o]) : tabIndex.entries;
+        const result = matched.filter(Boolean);
+        if (tabIndex.unindexed.length) result.push(...this._scanItems(tabIndex.unindexed, activeFilters, activeQuery));
+        return result;
+    }
+
+    /** 两个升序序号数组求交集 */
+    static _intersect(a, b) {
+        const out = [];
+        let i = 0, j = 0;
+        while (i < a.length && j < b.length) {
+            if (a[i] === b[j]) { out.push(a[i]); i++; j++; }
+            else if (a[i] < b[j]) i++;
+            else j++;
+        }
+        return out;
+    }
+
+    /** 多个升序序号数组求并集 (保持升序) */
+    static _union(lists) {
+        if (lists.length === 1) return lists[0];
+        return [...new Set(lists.flat())].sort((a, b) => a - b);
+    }
+
+    /**
+     * 线性扫描 (没有预构建索引，或条目不在索引中时使用)
+     */
+    _scanItems(items, activeFilters, activeQuery) {
         // 预处理筛选器：将 Object 转换为数组，移除空 Set，避免循环内频繁 Object.entries
         const activeFilterEntries = Object.entries(activeFilters).filter(([_, v]) => v && v.size > 0);
         const hasFilters = activeFilterEntries.length > 0;
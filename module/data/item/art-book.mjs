@@ -93,12 +93,21 @@ export class XJZLArtBookData extends foundry.abstract.TypeDataModel {
    * 核心职责：
    * 1. 计算每个章节的阅读进度 (已读、阅读中、未读)。
    * 2. 汇总所有已读章节提供的技艺等级和检定加成。
+   * 3. 生成章节消耗与奖励的前缀和 (ledger)，
+   *    投入修为与角色卡直接读取 totalCost，不必再逐章累加。
    */
   prepareDerivedData() {
     let currentXP = this.xpInvested;
     let totalLevelReward = 0;
     let totalCheckReward = 0;
 
+    // 前缀和：ledger.cost[i] 为读完第 i 章 (含) 累计需要的修为，level / check 同理
+    // 与 data/xjzl_tools/artledger.py 输出的 build/artbooks/ledger.json 格式一致
+    const ledger = { cost: [], level: [], check: [] };
+    let sumCost = 0;
+    let sumLevel = 0;
+    let sumCheck = 0;
+
     // 遍历所有章节，计算进度和累积奖励
     for (const chapter of this.chapters) {
       // --- 计算实际消耗 ---
@@ -108,6 +117,13 @@ export class XJZLArtBookData extends foundry.abstract.TypeDataModel {
       // 这一章实际需要填的坑
       const chapterCost = Math.floor(rawCost * ratio);
 
+      sumCost += chapterCost;
+      sumLevel += (chapter.reward?.level || 0);
+      sumCheck += (chapter.reward?.check || 0);
+      ledger.cost.push(sumCost);
+      ledger.level.push(sumLevel);
+      ledger.check.push(sumCheck);
+
       // 进度条数据 (用于 UI 显示)
       chapter.progress = {
         current: 0,
@@ -147,5 +163,9 @@ export class XJZLArtBookData extends foundry.abstract.TypeDataModel {
     // 这样 Actor 就可以直接读取 item.system.totalLevelBonus
     this.totalLevelBonus = totalLevelReward;
     this.totalCheckBonus = totalCheckReward;
+
+    // 全书总消耗 (已应用折扣系数并逐章取整)
+    this.ledger = ledger;
+    this.totalCost = sumCost;
   }
 }
\ No newline at end of file
@@ -7,6 +7,37 @@
  * 3. 汇总当前生效的属性加成，供 Actor 调用
  */
 import { makeScriptEffectSchema } from "../common.mjs";
+
+// 各品阶的原始升级门槛 (累积投入量)，data/xjzl_tools/neigongtable.py 直接读取这里的数值
+// 人级: 0(领) -> 1000(小) -> 3000(圆)
+// 地级: 1000(领) -> 4000(小) -> 10000(圆)
+// 天级: 2000(领) -> 12000(小) -> 30000(圆)
+const BASE_THRESHOLDS = {
+  1: [0, 1000, 3000],
+  2: [1000, 4000, 10000],
+  3: [2000, 12000, 30000]
+};
+
+/**
+ * 按品阶与各阶段修炼消耗系数计算三个阶段的累积门槛
+ */
+function stageThresholds(tier, ratio1, ratio2, ratio3) {
+  // 原始门槛 (Standard)
+  const rawThresholds = BASE_THRESHOLDS[tier] ?? [0, 0, 0];
+
+  // 计算打折后的增量
+  const cost0 = rawThresholds[0] * ratio1;
+  const cost1 = (rawThresholds[1] - rawThresholds[0]) * ratio2;
+  const cost2 = (rawThresholds[2] - rawThresholds[1]) * ratio3;
+
+  // 重组门槛
+  return [
+    Math.floor(cost0),
+    Math.floor(cost0 + cost1),
+    Math.floor(cost0 + cost1 + cost2)
+  ];
+}
+
 export class XJZLNeigongData extends foundry.abstract.TypeDataModel {
 
   static defineSchema() {
@@ -109,32 +140,11 @@ export class XJZLNeigongData extends foundry.abstract.TypeDataModel {
    * 核心逻辑：xpInvested -> stage -> 提取对应的属性加成到内存中
    */
   prepareDerivedData() {
-    // 1. 定义升级门槛 (累积投入量)
-    // 规则参考：
-    // 人级: 0(领) -> 1000(小) -> 3000(圆)
-    // 地级: 1000(领) -> 4000(小) -> 10000(圆)
-    // 天级: 2000(领) -> 12000(小) -> 30000(圆)
-    // 原始门槛 (Standard)
-    let rawThresholds = [0, 0, 0];
-    if (this.tier === 1) rawThresholds = [0, 1000, 3000];
-    else if (this.tier === 2) rawThresholds = [1000, 4000, 10000];
-    else if (this.tier === 3) rawThresholds = [2000, 12000, 30000];
-
+    // 1. 升级门槛 (累积投入量，按品阶与各阶段的修炼消耗系数打折)
     const ratio1 = this.config.stage1?.xpCostRatio ?? 1; // 阶段1系数
     const ratio2 = this.config.stage2?.xpCostRatio ?? 1; // 阶段2系数
     const ratio3 = this.config.stage3?.xpCostRatio ?? 1; // 阶段3系数
-
-    // 计算打折后的增量
-    const cost0 = rawThresholds[0] * ratio1;
-    const cost1 = (rawThresholds[1] - rawThresholds[0]) * ratio2;
-    const cost2 = (rawThresholds[2] - rawThresholds[1]) * ratio3;
-
-    // 重组门槛
-    const thresholds = [
-      Math.floor(cost0),
-      Math.floor(cost0 + cost1),
-      Math.floor(cost0 + cost1 + cost2)
-    ];
+    const thresholds = stageThresholds(this.tier, ratio1, ratio2, ratio3);
 
     // 定义该内功的绝对上限 (圆满所需的值)
     const absoluteMax = thresholds[2];
@@ -4,12 +4,11 @@
 import { SCRIPT_TRIGGERS } from "../data/common.mjs";
 import { XJZLMacros } from "../utils/macros.mjs";
 import { xjzlSocket } from "../socket.mjs";
+import { compileScript } from "../utils/script-cache.mjs";
 
 // 尝试突破经脉花费固定为500
 const JINGMAI_ATTEMPT_COST = 500;
 
-// 将构造器缓存在模块作用域，避免每次 runScripts 重复创建
-const AsyncFunction = Object.getPrototypeOf(async function () { }).constructor;
 const renderTemplate = foundry.applications.handlebars.renderTemplate;
 export class XJZLActor extends Actor {
 
@@ -645,12 +644,12 @@ export class XJZLActor extends Actor {
         }
         sandbox.thisItem = thisItem;
         sandbox.thisEffect = thisEffect;
-        // 构建函数: new Function("变量名1", ..., "脚本内容")
+        // 构建函数: new Function("变量名1", ..., "脚本内容")，按参数列表与脚本内容缓存，只编译一次
         const paramNames = Object.keys(sandbox);
         const paramValues = Object.values(sandbox);
         // console.log(`[XJZL] 执行脚本 [${entry.label}]:`, entry.script);
         // 这里的 entry.script 就是用户填写的 JS 代码字符串
-        const fn = new Function(...paramNames, entry.script);
+        const fn = compileScript(entry.script, paramNames);
         fn(...paramValues);
       } catch (err) {
         console.error(`[XJZL] 同步脚本错误 [${entry.label}]:`, err);
@@ -693,7 +692,7 @@ export class XJZLActor extends Actor {
         const paramNames = Object.keys(sandbox);
         const paramValues = Object.values(sandbox);
         // console.log(`[XJZL] 执行脚本 [${entry.label}]:`, entry.script);
-        const fn = new AsyncFunction(...paramNames, entry.script);
+        const fn = compileScript(entry.script, paramNames, true);
         await fn(...paramValues);
       } catch (err) {
         console.error(`[XJZL] 异步脚本错误 [${entry.label}]:`, err);
@@ -1,6 +1,7 @@
 import { XJZL } from "../config.mjs";
 import { SCRIPT_TRIGGERS } from "../data/common.mjs";
 import { XJZLMacros } from "../utils/macros.mjs";
+import { compileScript } from "../utils/script-cache.mjs";
 const renderTemplate = foundry.applications.handlebars.renderTemplate;
 
 
@@ -132,12 +133,10 @@ export class XJZLItem extends Item {
     let scriptOutput = "";
     if (config.usageScript && config.usageScript.trim()) {
       try {
-        // 使用 AsyncFunction 构造器(异步支持)
-        const AsyncFunction = Object.getPrototypeOf(async function () { }).constructor;
         // 参数名列表
         const argNames = ["actor", "item", "game", "ui", "Macros"];
-        // 实例化
-        const fn = new AsyncFunction(...argNames, config.usageScript);
+        // 编译为 AsyncFunction (异步支持)，同一段脚本只编译一次
+        const fn = compileScript(config.usageScript, argNames, true);
         // 执行并等待
         const result = await fn(actor, this, game, ui, XJZLMacros);
         if (typeof result === "string") scriptOutput = result;// 允许脚本返回文本用于显示
@@ -771,13 +770,9 @@ export class XJZLItem extends Item {
     // === 1. 准备数据 ===
     // 技艺书没有固定的 maxXP 属性，它是所有章节消耗的总和
     // 这些数据都在 system 上，不需要像招式那样去数组里找
-    // 计算总消耗 (Max XP) 时，必须应用折扣系数
-    // 否则会导致溢出检查失效，允许玩家投入超过折后上限的修为
-    const totalCost = this.system.chapters.reduce((sum, c) => {
-      const rawCost = c.cost || 0;
-      const ratio = c.xpCostRatio ?? 1;
-      return sum + Math.floor(rawCost * ratio);
-    }, 0);
+    // 总消耗 (Max XP) 必须是折后的值，否则会导致溢出检查失效，允许玩家投入超过折后上限的修为
+    // DataModel 在 prepareDerivedData 中已按折扣系数计算好前缀和
+    const totalCost = this.system.totalCost;
     const currentInvested = this.system.xpInvested;
 
     if (currentInvested >= totalCost) {
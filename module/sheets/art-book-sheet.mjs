@@ -50,9 +50,10 @@ export class XJZLArtBookSheet extends HandlebarsApplicationMixin(ItemSheetV2) {
             arts: localizeConfig(XJZL.arts)
         };
 
-        // 可以在这里计算一些预览数据，例如总计需要多少修为
-        context.totalCost = context.system.chapters.reduce((sum, c) => sum + (c.cost || 0), 0);
-        context.totalLevelReward = context.system.chapters.reduce((sum, c) => sum + (c.reward?.level || 0), 0);
+        // 预览数据：总计需要多少修为 (折后) 与总奖励，直接取前缀和的最后一项
+        const ledger = this.document.system.ledger;
+        context.totalCost = this.document.system.totalCost;
+        context.totalLevelReward = ledger.level.at(-1) ?? 0;
 
         // 篇章描述列表 (使用 Promise.all 并行解析)
         if (context.system.chapters && context.system.chapters.length > 0) {
@@ -879,7 +879,7 @@ export class XJZLCharacterSheet extends HandlebarsApplicationMixin(ActorSheetV2)
         // -----------------------------------------------------
         const rawArtBooks = actor.itemTypes.art_book || [];
         context.artBooks = rawArtBooks.map(book => {
-            const maxXP = book.system.chapters.reduce((sum, c) => sum + Math.floor((c.cost || 0) * (c.xpCostRatio ?? 1)), 0);
+            const maxXP = book.system.totalCost;
             let completedCount = 0;
             if (book.system.chapters) {
                 for (const ch of book.system.chapters) if (ch.progress && ch.progress.isCompleted) completedCount++;
@@ -1830,13 +1830,8 @@ export class XJZLCharacterSheet extends HandlebarsApplicationMixin(ActorSheetV2)
         const item = this.document.items.get(target.dataset.itemId);
         if (!item) return;
 
-        // 计算总消耗 (Max XP)
-        // 必须应用折扣系数，并向下取整，逻辑需与 DataModel 和 investArt 方法保持完全一致
-        const totalCost = item.system.chapters.reduce((sum, c) => {
-            const cost = c.cost || 0;
-            const ratio = c.xpCostRatio ?? 1; // 获取系数，默认1
-            return sum + Math.floor(cost * ratio);
-        }, 0);
+        // 总消耗 (Max XP)：折后的值，由 DataModel 计算 (与 investArt 读取的是同一个值)
+        const totalCost = item.system.totalCost;
 
         const result = await this._promptInvest({
             title: `研读: ${item.name}`,
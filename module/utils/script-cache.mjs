@@ -0,0 +1,56 @@
+/* module/utils/script-cache.mjs */
+
+/**
+ * 嵌入脚本的编译缓存
+ * runScripts 每次触发 (包括每次数据准备时的 passive) 都要把脚本文本编译为函数，
+ * 这里按 "参数列表 + 脚本内容" 缓存编译结果，同一段脚本只编译一次。
+ * 脚本内容即缓存的 key (与 data/xjzl_tools/scriptcheck.py 脚本包中的内容 hash 一一对应)，
+ * 同步路径中无法计算 hash (crypto.subtle 是异步的)，直接使用字符串本身作为 Map 的 key。
+ * 编译失败的脚本同样缓存错误，避免每次数据准备都重新解析。
+ */
+const AsyncFunction = Object.getPrototypeOf(async function () { }).constructor;
+
+// 每种参数列表下最多缓存的脚本数，超出时清空 (世界中的脚本数量有限，只有反复编辑脚本才会增长)
+const MAX_ENTRIES = 5000;
+
+// { sync|async: Map<参数列表, Map<脚本内容, Function|Error>> }
+const CACHES = { sync: new Map(), async: new Map() };
+
+/**
+ * 取得编译好的脚本函数
+ * @param {String} source - 脚本内容 (函数体)
+ * @param {String[]} paramNames - 参数名列表 (沙盒变量名)
+ * @param {Boolean} [isAsync=false] - 是否编译为 AsyncFunction
+ * @returns {Function}
+ * @throws 脚本无法编译时抛出 (缓存的) SyntaxError
+ */
+export function compileScript(source, paramNames, isAsync = false) {
+  const cache = CACHES[isAsync ? "async" : "sync"];
+  const signature = paramNames.join(",");
+  let scripts = cache.get(signature);
+  if (!scripts) {
+    scripts = new Map();
+    cache.set(signature, scripts);
+  }
+
+  let fn = scripts.get(source);
+  if (fn === undefined) {
+    if (scripts.size >= MAX_ENTRIES) scripts.clear();
+    try {
+      fn = isAsync ? new AsyncFunction(...paramNames, source) : new Function(...paramNames, source);
+    } catch (err) {
+      fn = err;
+    }
+    scripts.set(source, fn);
+  }
+  if (fn instanceof Error) throw fn;
+  return fn;
+}
+
+/**
+ * 清空编译缓存 (调试用)
+ */
+export function clearScriptCache() {
+  CACHES.sync.clear();
+  CACHES.async.clear();
+}
@@ -0,0 +1,125 @@
+/* module/utils/seeding/apply-changeset.mjs */
+
+/**
+ * 变更集导入
+ * 由 data/xjzl_tools/packdiff.py 离线生成 (python -m xjzl_tools.packdiff)，
+ * build/ 不提交，发布时由 python -m xjzl_tools.release --base <上一版本> 打入安装包；
+ * 只创建 / 更新 / 删除两个版本之间真正变化的文档，不清空合集包。
+ */
+const CHANGESET_PATH = "systems/xjzl-system/build/changeset.json";
+
+/**
+ * 在合集包中定位文档：优先使用 _id，否则按 "文件夹/名称#序号" 匹配
+ */
+function findDocumentId(pack, index, op) {
+    if (op._id && index.has(op._id)) return op._id;
+    const folderId = op.folder ? pack.folders.find(f => f.name === op.folder)?.id ?? null : null;
+    const nth = Number(op.key?.split("#").pop()) || 1;
+    const matches = index.filter(d => d.name === op.name && (d.folder ?? null) === folderId);
+    return matches[nth - 1]?._id ?? null;
+}
+
+/**
+ * 为没有 id 的招式补齐 id：同名招式沿用旧 id，否则生成新的
+ */
+function fillMoveIds(moves, oldMoves = []) {
+    return moves.map(m => {
+        if (m.id) return m;
+        const old = oldMoves.find(o => o.name === m.name);
+        return { ...m, id: old?.id ?? foundry.utils.randomID() };
+    });
+}
+
+/**
+ * 同步嵌入特效 (与文档相同：有 _id 按 _id，否则按 "名称#序号")
+ */
+async function applyEffects(doc, ops) {
+    const findEffect = op => {
+        if (op._id && doc.effects.has(op._id)) return op._id;
+        const nth = Number(op.key?.split("#").pop()) || 1;
+        return doc.effects.filter(e => e.name === op.name)[nth - 1]?.id ?? null;
+    };
+
+    const deletes = (ops.delete ?? []).map(findEffect).filter(Boolean);
+    const updates = (ops.update ?? []).map(op => {
+        const { key, ...data } = op;
+        return { ...data, _id: findEffect(op) };
+    }).filter(u => u._id);
+
+    if (deletes.length) await doc.deleteEmbeddedDocuments("ActiveEffect", deletes);
+    if (updates.length) await doc.updateEmbeddedDocuments("ActiveEffect", updates);
+    if (ops.create?.length) await doc.createEmbeddedDocuments("ActiveEffect", ops.create, { keepId: true });
+}
+
+/**
+ * 核心导出函数：导入变更集
+ * @param {string} [filePath] 变更集路径，默认 build/changeset.json
+ */
+export async function applyChangeset(filePath = CHANGESET_PATH) {
+    // 1. 读取变更集
+    let changeset;
+    try {
+        const response = await fetch(filePath);
+        if (!response.ok) throw new Error(`无法读取文件 ${filePath}`);
+        changeset = await response.json();
+    } catch (err) {
+        console.error(`XJZL Seeder | 读取变更集失败: ${filePath}`, err);
+        return ui.notifications.error(`未找到变更集 ${filePath}，请先运行 python -m xjzl_tools.packdiff`);
+    }
+
+    let total = 0;
+    for (const [name, source] of Object.entries(changeset.packs)) {
+        if (!source.create.length && !source.update.length && !source.delete.length) continue;
+
+        // 2. 获取合集包
+        const packName = `xjzl-system.${name}`;
+        const pack = game.packs.get(packName);
+        if (!pack) {
+            ui.notifications.error(`错误：未找到合集包 ${packName}，请检查 system.json 并重启`);
+            continue;
+        }
+        const cls = getDocumentClass(source.type);
+        await pack.configure({ locked: false });
+        const index = await pack.getIndex();
+
+        // 3. 补齐新增的文件夹
+        const missing = source.folders.filter(f => !pack.folders.some(existing => existing.name === f.name));
+        if (missing.length) await Folder.createDocuments(missing, { pack: packName });
+        const folderId = folderName => folderName ? pack.folders.find(f => f.name === folderName)?.id ?? null : folderName;
+
+        // 4. 删除
+        const deletes = source.delete.map(op => findDocumentId(pack, index, op)).filter(Boolean);
+        if (deletes.length) await cls.deleteDocuments(deletes, { pack: packName });
+
+        // 5. 更新 (字段为扁平路径，嵌入特效逐个同步)
+        for (const op of source.update) {
+            const id = findDocumentId(pack, index, op);
+            if (!id) {
+                console.warn(`XJZL Seeder | 未找到要更新的文档: ${op.key}`);
+                continue;
+            }
+            const doc = await pack.getDocument(id);
+            const fields = { ...op.fields };
+            if ("folder" in fields) fields.folder = folderId(fields.folder);
+            if (fields["system.moves"]) fields["system.moves"] = fillMoveIds(fields["system.moves"], doc.system.moves);
+            if (Object.keys(fields).length) await doc.update(fields);
+            if (op.effects) await applyEffects(doc, op.effects);
+        }
+
+        // 6. 新建
+        const creates = source.create.map(d => {
+            const data = { ...d, folder: folderId(d.folder) };
+            if (data.system?.moves) data.system = { ...data.system, moves: fillMoveIds(data.system.moves) };
+            // 宏的作者只能在导入时确定
+            if (source.type === "Macro") data.author = game.user.id;
+            return data;
+        });
+        if (creates.length) await cls.createDocuments(creates, { pack: packName, keepId: true });
+
+        const count = source.create.length + source.update.length + source.delete.length;
+        total += count;
+        console.log(`XJZL Seeder | ${pack.metadata.label}: +${source.create.length} ~${source.update.length} -${source.delete.length}`);
+    }
+
+    ui.notifications.info(`XJZL | 变更集导入完成，共 ${total} 个操作 (${changeset.base} → ${changeset.head})。`);
+}
@@ -10,6 +10,8 @@ import { seedQizhen } from "./seed-qizhen.mjs";
 import { seedNeigong } from "./seed-neigong.mjs";
 import { seedWuxue } from "./seed-wuxue.mjs";
 import { seedMacros } from "./seed-macros.mjs";
+import { seedPrebuilt } from "./seed-prebuilt.mjs";
+import { applyChangeset } from "./apply-changeset.mjs";
 
 const { DialogV2 } = foundry.applications.api;
 
@@ -26,6 +28,12 @@ export const SeedingManager = {
     wuxue: seedWuxue,
     macros: seedMacros,
 
+    // 读取 data/xjzl_tools/packs.py 离线生成的数据，例如 game.xjzl.seed.prebuilt("wuxue")
+    prebuilt: seedPrebuilt,
+
+    // 增量导入 data/xjzl_tools/packdiff.py 生成的变更集，例如 game.xjzl.seed.changeset()
+    changeset: applyChangeset,
+
     /**
      * 一键生成所有 (全量重置)
      */
@@ -51,5 +59,24 @@ export const SeedingManager = {
             await this.macros();
             ui.notifications.info("XJZL | 全量种子数据生成完成。");
         }
+    },
+
+    /**
+     * 一键从预构建数据生成所有 (全量重置，但不在客户端转换原始 JSON)
+     */
+    allPrebuilt: async function () {
+        const confirm = await DialogV2.confirm({
+            window: { title: "全量重置合集包 (预构建)" },
+            content: "<p>这将清空所有系统预设合集包，并从 build/packs 中的预构建数据重新生成。确定吗？</p>",
+            rejectClose: false,
+            modal: true
+        });
+
+        if (confirm) {
+            for (const pack of game.system.packs) {
+                await this.prebuilt(pack.name);
+            }
+            ui.notifications.info("XJZL | 预构建数据导入完成。");
+        }
     }
 };
\ No newline at end of file
@@ -100,6 +100,7 @@ export async function seedArmor() {
         // 通常防具的特效是 transfer: true (被动)。
         // 你的 XJZLActiveEffect 类会自动处理 "未装备时抑制" 的逻辑，所以这里放心设为 true。
         const effects = d.effects ? d.effects.map(e => ({
+            _id: e._id,
             name: e.name,
             icon: e.icon || d.img, // 如果没配图标，默认用物品图标
             // 防具通常是被动传输，除非是主动使用的技能
@@ -124,6 +125,7 @@ export async function seedArmor() {
         const itemScripts = d.system.scripts || [];
 
         items.push({
+            _id: d._id,
             name: d.name,
             type: "armor", // 固定类型
             img: d.img,
@@ -150,7 +152,7 @@ export async function seedArmor() {
     // 6. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 个防具...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 个防具！`);
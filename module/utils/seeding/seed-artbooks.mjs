@@ -78,6 +78,7 @@ export async function seedArtBooks() {
 
     // 5. 构建 Item 数组
     const items = bookData.map(d => ({
+        _id: d._id,
         name: d.name,
         type: "art_book",
         img: d.img,
@@ -88,7 +89,7 @@ export async function seedArtBooks() {
     // 6. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 本技艺书籍...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 本技艺书籍！`);
@@ -73,6 +73,7 @@ export async function seedConsumables() {
     for (const d of consumablesData) {
         // 准备 AE 数据
         const effects = d.effects ? d.effects.map(e => ({
+            _id: e._id,
             name: e.name,
             icon: e.icon,
             transfer: e.transfer ?? false, // 消耗品通常为 false
@@ -89,6 +90,7 @@ export async function seedConsumables() {
         })) : [];
 
         items.push({
+            _id: d._id,
             name: d.name,
             type: d.type,
             img: d.img,
@@ -110,7 +112,7 @@ export async function seedConsumables() {
     // 6. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 个物品...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 个消耗品！`);
@@ -78,6 +78,7 @@ export async function seedMacros() {
 
     // 5. 构建数据
     const macrosToCreate = macrosData.map(d => ({
+        _id: d._id,
         name: d.name,
         type: d.type || "script",
         img: d.img || "icons/svg/dice-target.svg",
@@ -90,7 +91,7 @@ export async function seedMacros() {
 
     // 6. 写入
     if (macrosToCreate.length > 0) {
-        await Macro.createDocuments(macrosToCreate, { pack: PACK_NAME, keepId: false });
+        await Macro.createDocuments(macrosToCreate, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${macrosToCreate.length} 个宏指令！`);
@@ -45,6 +45,7 @@ export async function seedMisc() {
 
     // 4. 构建 Item 数组
     const items = miscData.map(d => ({
+        _id: d._id,
         name: d.name,
         type: "misc", // 对应 system.json documentTypes 中的 misc
         img: d.img || "icons/svg/item-bag.svg",
@@ -60,7 +61,7 @@ export async function seedMisc() {
     // 5. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 个杂物...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 个杂物！`);
@@ -142,6 +142,7 @@ export async function seedNeigong() {
         // 内功通常不需要 Active Effects 来处理被动属性（因为 DataModel 会自动计算 system.current.stats）
         // 但如果有特殊效果（如持续性 Buff 模板），依然可以保留
         const effects = d.effects ? d.effects.map(e => ({
+            _id: e._id,
             name: e.name,
             icon: e.icon || d.img,
             transfer: e.transfer ?? false, // 内功特效通常不直接 transfer，而是通过脚本调用
@@ -159,6 +160,7 @@ export async function seedNeigong() {
         })) : [];
 
         items.push({
+            _id: d._id,
             name: d.name,
             type: "neigong",
             img: d.img,
@@ -196,7 +198,7 @@ export async function seedNeigong() {
     // 5. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 个内功...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 个内功！`);
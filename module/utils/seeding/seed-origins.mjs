@@ -47,6 +47,7 @@ export async function seedOrigins() {
     // --- 工厂逻辑：性格 ---
     for (const d of personalityData) {
         items.push({
+            _id: d._id,
             name: d.name,
             type: "personality",
             img: ICONS.personality,
@@ -59,7 +60,7 @@ export async function seedOrigins() {
                 presetKey: d.id // 依然保留 presetKey 用于逻辑识别
             }
             // 删除了 flags.core.sourceId
-            // 让 Foundry 自动生成 ID，不要手动指定不合法的 ID
+            // 数据中没有 _id 时由 Foundry 自动生成
         });
     }
 
@@ -80,6 +81,7 @@ export async function seedOrigins() {
         }
 
         items.push({
+            _id: d._id,
             name: d.name,
             type: "background",
             img: ICONS.background,
@@ -96,8 +98,8 @@ export async function seedOrigins() {
     // 6. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 个物品...`);
-        // 使用 keepId: false 确保生成全新的合法 ID
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        // 使用 keepId: true 保留数据中的稳定 ID，重复导入时 ID 不变
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 个物品！`);
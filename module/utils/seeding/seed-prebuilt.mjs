@@ -0,0 +1,68 @@
+/* module/utils/seeding/seed-prebuilt.mjs */
+
+/**
+ * 预构建数据目录
+ * 由 data/xjzl_tools/packs.py 离线生成 (python -m xjzl_tools.packs)，
+ * build/ 不提交，发布时由 python -m xjzl_tools.release 打入安装包；
+ * 文档已经过与 seed-*.mjs 相同的转换，这里只负责写入合集包。
+ */
+const BUILD_PATH = "systems/xjzl-system/build/packs";
+
+/**
+ * 核心导出函数：从预构建文件生成合集包
+ * @param {string} name 合集包名称 (system.json 中的 name，如 "wuxue")
+ */
+export async function seedPrebuilt(name) {
+    const packName = `xjzl-system.${name}`;
+    const filePath = `${BUILD_PATH}/${name}.json`;
+
+    // 1. 读取预构建数据
+    let source;
+    try {
+        const response = await fetch(filePath);
+        if (!response.ok) throw new Error(`无法读取文件 ${filePath}`);
+        source = await response.json();
+    } catch (err) {
+        console.error(`XJZL Seeder | 读取预构建数据失败: ${filePath}`, err);
+        return ui.notifications.error(`未找到预构建数据 ${filePath}，请先运行 python -m xjzl_tools.packs`);
+    }
+
+    // 2. 获取合集包
+    const pack = game.packs.get(packName);
+    if (!pack) return ui.notifications.error(`错误：未找到合集包 ${packName}，请检查 system.json 并重启`);
+
+    const cls = getDocumentClass(source.type);
+
+    // 3. 解锁并清理旧数据
+    await pack.configure({ locked: false });
+    const index = await pack.getIndex();
+    if (index.size > 0) {
+        console.log(`XJZL Seeder | 清理旧数据 (${index.size}条)...`);
+        await cls.deleteDocuments(index.map(d => d._id), { pack: packName });
+    }
+    if (pack.folders.size > 0) {
+        await Folder.deleteDocuments(pack.folders.map(f => f.id), { pack: packName });
+    }
+
+    // 4. 创建文件夹 (预构建数据中的 folder 字段为文件夹名称)
+    const folders = {};
+    if (source.folders.length > 0) {
+        const created = await Folder.createDocuments(source.folders, { pack: packName });
+        source.folders.forEach((f, i) => folders[f.name] = created[i].id);
+    }
+
+    // 5. 批量写入
+    const documents = source.documents.map(d => {
+        const data = { ...d, folder: d.folder ? folders[d.folder] : d.folder };
+        // 宏的作者只能在导入时确定
+        if (source.type === "Macro") data.author = game.user.id;
+        return data;
+    });
+
+    if (documents.length > 0) {
+        console.log(`XJZL Seeder | 正在写入 ${documents.length} 个预构建文档...`);
+        await cls.createDocuments(documents, { pack: packName, keepId: true });
+    }
+
+    ui.notifications.info(`XJZL | 成功从预构建数据生成 ${documents.length} 个文档 (${pack.metadata.label})！`);
+}
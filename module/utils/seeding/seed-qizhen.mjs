@@ -105,6 +105,7 @@ export async function seedQizhen() {
 
         // 3. 处理 Active Effects
         const effects = d.effects ? d.effects.map(e => ({
+            _id: e._id,
             name: e.name,
             icon: e.icon || d.img,
             transfer: e.transfer ?? true, // 奇珍默认为被动传输
@@ -126,6 +127,7 @@ export async function seedQizhen() {
 
         // 5. 构建 Item 对象
         itemsToCreate.push({
+            _id: d._id,
             name: d.name,
             type: "qizhen",
             img: d.img,
@@ -155,7 +157,7 @@ export async function seedQizhen() {
     // =====================================================
     if (itemsToCreate.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${itemsToCreate.length} 个奇珍...`);
-        await Item.createDocuments(itemsToCreate, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(itemsToCreate, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${itemsToCreate.length} 个奇珍！(来源: qizhen.json)`);
@@ -98,6 +98,7 @@ export async function seedWeapons() {
         // --- 5.1 处理 Active Effects ---
         // 兵器的 AE 通常用于：被动属性加成(装备生效)、特殊状态(中毒/发光等)
         const effects = d.effects ? d.effects.map(e => ({
+            _id: e._id,
             name: e.name,
             icon: e.icon || d.img,
             // 兵器特效通常随装备生效 (transfer: true)
@@ -123,6 +124,7 @@ export async function seedWeapons() {
         const itemScripts = d.system.scripts || [];
 
         items.push({
+            _id: d._id,
             name: d.name,
             type: "weapon", // 固定类型
             img: d.img,
@@ -156,7 +158,7 @@ export async function seedWeapons() {
     // 6. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 把神兵利器...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 把兵器！`);
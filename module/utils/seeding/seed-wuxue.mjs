@@ -111,7 +111,7 @@ const processMoves = (rawMoves, bookReqs = "", defaultTier = null) => {
 
         // 1. 基础数据
         const moveData = {
-            id: m.id || foundry.utils.randomID(),
+            id: m.id || foundry.utils.randomID(), // 稳定 ID 由 stable_ids 写入，这里只为新招式兜底
             name: m.name || "新招式",
             img: m.img || "icons/svg/sword.svg",
             type: m.type || "real", // real, feint, qi, stance, counter
@@ -321,6 +321,7 @@ export async function seedWuxue() {
             // ================================================
             // 基础结构
             const effectData = {
+                _id: e._id,
                 name: e.name,
                 icon: d.img, // 如果特效没配图标，默认用物品图标，暂时使用物品图标吧，AI会给特效配上不存在的图标 e.icon
                 transfer: e.transfer ?? false,
@@ -354,6 +355,7 @@ export async function seedWuxue() {
         })) : [];
 
         items.push({
+            _id: d._id, // 稳定 ID，由 python -m xjzl_tools.run stable_ids 写入数据文件，没有时由 Foundry 生成
             name: d.name,
             type: "wuxue",
             img: d.img,
@@ -381,7 +383,7 @@ export async function seedWuxue() {
     // 5. 批量写入
     if (items.length > 0) {
         console.log(`XJZL Seeder | 正在写入 ${items.length} 个武学...`);
-        await Item.createDocuments(items, { pack: PACK_NAME, keepId: false });
+        await Item.createDocuments(items, { pack: PACK_NAME, keepId: true });
     }
 
     ui.notifications.info(`XJZL | 成功生成 ${items.length} 个武学！`);